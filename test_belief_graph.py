@@ -0,0 +1,96 @@
+"""Test that bulk belief updates match one-at-a-time updates"""
+import random
+
+from world_engine.epistemic.belief_graph import BeliefGraph
+from world_engine.epistemic.information_artifacts import (
+    ArtifactType,
+    InformationArtifactStore,
+    ReliabilityLevel
+)
+
+
+def _seeded_graph(store, artifacts):
+    """Graph where char_a believes every artifact, with varied confidence"""
+    graph = BeliefGraph()
+    for n, artifact in enumerate(artifacts):
+        graph.form_belief(
+            "char_a",
+            artifact,
+            current_tick=0,
+            trust_in_source=(n % 5) / 4,
+            base_skepticism=(n % 3) / 4
+        )
+    return graph
+
+
+def _snapshot(graph, artifact_ids):
+    """Every observable field of char_a's beliefs"""
+    rows = []
+    for artifact_id in artifact_ids:
+        b = graph.get_belief("char_a", artifact_id)
+        rows.append((
+            artifact_id, b.confidence, b.belief_state, b.times_reinforced,
+            b.times_challenged, b.last_updated_tick, list(b.based_on)
+        ))
+    strongest = {
+        subject: getattr(graph.get_strongest_belief("char_a", subject), "artifact_id", None)
+        for subject in ("s0", "s1", "s2")
+    }
+    return rows, strongest, sorted(graph.get_belief_ids_above("char_a", 0.5)), graph.version
+
+
+def test_update_beliefs_bulk_matches_update_belief():
+    """Repeated and unknown IDs, reinforcing and challenging, over many rounds"""
+    store = InformationArtifactStore()
+    artifacts = [
+        store.create_artifact(
+            tick=0,
+            artifact_type=ArtifactType.REPORT,
+            subject=f"s{n % 3}",
+            claim=f"claim {n}",
+            data={"n": n},
+            source="someone",
+            reliability=ReliabilityLevel(n % 6)
+        )
+        for n in range(12)
+    ]
+    artifact_ids = [a.artifact_id for a in artifacts]
+    evidence = artifacts[0]
+    
+    bulk = _seeded_graph(store, artifacts)
+    single = _seeded_graph(store, artifacts)
+    
+    rng = random.Random(7)
+    for tick in range(1, 60):
+        # Repeats on purpose - the same belief can move several times in one call
+        ids = [rng.choice(artifact_ids) for _ in range(rng.randint(1, 20))]
+        ids.append("artifact_unknown")
+        reinforces = rng.random() < 0.6
+        
+        updated = bulk.update_beliefs_bulk("char_a", ids, evidence, tick, reinforces=reinforces)
+        expected = [
+            single.update_belief("char_a", artifact_id, evidence, tick, reinforces=reinforces)
+            for artifact_id in ids
+        ]
+        
+        assert [b.artifact_id for b in updated] == [
+            b.artifact_id for b in expected if b is not None
+        ]
+        assert _snapshot(bulk, artifact_ids) == _snapshot(single, artifact_ids)
+
+
+def test_update_beliefs_bulk_unknown_character():
+    """No beliefs to update - nothing happens"""
+    store = InformationArtifactStore()
+    artifact = store.create_artifact(
+        tick=0,
+        artifact_type=ArtifactType.RUMOR,
+        subject="s0",
+        claim="claim",
+        data={},
+        source="someone",
+        reliability=ReliabilityLevel.UNCERTAIN
+    )
+    graph = BeliefGraph()
+    assert graph.update_beliefs_bulk("nobody", [artifact.artifact_id], artifact, 1) == []
+    assert graph.version == 0
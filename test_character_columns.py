@@ -0,0 +1,70 @@
+"""Test that the ready_ids cooldown heap matches a full column scan"""
+import random
+
+import numpy as np
+
+from world_engine.core.character_columns import STATE_CODES, CharacterColumns
+from world_engine.entities.character import CharacterState
+
+BUSY = (CharacterState.TRAVELING, CharacterState.IN_CONVERSATION)
+
+
+def _ready_ids_by_mask(cols, tick, min_wait_ticks):
+    """The original every-row implementation"""
+    n = len(cols.ids)
+    mask = (
+        cols.is_active[:n]
+        & ~np.isin(cols.state[:n], [STATE_CODES[s] for s in BUSY])
+        & (tick - cols.last_action_tick[:n] >= min_wait_ticks)
+    )
+    return [cols.ids[i] for i in np.flatnonzero(mask)]
+
+
+def test_ready_ids_matches_mask():
+    """Random upserts, tick rewrites (also backwards), clears and wait changes"""
+    rng = random.Random(3)
+    states = list(CharacterState)
+    cols = CharacterColumns()
+    last_action = {}
+    min_wait = 10
+    
+    for tick in range(3000):
+        if tick % 700 == 699:
+            cols.clear()
+            last_action.clear()
+        if tick % 250 == 0:
+            min_wait = rng.choice([0, 5, 7, 10, 25])
+        
+        for _ in range(rng.randint(0, 4)):
+            char_id = f"char_{rng.randrange(120)}"
+            lat = last_action.get(char_id, 0)
+            roll = rng.random()
+            if roll < 0.4:
+                lat = tick                              # Just acted
+            elif roll < 0.5:
+                lat = max(0, lat - rng.randint(1, 30))  # Rewritten into the past
+            elif roll < 0.55:
+                lat = tick + rng.randint(1, 15)         # Scheduled ahead
+            last_action[char_id] = lat
+            cols.upsert(
+                char_id,
+                "loc",
+                rng.random() < 0.9,
+                rng.choice(states),
+                lat
+            )
+        
+        assert cols.ready_ids(tick, min_wait, BUSY) == _ready_ids_by_mask(cols, tick, min_wait), tick
+
+
+def test_ready_ids_after_state_change_only():
+    """A busy character becomes ready again without its tick changing"""
+    cols = CharacterColumns()
+    cols.upsert("char_a", "loc", True, CharacterState.TRAVELING, 0)
+    assert cols.ready_ids(20, 10, BUSY) == []
+    
+    cols.upsert("char_a", "loc", True, CharacterState.IDLE, 0)
+    assert cols.ready_ids(21, 10, BUSY) == ["char_a"]
+    
+    cols.upsert("char_a", "loc", False, CharacterState.IDLE, 0)
+    assert cols.ready_ids(22, 10, BUSY) == []
@@ -0,0 +1,75 @@
+"""Test that due events run concurrently without reordering shared participants"""
+import asyncio
+
+from world_engine.core.event_queue import EventQueue
+from world_engine.entities.event import Event, EventType
+
+
+def _event(n, participants, tick=0):
+    return Event(
+        id=f"evt_{n}",
+        type=EventType.CHARACTER_ACTION,
+        scheduled_tick=tick,
+        location_id="loc",
+        participants=participants,
+        title=f"evt_{n}",
+        description=""
+    )
+
+
+def test_chains_split_on_shared_participants():
+    """Events sharing a character land in one chain, in scheduling order"""
+    events = [
+        _event(0, ["a"]),
+        _event(1, ["b"]),
+        _event(2, []),
+        _event(3, ["c"]),
+        _event(4, ["a", "c"]),  # Links the a and c chains
+        _event(5, ["b"]),
+    ]
+    chains = EventQueue._participant_chains(events)
+    assert [[e.id for e in chain] for chain in chains] == [
+        ["evt_0", "evt_3", "evt_4"],
+        ["evt_1", "evt_5"],
+        ["evt_2"],
+    ]
+
+
+def test_due_events_keep_per_character_order():
+    """Chains interleave, but each character's events run in order"""
+    queue = EventQueue()
+    for n, participants in enumerate([["a"], ["b"], ["a"], ["b"], ["c"]]):
+        queue.schedule(_event(n, participants))
+    
+    ran = []
+    
+    async def executor(event):
+        await asyncio.sleep(0)  # Let other chains run in between
+        ran.append(event.id)
+    
+    processed = asyncio.run(queue.process_due_events(0, executor=executor))
+    
+    assert [e.id for e in processed] == [f"evt_{n}" for n in range(5)]
+    assert [i for i in ran if i in ("evt_0", "evt_2")] == ["evt_0", "evt_2"]
+    assert [i for i in ran if i in ("evt_1", "evt_3")] == ["evt_1", "evt_3"]
+    # c's chain didn't wait behind a's second event
+    assert ran.index("evt_4") < ran.index("evt_2")
+
+
+def test_failed_event_only_cancels_itself():
+    """A failing executor cancels that event; the rest of its chain still runs"""
+    queue = EventQueue()
+    for n in range(3):
+        queue.schedule(_event(n, ["a"]))
+    
+    ran = []
+    
+    async def executor(event):
+        if event.id == "evt_1":
+            raise RuntimeError("boom")
+        ran.append(event.id)
+    
+    processed = asyncio.run(queue.process_due_events(0, executor=executor))
+    
+    assert ran == ["evt_0", "evt_2"]
+    assert processed[1].status.value == "cancelled"
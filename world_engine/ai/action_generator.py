@@ -3,7 +3,7 @@ Action Generator - Decides what characters do autonomously
 """
 import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import sys
 from pathlib import Path
 
@@ -45,6 +45,81 @@ class ActionGenerator:
         Returns:
             Action decision dict or None if character shouldn't act yet
         """
+        prompt = self._prepare_decision(character, world_state, current_tick)
+        if prompt is None:
+            return None
+        
+        try:
+            # Call LLM
+            logger.info(f"🤔 {character.id} is deciding what to do...")
+            response = await self.llm.ainvoke(prompt)
+            
+            return self._finish_decision(character, response.content)
+            
+        except Exception as e:
+            logger.error(f"Error generating action for {character.id}: {e}")
+            return None
+    
+    async def decide_actions(
+        self,
+        characters: List[WorldCharacter],
+        world_state,
+        current_tick: int,
+        max_concurrency: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Decide actions for several characters with one batched LLM call.
+        
+        Args:
+            characters: Characters making a decision
+            world_state: Current world state
+            current_tick: Current simulation tick
+            max_concurrency: Cap on requests the batch keeps in flight
+            
+        Returns:
+            One action dict (or None) per character, in input order
+        """
+        # A failure for one character (here or when parsing below) only
+        # drops that character's decision, as with a failed LLM request
+        prompts: List[Optional[str]] = []
+        for character in characters:
+            try:
+                prompts.append(self._prepare_decision(character, world_state, current_tick))
+            except Exception as e:
+                logger.error(f"Error generating action for {character.id}: {e}")
+                prompts.append(None)
+        
+        batch = [i for i, prompt in enumerate(prompts) if prompt is not None]
+        actions: List[Optional[Dict[str, Any]]] = [None] * len(characters)
+        if not batch:
+            return actions
+        
+        logger.info(f"🤔 {len(batch)} characters are deciding what to do...")
+        responses = await self.llm.abatch(
+            [prompts[i] for i in batch],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True
+        )
+        
+        for i, response in zip(batch, responses):
+            character = characters[i]
+            if isinstance(response, Exception):
+                logger.error(f"Error generating action for {character.id}: {response}")
+                continue
+            try:
+                actions[i] = self._finish_decision(character, response.content)
+            except Exception as e:
+                logger.error(f"Error generating action for {character.id}: {e}")
+        
+        return actions
+    
+    def _prepare_decision(
+        self,
+        character: WorldCharacter,
+        world_state,
+        current_tick: int
+    ) -> Optional[str]:
+        """Decision prompt for a character, or None if they shouldn't act yet"""
         # Check if character acted recently
         ticks_since_last = current_tick - character.last_action_tick
         
@@ -56,29 +131,25 @@ class ActionGenerator:
         context = self._gather_context(character, world_state, current_tick)
         
         # Build prompt
-        prompt = self._build_decision_prompt(context)
+        return self._build_decision_prompt(context)
+    
+    def _finish_decision(
+        self,
+        character: WorldCharacter,
+        response: str
+    ) -> Optional[Dict[str, Any]]:
+        """Parse and record a decision from the LLM's reply"""
+        action = self._parse_action_response(response)
         
-        try:
-            # Call LLM
-            logger.info(f"🤔 {character.id} is deciding what to do...")
-            response = await self.llm.ainvoke(prompt)
-            
-            # Parse response
-            action = self._parse_action_response(response.content)
-            
-            if action:
-                logger.info(
-                    f"  ✓ Decided: {action['action_type']} - {action['reasoning']}"
-                )
-                
-                # Track action
-                self._track_action(character.id, action['action_type'])
-                
-                return action
+        if action:
+            logger.info(
+                f"  ✓ Decided: {action['action_type']} - {action['reasoning']}"
+            )
             
-        except Exception as e:
-            logger.error(f"Error generating action for {character.id}: {e}")
-            return None
+            # Track action
+            self._track_action(character.id, action['action_type'])
+        
+        return action
     
     def _gather_context(
         self,
@@ -98,7 +169,7 @@ class ActionGenerator:
         connected = world_state.get_connected_locations(character.location_id)
         
         # Load character's psychological profile if not loaded
-        if not character.profile:
+        if not character.has_profile:
             # For now, use placeholder - we'll integrate full profile loading later
             motivational = {
                 'belonging': 50,
@@ -347,7 +418,7 @@ class ActionGenerator:
         
         # ✅ NEW: Get nearby characters based on character's BELIEFS
         nearby = []
-        for other_char in world_state.get_active_characters():
+        for other_char in world_state.get_active_characters_cached(current_tick):
             if other_char.id == character.id:
                 continue
             
@@ -363,16 +434,16 @@ class ActionGenerator:
                 nearby.append(other_char)
         
         # ✅ NEW: Get character's beliefs about this location
-        location_beliefs = world_state.belief_graph.get_all_beliefs(
+        location_beliefs = world_state.belief_graph.get_belief_ids_above(
             character.id,
-            min_confidence=0.5  # Only confident beliefs
+            threshold=0.5  # Only confident beliefs
         )
         
         # Get connected locations
         connected = world_state.get_connected_locations(character.location_id)
         
         # Get motivational state
-        if not character.profile:
+        if not character.has_profile:
             motivational = {
                 'belonging': 50,
                 'autonomy': 50,
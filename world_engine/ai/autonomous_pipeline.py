@@ -3,7 +3,7 @@ Autonomous Pipeline - Simplified version of LangGraph for autonomous decisions
 This is a lightweight adapter until we fully integrate the existing pipeline
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from .action_generator import ActionGenerator
 
@@ -56,4 +56,35 @@ class AutonomousPipeline:
             
         except Exception as e:
             logger.error(f"Error processing character {character.id}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    async def process_batch(
+        self,
+        characters: List,
+        world_state,
+        current_tick: int,
+        max_concurrency: Optional[int] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Process several characters' turns with one batched LLM call.
+        
+        Args:
+            characters: WorldCharacter instances
+            world_state: WorldState instance
+            current_tick: Current simulation tick
+            max_concurrency: Cap on LLM requests in flight
+            
+        Returns:
+            One action decision (or None) per character, in input order
+        """
+        try:
+            return await self.action_generator.decide_actions(
+                characters,
+                world_state,
+                current_tick,
+                max_concurrency=max_concurrency
+            )
+            
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(characters)} characters: {e}")
+            return [None] * len(characters)
\ No newline at end of file
@@ -105,8 +105,7 @@ class NarrativeDirector:
             # 1. Update Tension based on world state
             active_events = [
                 {"id": e.id, "type": e.type.name.lower()} 
-                for e in world_state.events.values() 
-                if e.status.name == "ACTIVE"
+                for e in world_state.get_active_events()
             ]
             self.tension_manager.update_tension(current_tick, active_events, world_state)
             
@@ -211,7 +210,7 @@ class NarrativeDirector:
                 # Spread to them
                 for hearer in potential_hearers:
                     if random.random() < spread_chance:
-                        artifact.known_by.add(hearer)
+                        world_state.artifact_store.share_artifact(artifact.artifact_id, hearer)
                         logger.info(f"🗣️ Rumor spread to {hearer}: {artifact.claim}")
 
     # ==================== OBSERVATION & ANALYSIS ====================
@@ -9,7 +9,7 @@ Identifies opportunities for compelling narratives based on:
 """
 import logging
 from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ class DramaType(str, Enum):
     DISCOVERY = "discovery"              # New information changes everything
 
 
-@dataclass
+@dataclass(slots=True)
 class DramaticOpportunity:
     """A situation with narrative potential"""
     drama_type: DramaType
@@ -49,6 +49,9 @@ class DramaticOpportunity:
     # Potential catalysts
     suggested_catalysts: List[Dict[str, Any]]
     
+    # Derived in __post_init__
+    score: float = field(init=False, default=0.0)
+    
     def __post_init__(self):
         self.score = self._calculate_score()
     
@@ -202,8 +205,9 @@ class DramaAnalyzer:
                 continue
             
             # Check all pairs at this location
-            for i, char_a in enumerate(location.occupants):
-                for char_b in location.occupants[i+1:]:
+            occupants = sorted(location.occupants)
+            for i, char_a in enumerate(occupants):
+                for char_b in occupants[i+1:]:
                     # Get relationship strength
                     relationship = self._get_relationship_data(
                         char_a, char_b, world_state
@@ -302,12 +306,13 @@ class DramaAnalyzer:
             if len(location.occupants) < 2:
                 continue
             
-            for i, char_a in enumerate(location.occupants):
+            occupants = sorted(location.occupants)
+            for i, char_a in enumerate(occupants):
                 char_a_obj = world_state.get_character(char_a)
                 if not char_a_obj:
                     continue
                 
-                for char_b in location.occupants[i+1:]:
+                for char_b in occupants[i+1:]:
                     char_b_obj = world_state.get_character(char_b)
                     if not char_b_obj:
                         continue
@@ -349,46 +354,45 @@ class DramaAnalyzer:
         opportunities = []
         
         # Look for characters with strong belief connections but separated
-        for char_id, beliefs in world_state.belief_graph.beliefs.items():
-            for artifact_id, belief in beliefs.items():
-                # Find what/who this belief is about
-                artifact = world_state.artifact_store.artifacts.get(artifact_id)
-                if not artifact:
-                    continue
+        for (char_id, artifact_id), belief in world_state.belief_graph.beliefs.items():
+            # Find what/who this belief is about
+            artifact = world_state.artifact_store.artifacts.get(artifact_id)
+            if not artifact:
+                continue
+            
+            # If it's about another character and belief is strong
+            if belief.confidence > 0.7:
+                subject = artifact.subject
                 
-                # If it's about another character and belief is strong
-                if belief.confidence > 0.7:
-                    subject = artifact.subject
+                if subject in world_state.characters:
+                    # Are they at different locations?
+                    char_loc = world_state.get_character_objective_location(char_id)
+                    subject_loc = world_state.get_character_objective_location(subject)
                     
-                    if subject in world_state.characters:
-                        # Are they at different locations?
-                        char_loc = world_state.get_character_objective_location(char_id)
-                        subject_loc = world_state.get_character_objective_location(subject)
-                        
-                        if char_loc and subject_loc and char_loc != subject_loc:
-                            opportunities.append(DramaticOpportunity(
-                                drama_type=DramaType.SUSPENSE,
-                                intensity=0.5,
-                                urgency=0.4,
-                                characters_involved=[char_id, subject],
-                                location_id=char_loc,
-                                situation=f"{char_id} seeks {subject} but they're apart",
-                                dramatic_question="When will they meet?",
-                                belief_data={
-                                    "seeker": char_id,
-                                    "sought": subject,
-                                    "seeker_loc": char_loc,
-                                    "sought_loc": subject_loc
-                                },
-                                relationship_data={},
-                                suggested_catalysts=[
-                                    {
-                                        "type": "convergence_event",
-                                        "description": "Event brings them to same location"
-                                    }
-                                ]
-                            ))
-        
+                    if char_loc and subject_loc and char_loc != subject_loc:
+                        opportunities.append(DramaticOpportunity(
+                            drama_type=DramaType.SUSPENSE,
+                            intensity=0.5,
+                            urgency=0.4,
+                            characters_involved=[char_id, subject],
+                            location_id=char_loc,
+                            situation=f"{char_id} seeks {subject} but they're apart",
+                            dramatic_question="When will they meet?",
+                            belief_data={
+                                "seeker": char_id,
+                                "sought": subject,
+                                "seeker_loc": char_loc,
+                                "sought_loc": subject_loc
+                            },
+                            relationship_data={},
+                            suggested_catalysts=[
+                                {
+                                    "type": "convergence_event",
+                                    "description": "Event brings them to same location"
+                                }
+                            ]
+                        ))
+    
         return opportunities
     
     # ==================== Helper Methods ====================
@@ -443,7 +447,7 @@ class DramaAnalyzer:
     ) -> Dict[str, Any]:
         """Get relationship data between two characters"""
         char_a_obj = world_state.get_character(char_a)
-        if not char_a_obj or not char_a_obj.profile:
+        if not char_a_obj or not char_a_obj.has_profile:
             return {}
         
         relationships = getattr(char_a_obj.profile, 'relationships', {})
@@ -25,7 +25,7 @@ class ArcStatus(str, Enum):
     ABANDONED = "abandoned"
 
 
-@dataclass
+@dataclass(slots=True)
 class StoryArc:
     """A narrative thread spanning multiple ticks"""
     arc_id: str
@@ -48,7 +48,7 @@ class StoryArc:
             "type": beat_type
         })
         self.last_update_tick = tick
-        logger.info(f"📖 Arc '{self.title}': {description}")
+        logger.info("📖 Arc '%s': %s", self.title, description)
     
     def advance_status(self, new_status: ArcStatus):
         """Move arc to next phase"""
@@ -63,13 +63,17 @@ class StoryArc:
             ArcStatus.COMPLETE: 1.0
         }
         self.completion_percent = status_completion.get(new_status, 0.0)
-        logger.info(f"📖 Arc '{self.title}': {old_status.value} → {new_status.value}")
+        logger.info(
+            "📖 Arc '%s': %s → %s", self.title, old_status.value, new_status.value
+        )
 
 
 class StoryArcTracker:
     """Tracks ongoing narrative arcs across the simulation"""
     
     def __init__(self):
+        # Kept in last_update_tick order (oldest first): updated arcs are
+        # moved to the end, so stale arcs are always at the front.
         self.active_arcs: Dict[str, StoryArc] = {}
         self.completed_arcs: List[StoryArc] = []
         self.next_arc_id = 0
@@ -114,6 +118,10 @@ class StoryArcTracker:
             return
         
         arc.add_beat(current_tick, beat_description, beat_type)
+        
+        # Move to the end to keep active_arcs ordered by last update
+        self.active_arcs[arc_id] = self.active_arcs.pop(arc_id)
+        
         self._check_progression(arc, current_tick)
     
     def _check_progression(self, arc: StoryArc, current_tick: int):
@@ -165,10 +173,15 @@ class StoryArcTracker:
         stale_threshold: int = 50
     ) -> List[StoryArc]:
         """Get arcs that haven't been updated recently"""
-        return [
-            arc for arc in self.active_arcs.values()
-            if (current_tick - arc.last_update_tick) > stale_threshold
-        ]
+        stale = []
+        
+        # Oldest first - stop at the first arc that is still fresh
+        for arc in self.active_arcs.values():
+            if (current_tick - arc.last_update_tick) <= stale_threshold:
+                break
+            stale.append(arc)
+        
+        return stale
     
     def prune_stale_arcs(self, current_tick: int, threshold: int = 100):
         """Abandon arcs that have been inactive too long"""
@@ -14,8 +14,18 @@ from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# Different event types have different tension impacts
+_EVENT_TENSION_MAP = {
+    "betrayal": 20.0,
+    "revelation": 15.0,
+    "conflict": 10.0,
+    "discovery": 8.0,
+    "meeting": 5.0
+}
+_MAX_EVENT_SPIKE = 20.0  # Cap on tension added by events in one tick
 
-@dataclass
+
+@dataclass(slots=True)
 class TensionPoint:
     """A point on the tension curve"""
     tick: int
@@ -99,11 +109,11 @@ class TensionManager:
         # Update arc phase
         self._update_arc_phase(current_tick)
         
-        logger.debug(
-            f"📊 Tension: {new_tension:.1f}/100 "
-            f"(base: {base_tension:.1f}, events: {event_delta:+.1f}, "
-            f"arc: {arc_modifier:+.1f}) - Phase: {self.arc_phase}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "📊 Tension: %.1f/100 (base: %.1f, events: %+.1f, arc: %+.1f) - Phase: %s",
+                new_tension, base_tension, event_delta, arc_modifier, self.arc_phase
+            )
         
         return new_tension
     
@@ -111,18 +121,16 @@ class TensionManager:
         """Calculate base tension from world state"""
         tension = 20.0
         
-        # Active conflicts increase tension
-        active_events = len([
-            e for e in world_state.events.values()
-            if e.status.value == "active"
-        ])
+        # Active conflicts increase tension (index maintained by WorldState)
+        active_events = world_state.active_event_count
         tension += active_events * 5.0
         
         # Characters in close proximity with contradictions
         # (Would implement full analysis in production)
         tension += 10.0
         
-        return min(self.max_tension, tension)
+        max_t = self.max_tension
+        return max_t if tension > max_t else tension
     
     def _calculate_event_tension(
         self,
@@ -132,20 +140,12 @@ class TensionManager:
         delta = 0.0
         
         for event in dramatic_events:
-            event_type = event.get("type", "")
-            
-            # Different event types have different tension impacts
-            tension_map = {
-                "betrayal": 20.0,
-                "revelation": 15.0,
-                "conflict": 10.0,
-                "discovery": 8.0,
-                "meeting": 5.0
-            }
-            
-            delta += tension_map.get(event_type, 3.0)
+            delta += _EVENT_TENSION_MAP.get(event.get("type", ""), 3.0)
+            if delta >= _MAX_EVENT_SPIKE:
+                # Saturated - remaining events can't change the result
+                return _MAX_EVENT_SPIKE
         
-        return min(20.0, delta)  # Cap spike at 20
+        return delta
     
     def _get_arc_modifier(self, current_tick: int) -> float:
         """Get tension modifier based on story arc phase"""
@@ -171,15 +171,24 @@ class TensionManager:
         target: float
     ) -> float:
         """Apply rate limits and bounds to tension changes"""
+        # Hot path (every tick): bind attributes to locals once
+        max_delta = self.max_change_per_tick
+        min_t = self.min_tension
+        max_t = self.max_tension
+        
         # Maximum change per tick
         delta = target - current
-        if abs(delta) > self.max_change_per_tick:
-            delta = self.max_change_per_tick if delta > 0 else -self.max_change_per_tick
+        if delta > max_delta:
+            delta = max_delta
+        elif delta < -max_delta:
+            delta = -max_delta
         
         new_value = current + delta
         
         # Apply bounds
-        return max(self.min_tension, min(self.max_tension, new_value))
+        if new_value < min_t:
+            return min_t
+        return max_t if new_value > max_t else new_value
     
     def _update_arc_phase(self, current_tick: int):
         """Update the current narrative arc phase"""
@@ -1,25 +1,54 @@
-from fastapi import APIRouter
-from ..core.world_state import WorldState
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from ..main import WorldSimulation
 from ..utils.change_tracker import ChangeStream
 from starlette.responses import StreamingResponse
 
 router = APIRouter()
-world = WorldState()
+
+# Background task running WorldSimulation.run(), while started via /start
+_run_task: Optional[asyncio.Task] = None
+
+
+@lru_cache
+def get_world() -> WorldSimulation:
+    """
+    Shared simulation, created on first request rather than at import.
+    Override with app.dependency_overrides[get_world] in tests.
+    """
+    return WorldSimulation()
 
 @router.get("/status")
-def get_status():
-    return {"running": world.ticker.running, "time": world.ticker.current_time}
+def get_status(sim: WorldSimulation = Depends(get_world)):
+    return {"running": sim.ticker.running, "tick": sim.ticker.current_tick}
 
 @router.get("/stream")
 async def stream_world_events():
     return StreamingResponse(ChangeStream.subscribe(), media_type="text/event-stream")
 
 @router.post("/start")
-def start_world():
-    world.start()
+async def start_world(sim: WorldSimulation = Depends(get_world)):
+    # Run the simulation loop as a background task so the request returns
+    global _run_task
+    if _run_task is not None and not _run_task.done():
+        return {"status": "already_running"}
+    _run_task = asyncio.create_task(sim.run())
     return {"status": "started"}
 
 @router.post("/stop")
-def stop_world():
-    world.stop()
+async def stop_world(sim: WorldSimulation = Depends(get_world)):
+    # The ticker finishes its current tick and exits; wait for that rather
+    # than cancelling mid-tick
+    global _run_task
+    sim.ticker.stop()
+    if _run_task is not None:
+        try:
+            await _run_task
+        except Exception as e:
+            return {"status": "failed", "error": str(e)}
+        finally:
+            _run_task = None
     return {"status": "stopped"}
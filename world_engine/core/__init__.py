@@ -1,5 +1,5 @@
 from .ticker import WorldTicker
-from .event_queue import EventQueue, QueuedEvent
+from .event_queue import EventQueue
 from .world_state import WorldState
 
-__all__ = ["WorldTicker", "EventQueue", "QueuedEvent", "WorldState"]
\ No newline at end of file
+__all__ = ["WorldTicker", "EventQueue", "WorldState"]
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Character hot-field columns (struct-of-arrays).
+
+The tick loop filters characters on the same few fields every tick
+(is_active, location_id, state, last_action_tick). Keeping those in
+parallel numpy arrays lets the filters run vectorized instead of walking
+every WorldCharacter model. The models stay the source of truth for
+everything else; WorldState writes both.
+"""
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ..entities.character import CharacterState
+
+# CharacterState <-> uint8 code
+STATE_CODES: Dict[CharacterState, int] = {state: i for i, state in enumerate(CharacterState)}
+
+_INITIAL_CAPACITY = 64
+
+
+class CharacterColumns:
+    """Parallel arrays indexed by a dense per-character integer"""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.active_count = 0
+        # Bumped whenever the set of active characters may have changed
+        self.active_version = 0
+
+        self.is_active = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self.location_id = np.empty(_INITIAL_CAPACITY, dtype=object)
+        self.state = np.zeros(_INITIAL_CAPACITY, dtype=np.uint8)
+        self.last_action_tick = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+        # Action cooldown gate for ready_ids: rows still cooling down sit in
+        # a (last_action_tick, row) min-heap; rows whose wait has elapsed
+        # move to _passed until they act again. Entries whose tick no longer
+        # matches the column are stale and skipped when popped.
+        self._gate: List[Tuple[int, int]] = []
+        self._passed: Set[int] = set()
+        self._gate_wait: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def clear(self) -> None:
+        version = self.active_version + 1
+        self.__init__()
+        self.active_version = version
+
+    def upsert(
+        self,
+        character_id: str,
+        location_id: str,
+        is_active: bool,
+        state: CharacterState,
+        last_action_tick: int
+    ) -> int:
+        """Write a character's row, appending one if it is new"""
+        i = self.index.get(character_id)
+        if i is None:
+            i = len(self.ids)
+            if i == len(self.is_active):
+                self._grow()
+            self.ids.append(character_id)
+            self.index[character_id] = i
+            self.active_version += 1
+            heapq.heappush(self._gate, (last_action_tick, i))
+        else:
+            if self.last_action_tick[i] != last_action_tick:
+                self._passed.discard(i)
+                heapq.heappush(self._gate, (last_action_tick, i))
+            if self.is_active[i]:
+                self.active_count -= 1
+            if self.is_active[i] != is_active:
+                self.active_version += 1
+
+        if is_active:
+            self.active_count += 1
+        self.is_active[i] = is_active
+        self.location_id[i] = location_id
+        self.state[i] = STATE_CODES[CharacterState(state)]
+        self.last_action_tick[i] = last_action_tick
+        return i
+
+    def _grow(self) -> None:
+        """Double capacity of every column"""
+        capacity = len(self.is_active) * 2
+        for name in ("is_active", "location_id", "state", "last_action_tick"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype) if old.dtype != object \
+                else np.empty(capacity, dtype=object)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def active_ids(self) -> List[str]:
+        """IDs of active characters, in insertion order"""
+        n = len(self.ids)
+        return [self.ids[i] for i in np.flatnonzero(self.is_active[:n])]
+
+    def _reset_gate(self, min_wait_ticks: int) -> None:
+        """Put every row back behind the cooldown gate"""
+        n = len(self.ids)
+        self._gate = list(zip(self.last_action_tick[:n].tolist(), range(n)))
+        heapq.heapify(self._gate)
+        self._passed = set()
+        self._gate_wait = min_wait_ticks
+
+    def ready_ids(self, tick: int, min_wait_ticks: int, busy_states) -> List[str]:
+        """
+        IDs of active characters that are not busy and have waited at
+        least min_wait_ticks since their last action, in insertion order.
+        Only rows whose cooldown has elapsed are examined.
+        """
+        if min_wait_ticks != self._gate_wait:
+            self._reset_gate(min_wait_ticks)
+
+        # Release rows whose cooldown has elapsed
+        gate = self._gate
+        passed = self._passed
+        last_action_tick = self.last_action_tick
+        cutoff = tick - min_wait_ticks
+        while gate and gate[0][0] <= cutoff:
+            t, i = heapq.heappop(gate)
+            if t == last_action_tick[i]:
+                passed.add(i)
+
+        busy_codes = {STATE_CODES[s] for s in busy_states}
+        is_active = self.is_active
+        state = self.state
+        ready = sorted(
+            i for i in passed
+            if is_active[i] and int(state[i]) not in busy_codes
+        )
+        return [self.ids[i] for i in ready]
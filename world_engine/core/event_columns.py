@@ -0,0 +1,84 @@
+"""
+Event columns (struct-of-arrays).
+
+Worlds keep every historical event, so queries over the whole history
+(by location, status or schedule window) would otherwise walk thousands
+of Event models. The fields those queries filter on live here as
+parallel numpy arrays; WorldState writes them alongside the models.
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from ..entities.event import EventStatus
+
+# EventStatus <-> uint8 code
+STATUS_CODES: Dict[EventStatus, int] = {status: i for i, status in enumerate(EventStatus)}
+
+_INITIAL_CAPACITY = 256
+
+
+class EventColumns:
+    """Parallel arrays indexed by a dense per-event integer"""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+
+        self.scheduled_tick = np.zeros(_INITIAL_CAPACITY, dtype=np.int32)
+        self.status = np.zeros(_INITIAL_CAPACITY, dtype=np.uint8)
+        self.location_id = np.empty(_INITIAL_CAPACITY, dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def upsert(
+        self,
+        event_id: str,
+        scheduled_tick: int,
+        status: EventStatus,
+        location_id: str
+    ) -> int:
+        """Write an event's row, appending one if it is new"""
+        i = self.index.get(event_id)
+        if i is None:
+            i = len(self.ids)
+            if i == len(self.status):
+                self._grow()
+            self.ids.append(event_id)
+            self.index[event_id] = i
+
+        self.scheduled_tick[i] = scheduled_tick
+        self.status[i] = STATUS_CODES[EventStatus(status)]
+        self.location_id[i] = location_id
+        return i
+
+    def set_status(self, event_id: str, status: EventStatus) -> None:
+        i = self.index.get(event_id)
+        if i is not None:
+            self.status[i] = STATUS_CODES[EventStatus(status)]
+
+    def _grow(self) -> None:
+        """Double capacity of every column"""
+        capacity = len(self.status) * 2
+        for name in ("scheduled_tick", "status", "location_id"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype) if old.dtype != object \
+                else np.empty(capacity, dtype=object)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def ids_at_location(self, location_id: str, include_completed: bool = False) -> List[str]:
+        """IDs of events at a location, in insertion order"""
+        n = len(self.ids)
+        mask = self.location_id[:n] == location_id
+        if not include_completed:
+            mask &= self.status[:n] != STATUS_CODES[EventStatus.COMPLETED]
+        return [self.ids[i] for i in np.flatnonzero(mask)]
+
+    def ids_scheduled_between(self, start_tick: int, end_tick: int) -> List[str]:
+        """IDs of events scheduled in [start_tick, end_tick)"""
+        n = len(self.ids)
+        ticks = self.scheduled_tick[:n]
+        mask = (ticks >= start_tick) & (ticks < end_tick)
+        return [self.ids[i] for i in np.flatnonzero(mask)]
@@ -2,26 +2,20 @@
 Event Queue - Priority-based scheduling system
 Events are processed when their scheduled tick arrives
 """
-from queue import PriorityQueue
-from dataclasses import dataclass, field
-from typing import Any, Optional, List
+import asyncio
+import heapq
+import itertools
+from typing import Any, Dict, Optional, List, Tuple
 import logging
 
 from ..entities.event import Event, EventType, EventStatus
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass(order=True)
-class QueuedEvent:
-    """
-    Wrapper for events in the priority queue.
-    Lower tick + lower priority = processed first.
-    """
-    tick: int
-    priority: int
-    event: Event = field(compare=False)
-
+# Heap entry: (tick, priority, sequence, event).
+# Lower tick + lower priority = processed first; the monotonic sequence
+# breaks ties in scheduling order so Events are never compared.
+QueueEntry = Tuple[int, int, int, Event]
 
 
 class EventQueue:
@@ -29,9 +23,19 @@ class EventQueue:
     Manages scheduling and execution of world events.
     """
     
-    def __init__(self):
-        self.queue: PriorityQueue[QueuedEvent] = PriorityQueue()
+    def __init__(self, world_state=None):
+        """
+        Args:
+            world_state: Optional WorldState notified of status changes
+                so its active-event index stays current
+        """
+        self.world_state = world_state
+        self.queue: List[QueueEntry] = []
+        self._counter = itertools.count()
         self.active_events: dict[str, Event] = {}  # Events currently running
+        # (end tick, sequence, event_id) min-heap over active events; entries
+        # for events completed some other way are skipped when popped
+        self._ending: List[Tuple[int, int, str]] = []
         self.completed_events: List[Event] = []
         
         # Statistics
@@ -45,17 +49,15 @@ class EventQueue:
         Args:
             event: Event to schedule
         """
-        queued = QueuedEvent(
-            tick=event.scheduled_tick,
-            priority=event.priority,
-            event=event
+        heapq.heappush(
+            self.queue,
+            (event.scheduled_tick, event.priority, next(self._counter), event)
         )
-        self.queue.put(queued)
         self.total_scheduled += 1
         
         logger.info(
-            f"📅 Scheduled {event.type.value} '{event.title}' "
-            f"for tick {event.scheduled_tick} (priority {event.priority})"
+            "📅 Scheduled %s '%s' for tick %d (priority %d)",
+            event.type.value, event.title, event.scheduled_tick, event.priority
         )
         
     def schedule_multiple(self, events: List[Event]) -> None:
@@ -80,35 +82,78 @@ class EventQueue:
         """
         processed = []
         
-        # Collect all due events
-        while not self.queue.empty():
-            queued = self.queue.queue[0]  # Peek without removing
-            
-            if queued.tick <= current_tick:
-                queued = self.queue.get()  # Now remove it
-                event = queued.event
+        # Executing events may schedule more that are already due,
+        # so keep draining until nothing due is left
+        while self.queue and self.queue[0][0] <= current_tick:  # Peek without removing
+            due = []
+            while self.queue and self.queue[0][0] <= current_tick:
+                _, _, _, event = heapq.heappop(self.queue)
                 
                 # Mark as active
-                event.status = EventStatus.ACTIVE
+                self._set_status(event, EventStatus.ACTIVE)
                 event.start_tick = current_tick
                 self.active_events[event.id] = event
+                heapq.heappush(
+                    self._ending,
+                    (current_tick + event.duration_ticks, next(self._counter), event.id)
+                )
                 
-                logger.info(f"▶️  Processing: {event.title}")
-                
-                # Execute if executor provided
-                if executor:
-                    try:
-                        await executor(event)
-                    except Exception as e:
-                        logger.error(f"Error executing event {event.id}: {e}")
-                        event.status = EventStatus.CANCELLED
-                
-                processed.append(event)
-                self.total_processed += 1
-            else:
-                break  # No more due events
+                logger.info("▶️  Processing: %s", event.title)
+                due.append(event)
+            
+            # Execute if executor provided
+            if executor:
+                chains = self._participant_chains(due)
+                if len(chains) == 1:
+                    await self._run_chain(chains[0], executor)
+                else:
+                    await asyncio.gather(
+                        *(self._run_chain(chain, executor) for chain in chains)
+                    )
+            
+            processed.extend(due)
+            self.total_processed += len(due)
                 
         return processed
+    
+    @staticmethod
+    def _participant_chains(events: List[Event]) -> List[List[Event]]:
+        """
+        Split events into chains that share no participants.
+        Each chain keeps the events' original order.
+        """
+        chains: List[List[Tuple[int, Event]]] = []
+        chain_of: Dict[str, int] = {}  # participant -> chain index
+        
+        for pos, event in enumerate(events):
+            hits = sorted({chain_of[p] for p in event.participants if p in chain_of})
+            if not hits:
+                c = len(chains)
+                chains.append([])
+            else:
+                # The event links several chains - fold them into the first
+                # (both chains are already in position order - merge, don't sort)
+                c = hits[0]
+                for other in hits[1:]:
+                    for _, merged in chains[other]:
+                        for p in merged.participants:
+                            chain_of[p] = c
+                    chains[c] = list(heapq.merge(chains[c], chains[other]))
+                    chains[other] = []
+            chains[c].append((pos, event))
+            for p in event.participants:
+                chain_of[p] = c
+        
+        return [[event for _, event in chain] for chain in chains if chain]
+    
+    async def _run_chain(self, chain: List[Event], executor) -> None:
+        """Execute events one after another (they touch the same characters)"""
+        for event in chain:
+            try:
+                await executor(event)
+            except Exception as e:
+                logger.error("Error executing event %s: %s", event.id, e)
+                self._set_status(event, EventStatus.CANCELLED)
         
     def complete_event(self, event_id: str, current_tick: int) -> Optional[Event]:
         """
@@ -123,11 +168,11 @@ class EventQueue:
         """
         if event_id in self.active_events:
             event = self.active_events.pop(event_id)
-            event.status = EventStatus.COMPLETED
+            self._set_status(event, EventStatus.COMPLETED)
             event.end_tick = current_tick
             self.completed_events.append(event)
             
-            logger.info(f"✅ Completed: {event.title}")
+            logger.info("✅ Completed: %s", event.title)
             return event
         
         return None
@@ -139,17 +184,23 @@ class EventQueue:
         Args:
             current_tick: Current tick
         """
-        to_complete = []
-        
-        for event_id, event in self.active_events.items():
-            if event.start_tick is not None:
-                elapsed = current_tick - event.start_tick
-                if elapsed >= event.duration_ticks:
-                    to_complete.append(event_id)
-                    
-        for event_id in to_complete:
+        # Only the events whose end tick has arrived are touched
+        ending = self._ending
+        while ending and ending[0][0] <= current_tick:
+            _, _, event_id = heapq.heappop(ending)
+            event = self.active_events.get(event_id)
+            # Stale entry: completed already, or re-activated since
+            if event is None or current_tick - event.start_tick < event.duration_ticks:
+                continue
             self.complete_event(event_id, current_tick)
             
+    def _set_status(self, event: Event, status: EventStatus) -> None:
+        """Update event status, routing through the world state if attached"""
+        if self.world_state is not None:
+            self.world_state.set_event_status(event, status)
+        else:
+            event.status = status
+            
     def get_upcoming_events(self, limit: int = 10) -> List[Event]:
         """
         Get the next N scheduled events without removing them.
@@ -160,25 +211,12 @@ class EventQueue:
         Returns:
             List of upcoming events
         """
-        events = []
-        temp_queue = PriorityQueue()
-        
-        # Extract events
-        while not self.queue.empty() and len(events) < limit:
-            queued = self.queue.get()
-            events.append(queued.event)
-            temp_queue.put(queued)
-            
-        # Restore queue
-        while not temp_queue.empty():
-            self.queue.put(temp_queue.get())
-            
-        return events
+        return [entry[3] for entry in heapq.nsmallest(limit, self.queue)]
         
     def get_stats(self) -> dict:
         """Get queue statistics"""
         return {
-            "queued": self.queue.qsize(),
+            "queued": len(self.queue),
             "active": len(self.active_events),
             "completed": len(self.completed_events),
             "total_scheduled": self.total_scheduled,
@@ -0,0 +1,72 @@
+"""
+Location coordinate table (struct-of-arrays).
+
+Spatial queries (nearest location, everything within a radius, map
+rendering) need every location's coordinates at once. Keeping them in
+one (N, 2) float32 array lets those run as a single vectorized pass
+instead of touching every Location object. Location.coordinates stays
+the source of truth; WorldState writes both.
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_INITIAL_CAPACITY = 64
+
+
+class LocationCoords:
+    """(N, 2) coordinate rows indexed by a dense per-location integer"""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.coords = np.zeros((_INITIAL_CAPACITY, 2), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def upsert(self, location_id: str, coordinates: Tuple[float, float]) -> int:
+        """Write a location's row, appending one if it is new"""
+        i = self.index.get(location_id)
+        if i is None:
+            i = len(self.ids)
+            if i == len(self.coords):
+                self._grow()
+            self.ids.append(location_id)
+            self.index[location_id] = i
+
+        self.coords[i] = coordinates
+        return i
+
+    def _grow(self) -> None:
+        """Double capacity"""
+        new = np.zeros((len(self.coords) * 2, 2), dtype=np.float32)
+        new[:len(self.coords)] = self.coords
+        self.coords = new
+
+    def _sq_distances(self, point: Tuple[float, float]) -> np.ndarray:
+        delta = self.coords[:len(self.ids)] - np.asarray(point, dtype=np.float32)
+        return np.einsum("ij,ij->i", delta, delta)
+
+    def nearest(self, point: Tuple[float, float], k: int = 1) -> List[str]:
+        """IDs of the k locations closest to point, nearest first"""
+        n = len(self.ids)
+        if n == 0 or k <= 0:
+            return []
+        d2 = self._sq_distances(point)
+        if k < n:
+            candidates = np.argpartition(d2, k)[:k]
+        else:
+            candidates = np.arange(n)
+        order = candidates[np.argsort(d2[candidates], kind="stable")]
+        return [self.ids[i] for i in order]
+
+    def within(self, point: Tuple[float, float], radius: float) -> List[str]:
+        """IDs of locations within radius of point, in insertion order"""
+        if not self.ids:
+            return []
+        mask = self._sq_distances(point) <= radius * radius
+        return [self.ids[i] for i in np.flatnonzero(mask)]
@@ -1,5 +1,6 @@
 import networkx as nx
 
+
 class SpatialGraph:
     """
     Manages the map of locations and connectivity.
@@ -7,11 +8,16 @@ class SpatialGraph:
     def __init__(self):
         self.graph = nx.DiGraph()
 
+        # Per-source Dijkstra predecessor maps, filled on demand by get_path
+        # and dropped whenever the map changes
+        self._pred = {}
+
     def add_location(self, loc_id, metadata):
         """
         Add a location node.
         """
         self.graph.add_node(loc_id, **metadata)
+        self._pred.clear()
 
     def connect_locations(self, loc_a, loc_b, distance=1, one_way=False):
         """
@@ -20,12 +26,40 @@ class SpatialGraph:
         self.graph.add_edge(loc_a, loc_b, weight=distance)
         if not one_way:
             self.graph.add_edge(loc_b, loc_a, weight=distance)
+        self._pred.clear()
+
+    def _predecessors_from(self, start):
+        """
+        Shortest-path predecessors from one location to every reachable one.
+        Characters path from a handful of places over and over, so one
+        Dijkstra per source answers all later queries from it.
+        """
+        pred = self._pred.get(start)
+        if pred is None:
+            pred, _ = nx.dijkstra_predecessor_and_distance(
+                self.graph, start, weight='weight'
+            )
+            self._pred[start] = pred
+        return pred
 
     def get_path(self, start, end):
-        try:
-            return nx.shortest_path(self.graph, start, end, weight='weight')
-        except nx.NetworkXNoPath:
+        if start not in self.graph or end not in self.graph:
             return None
-            
+        if start == end:
+            return [start]
+
+        pred = self._predecessors_from(start)
+        if end not in pred:
+            return None
+
+        # Walk predecessors back from the destination
+        path = [end]
+        node = end
+        while node != start:
+            node = pred[node][0]
+            path.append(node)
+        path.reverse()
+        return path
+
     def get_locations(self):
         return list(self.graph.nodes(data=True))
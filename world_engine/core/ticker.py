@@ -3,7 +3,8 @@ World Ticker - The heartbeat of the simulation
 Advances time and orchestrates all updates
 """
 import asyncio
-from typing import Callable, List, Awaitable
+import heapq
+from typing import Callable, List, Awaitable, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,21 +25,81 @@ class WorldTicker:
         self.tick_interval = tick_interval
         self.current_tick = start_tick
         self.callbacks: List[Callable[[int], Awaitable[None]]] = []
+        # Callbacks run together (asyncio.gather) after the sequential ones
+        self.concurrent_callbacks: List[Callable[[int], Awaitable[None]]] = []
+        
+        # (due tick, registration order, every_ticks, concurrent, callback)
+        # min-heap - periodic callbacks are only touched on ticks they're due
+        self._periodic: List[Tuple[int, int, int, bool, Callable[[int], Awaitable[None]]]] = []
         self.running = False
         
         # Statistics
         self.total_ticks_processed = 0
         self.average_tick_duration = 0.0
         
-    def register_callback(self, callback: Callable[[int], Awaitable[None]]) -> None:
+    def register_callback(
+        self,
+        callback: Callable[[int], Awaitable[None]],
+        concurrent: bool = False
+    ) -> None:
         """
         Register a coroutine to be called each tick.
         
         Args:
             callback: Async function that takes tick number as argument
+            concurrent: Run alongside the other concurrent callbacks instead
+                of in sequence. Sequential callbacks all finish first, so
+                per-tick setup belongs there.
         """
-        self.callbacks.append(callback)
+        if concurrent:
+            self.concurrent_callbacks.append(callback)
+        else:
+            self.callbacks.append(callback)
         logger.info(f"Registered callback: {callback.__name__}")
+    
+    def register_periodic(
+        self,
+        callback: Callable[[int], Awaitable[None]],
+        every_ticks: int,
+        concurrent: bool = False
+    ) -> None:
+        """
+        Register a coroutine to be called on ticks that are multiples of
+        every_ticks (same ticks as a `tick % every_ticks == 0` check).
+        
+        Args:
+            callback: Async function that takes tick number as argument
+            every_ticks: Period in ticks
+            concurrent: Run with the concurrent callbacks when due
+        """
+        due = self._next_multiple(every_ticks)
+        heapq.heappush(self._periodic, (due, len(self._periodic), every_ticks, concurrent, callback))
+        logger.info(f"Registered periodic callback: {callback.__name__} (every {every_ticks} ticks)")
+    
+    def _next_multiple(self, every_ticks: int) -> int:
+        """First multiple of every_ticks after the current tick"""
+        return (self.current_tick // every_ticks + 1) * every_ticks
+    
+    def _due_periodic(self) -> Tuple[list, list]:
+        """
+        Pop the periodic callbacks due this tick and reschedule them.
+        
+        Returns:
+            (sequential, concurrent) callbacks, each in registration order
+        """
+        heap = self._periodic
+        due = []
+        while heap and heap[0][0] <= self.current_tick:
+            due.append(heapq.heappop(heap))
+        
+        # Pushed back after popping, so nothing comes due twice in one tick
+        due.sort(key=lambda entry: entry[1])
+        for _, order, every_ticks, concurrent, callback in due:
+            heapq.heappush(heap, (self._next_multiple(every_ticks), order, every_ticks, concurrent, callback))
+        
+        sequential = [entry[4] for entry in due if not entry[3]]
+        concurrent = [entry[4] for entry in due if entry[3]]
+        return sequential, concurrent
         
     async def start(self) -> None:
         """
@@ -49,10 +110,19 @@ class WorldTicker:
         logger.info(f"🌍 World simulation started at tick {self.current_tick}")
         logger.info(f"⏱️  Tick interval: {self.tick_interval}s")
         
+        # Ticks start every tick_interval on the loop clock, so time spent
+        # inside a tick doesn't push later ticks back
+        loop = asyncio.get_running_loop()
+        next_at = loop.time()
+        
         try:
             while self.running:
                 await self._process_tick()
-                await asyncio.sleep(self.tick_interval)
+                next_at += self.tick_interval
+                now = loop.time()
+                if next_at < now:
+                    next_at = now  # Fell behind - resume the cadence instead of bursting
+                await asyncio.sleep(next_at - now)
         except KeyboardInterrupt:
             logger.info("Simulation interrupted by user")
             self.stop()
@@ -69,8 +139,11 @@ class WorldTicker:
         self.current_tick += 1
         logger.info(f"⏰ Tick {self.current_tick}")
         
-        # Execute all registered callbacks
-        for callback in self.callbacks:
+        due_sequential, due_concurrent = self._due_periodic()
+        
+        # Execute sequential callbacks in registration order
+        # (every-tick ones, then periodic ones due this tick)
+        for callback in self.callbacks + due_sequential:
             try:
                 await callback(self.current_tick)
             except Exception as e:
@@ -79,6 +152,21 @@ class WorldTicker:
                     exc_info=True
                 )
         
+        # Then the concurrent ones together, so their waits (LLM calls,
+        # disk I/O) overlap. One failing doesn't cancel the others.
+        concurrent = self.concurrent_callbacks + due_concurrent
+        if concurrent:
+            results = await asyncio.gather(
+                *(callback(self.current_tick) for callback in concurrent),
+                return_exceptions=True
+            )
+            for callback, result in zip(concurrent, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error in callback {callback.__name__}: {result}",
+                        exc_info=result
+                    )
+        
         # Update statistics
         tick_duration = time.time() - start_time
         self.total_ticks_processed += 1
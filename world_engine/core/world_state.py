@@ -2,26 +2,65 @@
 World State Manager - NOW JUST COORDINATION
 No longer the source of truth, just coordinates between epistemic layers
 """
-import json
 import logging
-from typing import Dict, List, Optional, Set
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from pathlib import Path
 
+import orjson
+
 # Import epistemic layers
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from world_engine.epistemic.objective_world import ObjectiveWorld
-from world_engine.epistemic.information_artifacts import InformationArtifactStore
-from world_engine.epistemic.belief_graph import BeliefGraph
-from world_engine.epistemic.perception import PerceptionSystem
+from ..epistemic.objective_world import ObjectiveWorld
+from ..epistemic.information_artifacts import InformationArtifactStore
+from ..epistemic.belief_graph import BeliefGraph
+from ..epistemic.perception import PerceptionSystem
 
 from ..entities.character import WorldCharacter, CharacterState
 from ..entities.location import Location
 from ..entities.event import Event, EventStatus
 from ..entities.faction import Faction
+from ..utils.snapshot import LazyEntityMap, SnapshotReader, write_snapshot
+from .character_columns import CharacterColumns
+from .event_columns import EventColumns
+from .location_coords import LocationCoords
 
 logger = logging.getLogger(__name__)
 
+# Neighborhoods up to this many hops are precomputed per location;
+# larger radii are searched on demand
+NEIGHBORHOOD_HOPS = 2
+
+# Shared stand-in for "no characters here" - never mutated
+_EMPTY: FrozenSet[str] = frozenset()
+
+# Seconds between background write-ahead log flushes
+WAL_FLUSH_INTERVAL = 0.5
+
+# Write-ahead log files: the live one, and the one a running compaction
+# (save_to_disk) covers - kept until the new snapshot is in place
+WAL_FILE = "wal.jsonl"
+COMPACTING_WAL_FILE = "wal.compacting.jsonl"
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSnapshot:
+    """World state captured by WorldState.freeze_snapshot, ready to write"""
+    meta: dict
+    sections: Dict[str, List[Tuple[str, dict, dict]]]
+
+
+def _fast_set(obj, **fields) -> None:
+    """
+    Assign model attributes without going through BaseModel.__setattr__.
+    Only for values the caller already knows are valid (no validation,
+    and the fields aren't recorded in model_fields_set).
+    """
+    for name, value in fields.items():
+        object.__setattr__(obj, name, value)
+
 
 class WorldState:
     """
@@ -45,14 +84,57 @@ class WorldState:
         self.perception = PerceptionSystem(self.objective_world, self.artifact_store)
         
         # Entity stores (still needed for non-epistemic data)
-        self.characters: Dict[str, WorldCharacter] = {}
-        self.locations: Dict[str, Location] = {}
-        self.factions: Dict[str, Faction] = {}
+        # Dict-like; entities loaded from a snapshot are parsed on first access
+        self.characters: LazyEntityMap = LazyEntityMap(WorldCharacter.model_validate)
+        self.locations: LazyEntityMap = LazyEntityMap(Location.from_dict)
+        self.factions: LazyEntityMap = LazyEntityMap(Faction.from_dict)
+        self._snapshot: Optional[SnapshotReader] = None
         self.events: Dict[str, Event] = {}
         
         # Indices
+        self._char_to_loc: Dict[str, str] = {}
         self._location_to_characters: Dict[str, Set[str]] = {}
         self._faction_to_members: Dict[str, Set[str]] = {}
+        self._active_event_ids: Set[str] = set()
+        
+        # location_id -> [locations within 0 hops, within 1 hop, ...]
+        self._location_neighborhood: Dict[str, List[FrozenSet[str]]] = {}
+        self._neighborhood_dirty = True
+        
+        # Hot character fields as parallel arrays for vectorized filters
+        self._char_columns = CharacterColumns()
+        self._event_columns = EventColumns()
+        self._location_coords = LocationCoords()
+        
+        # Memo for get_character_believed_location, keyed by (asker, subject)
+        self._believed_location_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._believed_location_version: Optional[Tuple[int, int]] = None
+        
+        # (tick, active_version, characters) - active list reused within a tick
+        self._active_cache: Optional[Tuple[int, int, List[WorldCharacter]]] = None
+        
+        # Write-behind persistence: (section, entity IDs) changed since the
+        # last flush. A background thread appends them to the WAL;
+        # save_to_disk compacts. The tick loop only ever puts to the queue,
+        # so it never shares a set with the flush thread.
+        self._dirty_queue: "queue.SimpleQueue[Tuple[str, Tuple[str, ...]]]" = queue.SimpleQueue()
+        self._wal_lock = threading.Lock()
+        # Held for a whole freeze/write, so a shutdown save waits for an
+        # autosave still writing in the executor (re-entrant: save_to_disk
+        # holds it across both steps)
+        self._save_lock = threading.RLock()
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        
+        # Snapshot double buffer: the last record written per entity, and
+        # the entities flushed to the WAL since (re-dumped on next freeze)
+        self._snapshot_records: Dict[str, Dict[str, Tuple[dict, dict]]] = {
+            "characters": {}, "locations": {}, "factions": {}
+        }
+        self._unsnapshotted: Dict[str, Set[str]] = {
+            "characters": set(), "locations": set(), "factions": set()
+        }
+        self._snapshot_primed = False
         
         # Metadata
         self.current_tick = 0
@@ -61,52 +143,94 @@ class WorldState:
         self._load_from_disk()
 
     def _load_from_disk(self) -> None:
-        """Load world state from JSON files"""
+        """Load world state from the snapshot (or legacy JSON files)"""
         logger.info("📂 Loading world state from disk...")
         
         # Load world metadata
         state_file = self.data_dir / "world_state.json"
         if state_file.exists():
-            with open(state_file, 'r') as f:
-                data = json.load(f)
-                self.current_tick = data.get("current_tick", 0)
-                self.world_name = data.get("world_name", "Unnamed World")
-        
-        # Load locations
-        locations_file = self.data_dir / "locations.json"
-        if locations_file.exists():
-            with open(locations_file, 'r') as f:
-                locations_data = json.load(f)
-                for loc_data in locations_data:
-                    location = Location(**loc_data)
-                    self.locations[location.id] = location
-            logger.info(f"  ✓ Loaded {len(self.locations)} locations")
-        
-        # Load factions
-        factions_file = self.data_dir / "factions.json"
-        if factions_file.exists():
-            with open(factions_file, 'r') as f:
-                factions_data = json.load(f)
-                for faction_data in factions_data:
-                    faction = Faction(**faction_data)
-                    self.factions[faction.id] = faction
-            logger.info(f"  ✓ Loaded {len(self.factions)} factions")
-        
-        # Load characters (references to character.json files)
-        characters_file = self.data_dir / "characters.json"
-        if characters_file.exists():
-            with open(characters_file, 'r') as f:
-                characters_data = json.load(f)
-                for char_data in characters_data:
-                    character = WorldCharacter(**char_data)
-                    self.characters[character.id] = character
-            logger.info(f"  ✓ Loaded {len(self.characters)} characters")
+            data = orjson.loads(state_file.read_bytes())
+            self.current_tick = data.get("current_tick", 0)
+            self.world_name = data.get("world_name", "Unnamed World")
+        
+        # Load entities - memory-mapped snapshot, or legacy per-entity files
+        snapshot_file = self.data_dir / "world_snapshot.bin"
+        if snapshot_file.exists():
+            self._snapshot = SnapshotReader(snapshot_file)
+            self.locations = LazyEntityMap(Location.from_dict, self._snapshot, "locations")
+            self.factions = LazyEntityMap(Faction.from_dict, self._snapshot, "factions")
+            self.characters = LazyEntityMap(WorldCharacter.model_validate, self._snapshot, "characters")
+        else:
+            for loc_data in self._read_legacy_entity_file("locations.json"):
+                location = Location.from_dict(loc_data)
+                self.locations[location.id] = location
+            
+            for faction_data in self._read_legacy_entity_file("factions.json"):
+                faction = Faction.from_dict(faction_data)
+                self.factions[faction.id] = faction
+            
+            # Characters are references to character.json files
+            for char_data in self._read_legacy_entity_file("characters.json"):
+                character = WorldCharacter(**char_data)
+                self.characters[character.id] = character
+        
+        # Changes made after the last snapshot
+        self._replay_wal()
+        
+        logger.info(f"  ✓ Loaded {len(self.locations)} locations")
+        logger.info(f"  ✓ Loaded {len(self.factions)} factions")
+        logger.info(f"  ✓ Loaded {len(self.characters)} characters")
         
         # Build indices
         self._rebuild_indices()
         
         logger.info(f"✅ World '{self.world_name}' loaded at tick {self.current_tick}")
     
+    def _replay_wal(self) -> None:
+        """Apply write-ahead log records on top of the loaded snapshot"""
+        # A compaction interrupted by a crash leaves its WAL behind; it is
+        # older than the live one, so it goes first
+        wal_files = [
+            path for path in (self.data_dir / COMPACTING_WAL_FILE, self.data_dir / WAL_FILE)
+            if path.exists()
+        ]
+        if not wal_files:
+            return
+        
+        stores = {
+            "characters": (self.characters, WorldCharacter.model_validate),
+            "locations": (self.locations, Location.from_dict),
+            "factions": (self.factions, Faction.from_dict),
+        }
+        
+        replayed = 0
+        for wal_file in wal_files:
+            with open(wal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Torn final line from a crash mid-flush
+                        logger.warning("⚠️  Skipping unreadable WAL record")
+                        continue
+                    
+                    if entry["section"] == "meta":
+                        self.current_tick = entry["record"]["current_tick"]
+                        continue
+                    
+                    store, from_record = stores[entry["section"]]
+                    store[entry["id"]] = from_record(entry["record"])
+                    replayed += 1
+        
+        logger.info(f"  ✓ Replayed {replayed} WAL records")
+    
+    def _read_legacy_entity_file(self, filename: str) -> list:
+        """Read a pre-snapshot entity file (locations.json etc.) if present"""
+        path = self.data_dir / filename
+        if not path.exists():
+            return []
+        return orjson.loads(path.read_bytes())
+    
     # ==================== Character Management (UPDATED) ====================
     
     def move_character(
@@ -119,91 +243,155 @@ class WorldState:
         Move a character to a new location.
         NOW: Records to objective world AND generates information artifacts.
         """
-        character = self.get_character(character_id)
-        if not character:
-            logger.error(f"Cannot move non-existent character: {character_id}")
-            return False
+        return self.move_characters_batch(
+            [(character_id, new_location_id)],
+            current_tick
+        )[0]
+    
+    def move_characters_batch(
+        self,
+        moves: List[Tuple[str, str]],
+        current_tick: int
+    ) -> List[bool]:
+        """
+        Move several characters in one pass.
         
-        if new_location_id not in self.locations:
-            logger.error(f"Cannot move to non-existent location: {new_location_id}")
-            return False
+        Moves in a batch happen simultaneously: observers are whoever stood
+        at either end of a move before the batch started. Facts, artifacts
+        and beliefs are recorded in bulk and indices are updated once per
+        location instead of once per character.
+        
+        Args:
+            moves: (character_id, new_location_id) pairs, one per character
+            current_tick: Current tick
+            
+        Returns:
+            Per-move success flags, in input order
+        """
+        results: List[bool] = []
+        valid = []  # (character, old_location, new_location)
+        seen: Set[str] = set()
+        
+        for character_id, new_location_id in moves:
+            character = self.get_character(character_id)
+            if not character:
+                logger.error(f"Cannot move non-existent character: {character_id}")
+                results.append(False)
+                continue
+            
+            if new_location_id not in self.locations:
+                logger.error(f"Cannot move to non-existent location: {new_location_id}")
+                results.append(False)
+                continue
+            
+            if character_id in seen:
+                logger.error(f"Cannot move {character_id} twice in one batch")
+                results.append(False)
+                continue
+            
+            seen.add(character_id)
+            valid.append((character, self._char_to_loc[character_id], new_location_id))
+            results.append(True)
         
-        old_location = character.location_id
+        if not valid:
+            return results
         
         # ✅ Record to OBJECTIVE WORLD
-        observers = self._get_characters_at_location(old_location) | \
-                self._get_characters_at_location(new_location_id)
-        observers.discard(character_id)  # Don't include self
-        
-        fact = self.objective_world.record_fact(
-            tick=current_tick,
-            fact_type="character_moved",
-            subject=character_id,
-            data={
-                "from": old_location,
-                "destination": new_location_id
-            },
-            observers=observers
-        )
+        # Who is present at each (from, to) pair is looked up once per pair
+        present_by_pair: Dict[Tuple[str, str], Set[str]] = {}
+        fact_specs = []
+        for character, old_location, new_location_id in valid:
+            pair = (old_location, new_location_id)
+            if pair not in present_by_pair:
+                # (one new set; the index sets themselves are not copied)
+                present_by_pair[pair] = set().union(
+                    self._get_characters_at_location(old_location),
+                    self._get_characters_at_location(new_location_id)
+                )
+            
+            observers = present_by_pair[pair] - {character.id}  # Don't include self
+            fact_specs.append({
+                "tick": current_tick,
+                "fact_type": "character_moved",
+                "subject": character.id,
+                "data": {
+                    "from": old_location,
+                    "destination": new_location_id
+                },
+                "observers": observers
+            })
         
-        # ✅ Generate information artifacts based on who was present
-        # Character themselves gets direct observation
-        self_artifact = self.perception.process_direct_observation(fact, character_id)
-        self.belief_graph.form_belief(
-            character_id,
-            self_artifact,
-            current_tick,
-            trust_in_source=1.0,  # Trust own observation
-            base_skepticism=0.0
-        )
+        facts = self.objective_world.record_facts_bulk(fact_specs)
         
-        # Other observers get observations too
-        for observer_id in observers:
-            observer_artifact = self.perception.process_direct_observation(fact, observer_id)
+        # ✅ Generate information artifacts based on who was present
+        belief_entries = []
+        for fact in facts:
+            # Character themselves and the other observers all saw the same
+            # thing - one shared artifact per fact
+            artifact = self.perception.process_direct_observations_bulk(
+                fact, [fact.subject, *fact.observers]
+            )
             
-            # Observer forms belief
-            observer = self.get_character(observer_id)
-            if observer and observer.profile:
-                # Use character's actual skepticism (placeholder for now)
-                base_skepticism = 0.2
-            else:
-                base_skepticism = 0.3
+            # Trust own observation
+            belief_entries.append((fact.subject, artifact, 1.0, 0.0))
             
-            self.belief_graph.form_belief(
-                observer_id,
-                observer_artifact,
-                current_tick,
-                trust_in_source=1.0,  # Direct observation
-                base_skepticism=base_skepticism
-            )
+            for observer_id in fact.observers:
+                observer = self.get_character(observer_id)
+                if observer and observer.has_profile:
+                    # Use character's actual skepticism (placeholder for now)
+                    base_skepticism = 0.2
+                else:
+                    base_skepticism = 0.3
+                
+                # Direct observation
+                belief_entries.append((observer_id, artifact, 1.0, base_skepticism))
+        
+        self.belief_graph.form_beliefs_bulk(belief_entries, current_tick)
         
         # Update traditional state (for backward compatibility)
-        character.location_id = new_location_id
-        character.state = CharacterState.IDLE
-        character.destination = None
-        
-        # Update indices
-        if old_location in self._location_to_characters:
-            self._location_to_characters[old_location].discard(character_id)
-        if old_location in self.locations:
-            old_loc = self.locations[old_location]
-            if character_id in old_loc.occupants:
-                old_loc.occupants.remove(character_id)
-        
-        if new_location_id not in self._location_to_characters:
-            self._location_to_characters[new_location_id] = set()
-        self._location_to_characters[new_location_id].add(character_id)
-        
-        new_loc = self.locations[new_location_id]
-        if character_id not in new_loc.occupants:
-            new_loc.occupants.append(character_id)
-        
-        logger.info(f"🚶 {character_id} moved: {old_location} → {new_location_id}")
-        return True
+        moved_from: Dict[str, Set[str]] = {}
+        moved_to: Dict[str, Set[str]] = {}
+        for character, old_location, new_location_id in valid:
+            runtime = character.runtime
+            runtime.location_id = new_location_id
+            runtime.state = CharacterState.IDLE
+            runtime.destination = None
+            self._char_to_loc[character.id] = new_location_id
+            self._sync_character_columns(character)
+            
+            moved_from.setdefault(old_location, set()).add(character.id)
+            moved_to.setdefault(new_location_id, set()).add(character.id)
+        
+        # Update indices - all removals first, then all additions
+        for location_id, char_ids in moved_from.items():
+            if location_id in self._location_to_characters:
+                self._location_to_characters[location_id] -= char_ids
+            old_loc = self.locations.get(location_id)
+            if old_loc:
+                old_loc.occupants -= char_ids
+        
+        for location_id, char_ids in moved_to.items():
+            if location_id not in self._location_to_characters:
+                self._location_to_characters[location_id] = set()
+            self._location_to_characters[location_id].update(char_ids)
+            
+            self.locations[location_id].occupants.update(char_ids)
+        
+        # Only once every index and occupant set is final (see flush_dirty)
+        self._mark_dirty("characters", [character.id for character, _, _ in valid])
+        self._mark_dirty("locations", [*moved_from, *moved_to])
+        
+        for character, old_location, new_location_id in valid:
+            logger.info(f"🚶 {character.id} moved: {old_location} → {new_location_id}")
+        
+        return results
     
     def _get_characters_at_location(self, location_id: str) -> Set[str]:
-        """Helper to get character IDs at location"""
-        return self._location_to_characters.get(location_id, set()).copy()
+        """
+        Helper to get character IDs at location.
+        Returns the live index set - callers must not mutate it.
+        """
+        return self._location_to_characters.get(location_id, _EMPTY)
     
     # ==================== Querying (UPDATED) ====================
     
@@ -225,37 +413,49 @@ class WorldState:
         Returns:
             Location ID or None if they don't know
         """
-        # Get artifacts character knows about the other character's location
-        artifacts = self.artifact_store.get_artifacts_known_by(
-            character_id,
-            about_subject=about_character
-        )
+        # Answers only change when artifacts or beliefs do - drop the
+        # memo whenever either layer reports a mutation.
+        # (current_tick doesn't affect the answer, so it isn't part of the key)
+        version = (self.artifact_store.version, self.belief_graph.version)
+        if version != self._believed_location_version:
+            self._believed_location_cache.clear()
+            self._believed_location_version = version
         
-        if not artifacts:
-            # They don't know anything
-            return None
+        key = (character_id, about_character)
+        if key in self._believed_location_cache:
+            return self._believed_location_cache[key]
         
-        # Find most recent movement artifact they believe
-        location_artifacts = [
-            a for a in artifacts
-            if a.data.get("destination")
-        ]
+        location = self._compute_believed_location(character_id, about_character)
+        self._believed_location_cache[key] = location
+        return location
+    
+    def _compute_believed_location(
+        self,
+        character_id: str,
+        about_character: str
+    ) -> Optional[str]:
+        """Uncached body of get_character_believed_location"""
+        artifacts = self.artifact_store.artifacts
         
-        if not location_artifacts:
-            return None
+        def is_known_location(belief) -> bool:
+            # Current movement artifact this character actually knows
+            artifact = artifacts.get(belief.artifact_id)
+            return (
+                artifact is not None
+                and artifact.superseded_by is None
+                and character_id in artifact.known_by
+                and bool(artifact.data.get("destination"))
+            )
         
         # Get the one they most strongly believe
-        best_artifact = None
-        best_confidence = 0.0
-        
-        for artifact in location_artifacts:
-            belief = self.belief_graph.get_belief(character_id, artifact.artifact_id)
-            if belief and belief.confidence > best_confidence:
-                best_artifact = artifact
-                best_confidence = belief.confidence
+        belief = self.belief_graph.get_strongest_belief(
+            character_id,
+            about_character,
+            predicate=is_known_location
+        )
         
-        if best_artifact:
-            return best_artifact.data.get("destination")
+        if belief:
+            return artifacts[belief.artifact_id].data.get("destination")
         
         return None
     
@@ -272,91 +472,322 @@ class WorldState:
     # ==================== Persistence ====================
     
     def save_to_disk(self) -> None:
-        """Save world state to JSON files"""
-        logger.info("💾 Saving world state to disk...")
-        
-        # Save metadata
-        state_file = self.data_dir / "world_state.json"
-        with open(state_file, 'w') as f:
-            json.dump({
-                "world_name": self.world_name,
-                "current_tick": self.current_tick,
-            }, f, indent=2)
-        
-        # Save epistemic layers
-        self.objective_world.save_to_disk()
-        
-        # Save entities (unchanged)
-        locations_file = self.data_dir / "locations.json"
-        with open(locations_file, 'w') as f:
-            json.dump(
-                [loc.dict() for loc in self.locations.values()],
-                f,
-                indent=2
-            )
+        """
+        Save world metadata, fact log and entity snapshot.
+        This is the compaction step: the snapshot covers everything in the
+        write-ahead log, so the log is dropped afterwards.
         
-        factions_file = self.data_dir / "factions.json"
-        with open(factions_file, 'w') as f:
-            json.dump(
-                [faction.dict() for faction in self.factions.values()],
-                f,
-                indent=2
-            )
+        Same as write_frozen_snapshot(freeze_snapshot()); callers that want
+        the write off the event loop call those two separately.
+        """
+        with self._save_lock:
+            self.write_frozen_snapshot(self.freeze_snapshot())
+    
+    def freeze_snapshot(self) -> "FrozenSnapshot":
+        """
+        Capture what the next snapshot will contain. Call this on the
+        thread that mutates the world (the tick loop), at a tick boundary.
         
-        characters_file = self.data_dir / "characters.json"
-        with open(characters_file, 'w') as f:
-            json.dump(
-                [char.dict() for char in self.characters.values()],
-                f,
-                indent=2
+        Only entities changed since the last capture are re-serialized;
+        the rest reuse their cached records. The result shares nothing
+        mutable with the live world, so it can be written from another
+        thread while the loop carries on. If a previous capture is still
+        being written, this waits for it to finish first.
+        """
+        with self._save_lock:
+            # Everything changed so far is captured below; later changes are
+            # dirtied again and flushed to a new WAL
+            with self._wal_lock:
+                dirty = self._take_dirty()
+                changed = {
+                    section: ids | dirty[section]
+                    for section, ids in self._unsnapshotted.items()
+                }
+                for ids in self._unsnapshotted.values():
+                    ids.clear()
+                self._rotate_wal()
+            
+            stores = {
+                "characters": self.characters,
+                "locations": self.locations,
+                "factions": self.factions,
+            }
+            for section, store in stores.items():
+                records = self._snapshot_records[section]
+                if not self._snapshot_primed:
+                    # First capture: dump everything (this also parses any
+                    # entities still pending in the old snapshot file)
+                    for entity_id, entity in store.items():
+                        records[entity_id] = self._snapshot_entry(section, entity)
+                    continue
+            
+                for entity_id in changed[section]:
+                    entity = store.get(entity_id)
+                    if entity is None:
+                        records.pop(entity_id, None)
+                    else:
+                        records[entity_id] = self._snapshot_entry(section, entity)
+            self._snapshot_primed = True
+            
+            return FrozenSnapshot(
+                meta={"world_name": self.world_name, "current_tick": self.current_tick},
+                sections={
+                    section: [(entity_id, record, hot) for entity_id, (record, hot) in records.items()]
+                    for section, records in self._snapshot_records.items()
+                }
             )
+    
+    def write_frozen_snapshot(self, frozen: "FrozenSnapshot") -> None:
+        """Write a captured snapshot to disk (safe to run off the event loop)"""
+        with self._save_lock:
+            logger.info("💾 Saving world state to disk...")
+            
+            # Save metadata
+            state_file = self.data_dir / "world_state.json"
+            # Pretty-printed only when debugging
+            state_file.write_bytes(orjson.dumps(
+                frozen.meta,
+                option=orjson.OPT_INDENT_2 if logger.isEnabledFor(logging.DEBUG) else 0
+            ))
+            
+            # Save epistemic layers
+            self.objective_world.save_to_disk()
+            
+            with self._wal_lock:
+                if self._snapshot is not None:
+                    self._snapshot.close()
+                    self._snapshot = None
+                write_snapshot(self.data_dir / "world_snapshot.bin", frozen.sections)
+                (self.data_dir / COMPACTING_WAL_FILE).unlink(missing_ok=True)
+            
+            logger.info("✅ World state saved")
+    
+    def _rotate_wal(self) -> None:
+        """
+        Set the live WAL aside for the compaction in progress (caller holds
+        _wal_lock). If an earlier compaction never finished, its WAL is
+        kept and this one appended to it.
+        """
+        wal_file = self.data_dir / WAL_FILE
+        if not wal_file.exists():
+            return
         
-        logger.info("✅ World state saved")
+        compacting_file = self.data_dir / COMPACTING_WAL_FILE
+        if compacting_file.exists():
+            with open(compacting_file, 'ab') as f:
+                f.write(wal_file.read_bytes())
+            wal_file.unlink()
+        else:
+            os.replace(wal_file, compacting_file)
     
-    def get_stats(self) -> dict:
-        """Get world statistics"""
-        return {
-            "world_name": self.world_name,
-            "current_tick": self.current_tick,
-            "characters": {
-                "total": len(self.characters),
-                "active": len(self.get_active_characters())
-            },
-            "locations": len(self.locations),
-            "factions": len(self.factions),
-            "events": {
-                "total": len(self.events),
-                "active": len([e for e in self.events.values() 
-                              if e.status == EventStatus.ACTIVE])
-            },
-            "epistemic": {
-                "objective_facts": self.objective_world.get_stats()["total_facts"],
-                "information_artifacts": len(self.artifact_store.artifacts),
+    @staticmethod
+    def _snapshot_entry(section: str, entity) -> Tuple[dict, dict]:
+        """(record, hot fields) for one entity's snapshot row"""
+        # (profile/motivational_state are excluded by the models)
+        if section == "characters":
+            return entity.model_dump(mode="json"), {
+                "location_id": entity.location_id,
+                "is_active": entity.is_active,
+                "state": entity.state.value,
+                "last_action_tick": entity.last_action_tick,
             }
-        }
+        if section == "locations":
+            return entity.to_dict(), {
+                "connected_to": sorted(entity.connected_to),
+                "coordinates": list(entity.coordinates)
+            }
+        return entity.to_dict(), {"members": sorted(entity.members)}
+    
+    def start_background_flush(self, interval: float = WAL_FLUSH_INTERVAL) -> None:
+        """Start the thread that appends dirty entities to the WAL"""
+        if self._flush_thread is not None:
+            return
+        
+        self._flush_stop.clear()
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            args=(interval,),
+            name="world-state-wal",
+            daemon=True
+        )
+        self._flush_thread.start()
+    
+    def stop_background_flush(self) -> None:
+        """Stop the flush thread, writing out anything still dirty"""
+        if self._flush_thread is None:
+            return
+        
+        self._flush_stop.set()
+        self._flush_thread.join()
+        self._flush_thread = None
+        self.flush_dirty()
+    
+    def _flush_loop(self, interval: float) -> None:
+        while not self._flush_stop.wait(interval):
+            try:
+                self.flush_dirty()
+            except Exception as e:
+                logger.error(f"❌ WAL flush failed: {e}", exc_info=True)
+    
+    def _mark_dirty(self, section: str, ids: Iterable[str]) -> None:
+        """
+        Queue entities for the next WAL flush. Call only after the
+        mutation (including every index and occupant set it touches) is
+        complete.
+        """
+        self._dirty_queue.put((section, tuple(ids)))
+    
+    def _take_dirty(self) -> Dict[str, Set[str]]:
+        """Drain the dirty queue into per-section ID sets (caller holds _wal_lock)"""
+        dirty: Dict[str, Set[str]] = {"characters": set(), "locations": set(), "factions": set()}
+        get = self._dirty_queue.get_nowait
+        while True:
+            try:
+                section, ids = get()
+            except queue.Empty:
+                return dirty
+            dirty[section].update(ids)
+    
+    def flush_dirty(self) -> int:
+        """
+        Append entities changed since the last flush to the WAL.
+        
+        Entities are queued as dirty only after their mutation finishes,
+        so a record copied while the tick loop is still mutating that
+        entity is always followed by its dirty mark, and the next flush
+        (or compaction) rewrites it with the finished state.
+        
+        Returns:
+            Number of entity records written
+        """
+        with self._wal_lock:
+            dirty = self._take_dirty()
+            dirty_chars = dirty["characters"]
+            dirty_locs = dirty["locations"]
+            dirty_factions = dirty["factions"]
+            
+            # Still newer than the last snapshot's cached records
+            self._unsnapshotted["characters"] |= dirty_chars
+            self._unsnapshotted["locations"] |= dirty_locs
+            self._unsnapshotted["factions"] |= dirty_factions
+            
+            lines = []
+            for section, store, ids, to_record in (
+                ("characters", self.characters, dirty_chars,
+                 lambda char: char.model_dump(mode="json")),
+                ("locations", self.locations, dirty_locs, Location.to_dict),
+                ("factions", self.factions, dirty_factions, Faction.to_dict),
+            ):
+                for entity_id in ids:
+                    entity = store.get(entity_id)
+                    if entity is not None:
+                        lines.append(orjson.dumps({
+                            "section": section,
+                            "id": entity_id,
+                            "record": to_record(entity),
+                        }))
+            
+            if not lines:
+                return 0
+            
+            lines.append(orjson.dumps({
+                "section": "meta",
+                "record": {"current_tick": self.current_tick},
+            }))
+            
+            with open(self.data_dir / WAL_FILE, 'ab') as f:
+                f.write(b"\n".join(lines) + b"\n")
+            
+            return len(lines) - 1
     
     # ==================== Character Management ====================
     
     def add_character(self, character: WorldCharacter) -> None:
         """Add a character to the world"""
         self.characters[character.id] = character
+        self._active_cache = None  # May replace a cached model
+        self._char_to_loc[character.id] = character.location_id
         
         # Update location index
         if character.location_id not in self._location_to_characters:
             self._location_to_characters[character.location_id] = set()
-            self._location_to_characters[character.location_id].add(character.id)
+        self._location_to_characters[character.location_id].add(character.id)
         
-        # ✅ FIX: Also add to location's occupants list
+        # ✅ FIX: Also add to location's occupants set
         location = self.get_location(character.location_id)
-        if location and character.id not in location.occupants:
-            location.occupants.append(character.id)
+        if location:
+            location.occupants.add(character.id)
+        
+        self._sync_character_columns(character)
+        self._mark_dirty("characters", (character.id,))
+        self._mark_dirty("locations", (character.location_id,))
         
         logger.info(f"➕ Added character: {character.id} at {character.location_id}")
     
+    def add_characters(self, characters: List[WorldCharacter]) -> None:
+        """Add many characters, invalidating the active cache once"""
+        for character in characters:
+            self.characters[character.id] = character
+            self._char_to_loc[character.id] = character.location_id
+            self._location_to_characters.setdefault(character.location_id, set()).add(character.id)
+            
+            location = self.locations.get(character.location_id)
+            if location:
+                location.occupants.add(character.id)
+            
+            self._sync_character_columns(character)
+        self._active_cache = None
+        self._mark_dirty("characters", [character.id for character in characters])
+        self._mark_dirty("locations", [character.location_id for character in characters])
+        logger.info(f"➕ Added {len(characters)} characters")
+    
     def get_character(self, character_id: str) -> Optional[WorldCharacter]:
         """Get character by ID"""
         return self.characters.get(character_id)
     
+    def update_character_status(
+        self,
+        character_id: str,
+        state: Optional[CharacterState] = None,
+        last_action_tick: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        destination: Optional[str] = None
+    ) -> bool:
+        """
+        Update a character's hot fields (model and column store together).
+        Fields left as None are unchanged.
+        
+        Returns:
+            False if the character doesn't exist
+        """
+        character = self.get_character(character_id)
+        if not character:
+            return False
+        
+        runtime = character.runtime
+        if state is not None:
+            runtime.state = state
+        if last_action_tick is not None:
+            runtime.last_action_tick = last_action_tick
+        if destination is not None:
+            runtime.destination = destination
+        if is_active is not None:
+            _fast_set(character, is_active=is_active)
+        
+        self._sync_character_columns(character)
+        self._mark_dirty("characters", (character_id,))
+        return True
+    
+    def _sync_character_columns(self, character: WorldCharacter) -> None:
+        """Mirror a character's hot fields into the column store"""
+        self._char_columns.upsert(
+            character.id,
+            character.location_id,
+            character.is_active,
+            character.state,
+            character.last_action_tick
+        )
+    
     # def move_character(self, character_id: str, new_location_id: str) -> bool:
     #     """
     #     Move a character to a new location.
@@ -400,20 +831,35 @@ class WorldState:
     
     def get_characters_at_location(self, location_id: str) -> List[WorldCharacter]:
         """Get all characters at a specific location"""
-        char_ids = self._location_to_characters.get(location_id, set())
+        char_ids = self._location_to_characters.get(location_id, _EMPTY)
         return [self.characters[cid] for cid in char_ids if cid in self.characters]
     
     def get_nearby_characters(
         self, 
         character_id: str, 
-        include_self: bool = False
+        include_self: bool = False,
+        radius_hops: int = 0
     ) -> List[WorldCharacter]:
-        """Get all characters at the same location as this character"""
-        character = self.get_character(character_id)
-        if not character:
+        """
+        Get all characters near this character.
+        
+        Args:
+            character_id: Who to look around
+            include_self: Include the character itself
+            radius_hops: 0 = same location only, k = up to k connections away
+        """
+        location_id = self._char_to_loc.get(character_id)
+        if location_id is None:
             return []
         
-        nearby = self.get_characters_at_location(character.location_id)
+        if radius_hops <= 0:
+            nearby = self.get_characters_at_location(location_id)
+        else:
+            char_ids = set().union(*(
+                self._location_to_characters.get(loc_id, _EMPTY)
+                for loc_id in self.get_location_neighborhood(location_id, radius_hops)
+            ))
+            nearby = [self.characters[cid] for cid in char_ids if cid in self.characters]
         
         if not include_self:
             nearby = [c for c in nearby if c.id != character_id]
@@ -426,8 +872,21 @@ class WorldState:
         """Add a location to the world"""
         self.locations[location.id] = location
         self._location_to_characters[location.id] = set()
+        self._location_coords.upsert(location.id, location.coordinates)
+        self._neighborhood_dirty = True
+        self._mark_dirty("locations", (location.id,))
         logger.info(f"➕ Added location: {location.name} ({location.id})")
     
+    def add_locations(self, locations: List[Location]) -> None:
+        """Add many locations, invalidating the neighborhood index once"""
+        for location in locations:
+            self.locations[location.id] = location
+            self._location_to_characters.setdefault(location.id, set())
+            self._location_coords.upsert(location.id, location.coordinates)
+        self._neighborhood_dirty = True
+        self._mark_dirty("locations", [location.id for location in locations])
+        logger.info(f"➕ Added {len(locations)} locations")
+    
     def get_location(self, location_id: str) -> Optional[Location]:
         """Get location by ID"""
         return self.locations.get(location_id)
@@ -438,27 +897,87 @@ class WorldState:
         if not location:
             return []
         
+        # Sorted so listings (e.g. action prompts) are stable across runs
         return [
             self.locations[loc_id]
-            for loc_id in location.connected_to
+            for loc_id in sorted(location.connected_to)
             if loc_id in self.locations
         ]
     
+    def get_location_neighborhood(self, location_id: str, radius_hops: int) -> FrozenSet[str]:
+        """
+        Get IDs of all locations within radius_hops connections
+        (including the location itself).
+        """
+        if self._neighborhood_dirty:
+            self._build_location_neighborhoods()
+        
+        rings = self._location_neighborhood.get(location_id)
+        if rings is None:
+            return _EMPTY
+        if radius_hops < len(rings):
+            return rings[radius_hops]
+        return self._bfs_neighborhood(location_id, radius_hops)[-1]
+    
+    def get_nearest_locations(self, point: Tuple[float, float], k: int = 1) -> List[str]:
+        """IDs of the k locations closest to a (lat, lon) point, nearest first"""
+        return self._location_coords.nearest(point, k)
+    
+    def get_locations_within(self, point: Tuple[float, float], radius: float) -> List[str]:
+        """IDs of all locations within radius of a (lat, lon) point"""
+        return self._location_coords.within(point, radius)
+    
+    def _build_location_neighborhoods(self) -> None:
+        """Precompute k-hop neighborhoods for every location"""
+        self._location_neighborhood = {
+            location_id: self._bfs_neighborhood(location_id, NEIGHBORHOOD_HOPS)
+            for location_id in self.locations
+        }
+        self._neighborhood_dirty = False
+    
+    def _bfs_neighborhood(self, location_id: str, max_hops: int) -> List[FrozenSet[str]]:
+        """Breadth-first walk over connected_to, one cumulative set per hop"""
+        seen = {location_id}
+        frontier = [location_id]
+        rings = [frozenset(seen)]
+        
+        for _ in range(max_hops):
+            next_frontier = []
+            for loc_id in frontier:
+                # (peek avoids parsing snapshot records just for their edges)
+                for neighbor in self.locations.peek(loc_id, "connected_to"):
+                    if neighbor not in seen and neighbor in self.locations:
+                        seen.add(neighbor)
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+            rings.append(frozenset(seen))
+        
+        return rings
+    
     # ==================== Faction Management ====================
     
     def add_faction(self, faction: Faction) -> None:
         """Add a faction to the world"""
         self.factions[faction.id] = faction
         self._faction_to_members[faction.id] = set(faction.members)
+        self._mark_dirty("factions", (faction.id,))
         logger.info(f"➕ Added faction: {faction.name} ({faction.id})")
     
+    def add_factions(self, factions: List[Faction]) -> None:
+        """Add many factions at once"""
+        for faction in factions:
+            self.factions[faction.id] = faction
+            self._faction_to_members[faction.id] = set(faction.members)
+        self._mark_dirty("factions", [faction.id for faction in factions])
+        logger.info(f"➕ Added {len(factions)} factions")
+    
     def get_faction(self, faction_id: str) -> Optional[Faction]:
         """Get faction by ID"""
         return self.factions.get(faction_id)
     
     def get_faction_members(self, faction_id: str) -> List[WorldCharacter]:
         """Get all character members of a faction"""
-        member_ids = self._faction_to_members.get(faction_id, set())
+        member_ids = self._faction_to_members.get(faction_id, _EMPTY)
         return [self.characters[cid] for cid in member_ids if cid in self.characters]
     
     # ==================== Event Management ====================
@@ -466,19 +985,47 @@ class WorldState:
     def add_event(self, event: Event) -> None:
         """Add an event to the world"""
         self.events[event.id] = event
+        self._event_columns.upsert(
+            event.id,
+            event.scheduled_tick,
+            event.status,
+            event.location_id
+        )
+        
+        if event.status == EventStatus.ACTIVE:
+            self._active_event_ids.add(event.id)
+        else:
+            self._active_event_ids.discard(event.id)
         
         # Add to location's active events if not completed
         if event.status != EventStatus.COMPLETED:
             location = self.get_location(event.location_id)
             if location and event.id not in location.active_events:
                 location.active_events.append(event.id)
+                self._mark_dirty("locations", (location.id,))
     
     def get_event(self, event_id: str) -> Optional[Event]:
         """Get event by ID"""
         return self.events.get(event_id)
     
-    def get_events_at_location(self, location_id: str) -> List[Event]:
-        """Get all events at a location"""
+    def get_events_at_location(
+        self,
+        location_id: str,
+        include_completed: bool = False
+    ) -> List[Event]:
+        """
+        Get all events at a location.
+        
+        Args:
+            location_id: Location to look at
+            include_completed: Also return finished events (history scan)
+        """
+        if include_completed:
+            return [
+                self.events[event_id]
+                for event_id in self._event_columns.ids_at_location(location_id, True)
+            ]
+        
         location = self.get_location(location_id)
         if not location:
             return []
@@ -489,24 +1036,84 @@ class WorldState:
             if event_id in self.events
         ]
     
+    def get_events_scheduled_between(self, start_tick: int, end_tick: int) -> List[Event]:
+        """Get events scheduled in [start_tick, end_tick)"""
+        return [
+            self.events[event_id]
+            for event_id in self._event_columns.ids_scheduled_between(start_tick, end_tick)
+        ]
+    
+    def get_active_events(self) -> List[Event]:
+        """Get all ACTIVE events (from the index, no scan)"""
+        return [self.events[event_id] for event_id in self._active_event_ids]
+    
     def complete_event(self, event_id: str) -> None:
         """Mark an event as completed and remove from location"""
         event = self.get_event(event_id)
         if not event:
             return
         
-        event.status = EventStatus.COMPLETED
+        self.set_event_status(event, EventStatus.COMPLETED)
         
         # Remove from location's active events
         location = self.get_location(event.location_id)
         if location and event_id in location.active_events:
             location.active_events.remove(event_id)
+            self._mark_dirty("locations", (location.id,))
+    
+    def set_event_status(self, event: Event, status: EventStatus) -> None:
+        """
+        Change an event's status and keep the active-event index in sync.
+        All status transitions should go through here.
+        """
+        _fast_set(event, status=status)
+        self._event_columns.set_status(event.id, status)
+        if status == EventStatus.ACTIVE and event.id in self.events:
+            self._active_event_ids.add(event.id)
+        else:
+            self._active_event_ids.discard(event.id)
+    
+    @property
+    def active_event_count(self) -> int:
+        """Number of world events currently ACTIVE (O(1))"""
+        return len(self._active_event_ids)
     
     # ==================== Query Methods ====================
     
     def get_active_characters(self) -> List[WorldCharacter]:
         """Get all characters that are actively simulated"""
-        return [char for char in self.characters.values() if char.is_active]
+        return [self.characters[cid] for cid in self._char_columns.active_ids()]
+    
+    def get_active_characters_cached(self, current_tick: int) -> List[WorldCharacter]:
+        """
+        get_active_characters, built once per tick and reused by every
+        caller in that tick (unless a character is added or (de)activated).
+        Callers must not mutate the returned list.
+        """
+        version = self._char_columns.active_version
+        cache = self._active_cache
+        if cache is not None and cache[0] == current_tick and cache[1] == version:
+            return cache[2]
+        
+        active = self.get_active_characters()
+        self._active_cache = (current_tick, version, active)
+        return active
+    
+    def get_characters_ready_to_act(
+        self,
+        current_tick: int,
+        min_wait_ticks: int
+    ) -> List[WorldCharacter]:
+        """
+        Get active characters that aren't traveling or talking and haven't
+        acted in the last min_wait_ticks ticks.
+        """
+        ready_ids = self._char_columns.ready_ids(
+            current_tick,
+            min_wait_ticks,
+            busy_states=(CharacterState.TRAVELING, CharacterState.IN_CONVERSATION)
+        )
+        return [self.characters[cid] for cid in ready_ids]
     
     def get_all_locations(self) -> List[Location]:
         """Get all locations"""
@@ -522,36 +1129,63 @@ class WorldState:
         """Rebuild all indices from scratch"""
         logger.info("🔄 Rebuilding indices...")
         
-        # Location -> Characters
-        self._location_to_characters.clear()
-        for char in self.characters.values():
-            if char.location_id not in self._location_to_characters:
-                self._location_to_characters[char.location_id] = set()
-            self._location_to_characters[char.location_id].add(char.id)
+        # Character -> Location, from which Location -> Characters follows
+        # (peek reads index fields without parsing snapshot records)
+        peek = self.characters.peek
+        self._char_to_loc = {
+            char_id: peek(char_id, "location_id") for char_id in self.characters
+        }
+        self._location_to_characters = {
+            location_id: set() for location_id in self._char_to_loc.values()
+        }
+        for char_id, location_id in self._char_to_loc.items():
+            self._location_to_characters[location_id].add(char_id)
+        
+        # Hot-field columns
+        self._char_columns.clear()
+        for char_id, location_id in self._char_to_loc.items():
+            self._char_columns.upsert(
+                char_id,
+                location_id,
+                peek(char_id, "is_active", True),
+                peek(char_id, "state", CharacterState.IDLE),
+                peek(char_id, "last_action_tick", 0)
+            )
+        
+        # Location -> k-hop neighborhood, and the coordinate table
+        self._build_location_neighborhoods()
+        self._location_coords.clear()
+        for location_id in self.locations:
+            self._location_coords.upsert(
+                location_id, self.locations.peek(location_id, "coordinates")
+            )
         
         # Faction -> Members
         self._faction_to_members.clear()
-        for faction in self.factions.values():
-            self._faction_to_members[faction.id] = set(faction.members)
+        for faction_id in self.factions:
+            self._faction_to_members[faction_id] = set(self.factions.peek(faction_id, "members"))
         
         logger.info("  ✓ Indices rebuilt")
     
     # ==================== Statistics ====================
     
     def get_stats(self) -> dict:
-        """Get world statistics"""
+        """Get world statistics (O(1) - every figure is a maintained counter)"""
         return {
             "world_name": self.world_name,
             "current_tick": self.current_tick,
             "characters": {
                 "total": len(self.characters),
-                "active": len(self.get_active_characters())
+                "active": self._char_columns.active_count
             },
             "locations": len(self.locations),
             "factions": len(self.factions),
             "events": {
                 "total": len(self.events),
-                "active": len([e for e in self.events.values() 
-                              if e.status == EventStatus.ACTIVE])
+                "active": self.active_event_count
+            },
+            "epistemic": {
+                "objective_facts": len(self.objective_world.fact_log),
+                "information_artifacts": len(self.artifact_store.artifacts),
             }
-        }
\ No newline at end of file
+        }
@@ -1,16 +1,30 @@
 """
 WorldCharacter - extends the existing PsychologicalProfile for world simulation
 """
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
 from typing import List, Dict, Optional
 from enum import Enum
-import sys
 from pathlib import Path
 
-# Import from existing framework
-sys.path.append(str(Path(__file__).parent.parent.parent))
+import orjson
+
+# Import from existing framework (repo root must be importable, as for src.llm_client)
 from src.schema import PsychologicalProfile, MotivationalState
 
+# Parsed profiles shared across characters (each character pins its own copy)
+PROFILE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _read_profile(profile_path: str) -> Optional[PsychologicalProfile]:
+    """Parse a character.json profile; None if the file doesn't exist"""
+    path = Path(profile_path)
+    if not path.exists():
+        return None
+    return PsychologicalProfile(**orjson.loads(path.read_bytes()))
+
 
 class CharacterState(str, Enum):
     """Physical/activity state of character"""
@@ -23,6 +37,22 @@ class CharacterState(str, Enum):
     EXPLORING = "exploring"
 
 
+@dataclass(slots=True)
+class CharacterRuntime:
+    """
+    Per-tick mutable character fields.
+    Validated when a WorldCharacter is built; plain slot writes afterwards.
+    """
+    location_id: str
+    state: CharacterState = CharacterState.IDLE
+    destination: Optional[str] = None
+    last_action_tick: int = 0
+    interacting_with: List[str] = field(default_factory=list)
+
+
+_RUNTIME_FIELDS = ("location_id", "state", "destination", "last_action_tick", "interacting_with")
+
+
 class WorldCharacter(BaseModel):
     """
     World-level character representation.
@@ -36,24 +66,17 @@ class WorldCharacter(BaseModel):
         description="Path to character.json with PsychologicalProfile"
     )
     
-    # Loaded profile (not serialized, loaded at runtime)
-    profile: Optional[PsychologicalProfile] = Field(
-        default=None,
-        exclude=True,
-        description="Loaded psychological profile"
-    )
+    # Loaded profile (not serialized) - read on first access, see `profile`
+    _profile: Optional[PsychologicalProfile] = PrivateAttr(default=None)
     motivational_state: Optional[MotivationalState] = Field(
         default=None,
         exclude=True,
         description="Current motivational state"
     )
     
-    # Physical state
-    location_id: str = Field(..., description="Current location ID")
-    state: CharacterState = Field(
-        default=CharacterState.IDLE,
-        description="What the character is currently doing"
-    )
+    # Hot per-tick state (location, activity, interactions)
+    # Exposed below as location_id/state/... and serialized flat
+    runtime: CharacterRuntime = Field(..., exclude=True)
     
     # Goals & Planning (autonomous)
     active_goals: List[str] = Field(
@@ -64,20 +87,6 @@ class WorldCharacter(BaseModel):
         default=None,
         description="Current action plan"
     )
-    destination: Optional[str] = Field(
-        default=None,
-        description="Where character is heading (if traveling)"
-    )
-    
-    # Interaction state
-    interacting_with: List[str] = Field(
-        default_factory=list,
-        description="Character IDs currently interacting with"
-    )
-    last_action_tick: int = Field(
-        default=0,
-        description="When character last did something significant"
-    )
     
     # Metadata
     is_active: bool = Field(
@@ -85,12 +94,77 @@ class WorldCharacter(BaseModel):
         description="Whether character is actively simulated"
     )
     
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_runtime(cls, data):
+        """Accept the flat layout (location_id=..., state=...) used on disk"""
+        if isinstance(data, dict) and "runtime" not in data:
+            data = dict(data)
+            data["runtime"] = {k: data.pop(k) for k in _RUNTIME_FIELDS if k in data}
+        return data
+    
+    @property
+    def profile(self) -> Optional[PsychologicalProfile]:
+        """
+        Psychological profile, read from profile_path on first access.
+        The file is parsed once per path (shared LRU, PROFILE_CACHE_SIZE)
+        and this character pins its own copy, so changes stay with it.
+        Hot paths should check has_profile, which never reads the file.
+        """
+        if self._profile is None:
+            shared = _read_profile(self.profile_path)
+            if shared is not None:
+                self._profile = shared.model_copy(deep=True)
+        return self._profile
+    
+    @property
+    def has_profile(self) -> bool:
+        """Whether a profile has been loaded or assigned (no disk access)"""
+        return self._profile is not None
+    
+    @profile.setter
+    def profile(self, value: Optional[PsychologicalProfile]) -> None:
+        self._profile = value
+    
+    # ==================== Runtime Fields ====================
+    
+    # Read-only: WorldState mirrors these into its column store, indices
+    # and WAL, so change them through update_character_status /
+    # move_character rather than on the model
+    
+    @computed_field(description="Current location ID")
+    @property
+    def location_id(self) -> str:
+        return self.runtime.location_id
+    
+    @computed_field(description="What the character is currently doing")
+    @property
+    def state(self) -> CharacterState:
+        return self.runtime.state
+    
+    @computed_field(description="Where character is heading (if traveling)")
+    @property
+    def destination(self) -> Optional[str]:
+        return self.runtime.destination
+    
+    @computed_field(description="When character last did something significant")
+    @property
+    def last_action_tick(self) -> int:
+        return self.runtime.last_action_tick
+    
+    @computed_field(description="Character IDs currently interacting with")
+    @property
+    def interacting_with(self) -> List[str]:
+        return self.runtime.interacting_with
+    
     def load_profile(self, memory_store, knowledge_graph):
         """Load the character's psychological profile"""
-        import json
-        with open(self.profile_path, 'r') as f:
-            data = json.load(f)
-            self.profile = PsychologicalProfile(**data)
+        # Parsed once per path and shared; this character pins its own copy
+        # so changes it makes (and save_profile writes) don't leak into others
+        shared = _read_profile(self.profile_path)
+        if shared is None:
+            raise FileNotFoundError(self.profile_path)
+        self.profile = shared.model_copy(deep=True)
         
         # Initialize motivational state if not present
         if not self.motivational_state:
@@ -99,13 +173,16 @@ class WorldCharacter(BaseModel):
     
     def save_profile(self):
         """Save any changes to the psychological profile"""
-        if self.profile:
+        if self._profile is not None:
             import json
             with open(self.profile_path, 'w') as f:
                 json.dump(self.profile.dict(), f, indent=2)
+            # The shared parse of this path is now stale
+            _read_profile.cache_clear()
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": "aang",
                 "profile_path": "data/characters/aang.json",
@@ -114,4 +191,5 @@ class WorldCharacter(BaseModel):
                 "active_goals": ["Master all elements", "Stop the Fire Nation"],
                 "is_active": True
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Event entity - represents things happening in the world
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional, Any
 from enum import Enum
 
@@ -84,8 +84,9 @@ class Event(BaseModel):
         description="public, private, secret"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": "evt_001",
                 "type": "character_interaction",
@@ -97,4 +98,5 @@ class Event(BaseModel):
                 "description": "A chance encounter that will change everything",
                 "priority": 1
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
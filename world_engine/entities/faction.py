@@ -1,34 +1,126 @@
 """
 Faction entity - represents groups, nations, organizations
 """
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
-from enum import Enum
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Dict, Optional, Set
+from enum import IntEnum
 
+import numpy as np
 
-class FactionType(str, Enum):
-    """Types of factions"""
-    NATION = "nation"
-    ORGANIZATION = "organization"
-    TRIBE = "tribe"
-    GUILD = "guild"
-    CULT = "cult"
-    FAMILY = "family"
+from ..utils.adjacency_table import AdjacencyTable
 
 
-class FactionRelation(str, Enum):
-    """How factions relate to each other"""
-    ALLIED = "allied"
-    FRIENDLY = "friendly"
-    NEUTRAL = "neutral"
-    SUSPICIOUS = "suspicious"
-    HOSTILE = "hostile"
-    AT_WAR = "at_war"
+class FactionType(IntEnum):
+    """Types of factions (serialized as the lowercase name)"""
+    NATION = 0
+    ORGANIZATION = 1
+    TRIBE = 2
+    GUILD = 3
+    CULT = 4
+    FAMILY = 5
 
 
-class Faction(BaseModel):
+class FactionRelation(IntEnum):
+    """
+    How factions relate to each other, friendliest first
+    (serialized as the lowercase name).
+    """
+    ALLIED = 0
+    FRIENDLY = 1
+    NEUTRAL = 2
+    SUSPICIOUS = 3
+    HOSTILE = 4
+    AT_WAR = 5
+
+
+def _parse_enum(enum_cls, value):
+    """Accept wire names ("at_war") as well as members/ints"""
+    if isinstance(value, str):
+        return enum_cls[value.upper()]
+    return value
+
+
+def _relation_table(items: Optional[Dict[str, FactionRelation]] = None) -> AdjacencyTable:
+    return AdjacencyTable(items, dtype=np.int8, value_type=FactionRelation)
+
+
+@dataclass(slots=True)
+class Faction:
     """A group with shared goals and identity"""
     
+    # Identity
+    id: str
+    name: str
+    type: FactionType
+    
+    # Description
+    description: str = ""
+    ideology: str = ""  # Core beliefs and values
+    
+    # Power & Resources
+    power_level: float = 50.0  # Overall influence/strength (0-100)
+    resources: Dict[str, int] = field(default_factory=dict)
+    
+    # Territory
+    controlled_locations: Set[str] = field(default_factory=set)
+    
+    # Members
+    members: Set[str] = field(default_factory=set)  # Character IDs
+    leader_id: Optional[str] = None
+    
+    # Relations
+    relations: AdjacencyTable = field(default_factory=_relation_table)  # faction_id -> FactionRelation
+    
+    # Goals
+    goals: List[str] = field(default_factory=list)
+    
+    # State
+    is_active: bool = True  # Whether faction still exists
+    
+    def __post_init__(self):
+        if not isinstance(self.controlled_locations, set):
+            self.controlled_locations = set(self.controlled_locations)
+        if not isinstance(self.members, set):
+            self.members = set(self.members)
+        if not isinstance(self.relations, AdjacencyTable):
+            self.relations = _relation_table(self.relations)
+    
+    def factions_with(self, relation: FactionRelation) -> List[str]:
+        """IDs of factions this one has the given relation with"""
+        return self.relations.keys_with_value(relation)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Faction":
+        """Build from JSON data, validated through FactionSchema"""
+        schema = FactionSchema.model_validate(data)
+        return cls(**{name: getattr(schema, name) for name in cls.__dataclass_fields__})
+    
+    def to_dict(self) -> dict:
+        """JSON-ready dict (inverse of from_dict)"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type.name.lower(),
+            "description": self.description,
+            "ideology": self.ideology,
+            "power_level": self.power_level,
+            "resources": dict(self.resources),
+            "controlled_locations": sorted(self.controlled_locations),  # Stable files
+            "members": sorted(self.members),
+            "leader_id": self.leader_id,
+            "relations": {fid: rel.name.lower() for fid, rel in self.relations.items()},
+            "goals": list(self.goals),
+            "is_active": self.is_active,
+        }
+
+
+class FactionSchema(BaseModel):
+    """
+    Validated JSON form of a Faction.
+    Only used at ingest (loading from disk/API); the world holds Faction.
+    """
+    
     # Identity
     id: str = Field(..., description="Unique identifier")
     name: str = Field(..., description="Display name")
@@ -57,14 +149,14 @@ class Faction(BaseModel):
     )
     
     # Territory
-    controlled_locations: List[str] = Field(
-        default_factory=list,
+    controlled_locations: Set[str] = Field(
+        default_factory=set,
         description="Location IDs under faction control"
     )
     
     # Members
-    members: List[str] = Field(
-        default_factory=list,
+    members: Set[str] = Field(
+        default_factory=set,
         description="Character IDs who are members"
     )
     leader_id: Optional[str] = Field(
@@ -90,8 +182,21 @@ class Faction(BaseModel):
         description="Whether faction still exists"
     )
     
-    class Config:
-        json_schema_extra = {
+    @field_validator("type", mode="before")
+    @classmethod
+    def _parse_type(cls, value):
+        return _parse_enum(FactionType, value)
+    
+    @field_validator("relations", mode="before")
+    @classmethod
+    def _parse_relations(cls, value):
+        if isinstance(value, dict):
+            return {fid: _parse_enum(FactionRelation, rel) for fid, rel in value.items()}
+        return value
+    
+    model_config = ConfigDict(
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": "fire_nation",
                 "name": "Fire Nation",
@@ -107,4 +212,5 @@ class Faction(BaseModel):
                 },
                 "goals": ["Conquer the world", "Eliminate the Avatar"]
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
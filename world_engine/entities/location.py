@@ -1,13 +1,76 @@
 """
 Location entity - represents places in the world
 """
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Dict, Optional, Set, Tuple
 
+from ..utils.adjacency_table import AdjacencyTable
 
-class Location(BaseModel):
+
+@dataclass(slots=True)
+class Location:
     """A place in the world where characters can be"""
     
+    id: str
+    name: str
+    type: str  # city, wilderness, dungeon, etc.
+    
+    # Spatial data
+    coordinates: Tuple[float, float] = (0.0, 0.0)  # (latitude, longitude)
+    
+    # State
+    occupants: Set[str] = field(default_factory=set)  # Character IDs here
+    active_events: List[str] = field(default_factory=list)  # Event IDs here
+    
+    # Descriptive
+    description: str = ""
+    atmosphere: str = "neutral"  # peaceful, tense, chaotic, etc.
+    
+    # Resources/Properties
+    resources: Dict[str, int] = field(default_factory=dict)
+    faction_control: Optional[str] = None
+    
+    # Connections
+    connected_to: Set[str] = field(default_factory=set)  # Accessible location IDs
+    travel_times: AdjacencyTable = field(default_factory=AdjacencyTable)  # Ticks to each connection
+    
+    def __post_init__(self):
+        if not isinstance(self.connected_to, set):
+            self.connected_to = set(self.connected_to)
+        if not isinstance(self.travel_times, AdjacencyTable):
+            self.travel_times = AdjacencyTable(self.travel_times)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "Location":
+        """Build from JSON data, validated through LocationSchema"""
+        schema = LocationSchema.model_validate(data)
+        return cls(**{name: getattr(schema, name) for name in cls.__dataclass_fields__})
+    
+    def to_dict(self) -> dict:
+        """JSON-ready dict (inverse of from_dict)"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "coordinates": list(self.coordinates),
+            "occupants": sorted(self.occupants),  # Stable files
+            "active_events": list(self.active_events),
+            "description": self.description,
+            "atmosphere": self.atmosphere,
+            "resources": dict(self.resources),
+            "faction_control": self.faction_control,
+            "connected_to": sorted(self.connected_to),
+            "travel_times": dict(self.travel_times),
+        }
+
+
+class LocationSchema(BaseModel):
+    """
+    Validated JSON form of a Location.
+    Only used at ingest (loading from disk/API); the world holds Location.
+    """
+    
     id: str = Field(..., description="Unique identifier")
     name: str = Field(..., description="Display name")
     type: str = Field(..., description="city, wilderness, dungeon, etc.")
@@ -19,8 +82,8 @@ class Location(BaseModel):
     )
     
     # State
-    occupants: List[str] = Field(
-        default_factory=list,
+    occupants: Set[str] = Field(
+        default_factory=set,
         description="Character IDs currently at this location"
     )
     active_events: List[str] = Field(
@@ -49,8 +112,8 @@ class Location(BaseModel):
     )
     
     # Connections
-    connected_to: List[str] = Field(
-        default_factory=list,
+    connected_to: Set[str] = Field(
+        default_factory=set,
         description="Location IDs that are accessible from here"
     )
     travel_times: Dict[str, int] = Field(
@@ -58,8 +121,9 @@ class Location(BaseModel):
         description="Travel time in ticks to connected locations"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": "ba_sing_se",
                 "name": "Ba Sing Se",
@@ -71,4 +135,5 @@ class Location(BaseModel):
                 "connected_to": ["omashu", "si_wong_desert"],
                 "travel_times": {"omashu": 50, "si_wong_desert": 30}
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
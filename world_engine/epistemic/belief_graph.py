@@ -3,55 +3,321 @@ Layer 3: Belief Graph
 Tracks who believes what, with what confidence, and why.
 This is where contradictions, skepticism, and trust dynamics live.
 """
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
-from enum import Enum
+from bisect import bisect_left, insort
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from enum import IntEnum
 import logging
 
+import numpy as np
+import orjson
+
 from .information_artifacts import InformationArtifact, ReliabilityLevel
+from ..utils.id_interner import IdInterner
 
 logger = logging.getLogger(__name__)
 
 
-class BeliefState(str, Enum):
-    """How strongly a character believes something"""
-    CONVINCED = "convinced"           # Absolutely believes it
-    CONFIDENT = "confident"           # Strongly believes it
-    LEANING_TRUE = "leaning_true"     # Probably believes it
-    UNCERTAIN = "uncertain"           # No strong opinion
-    LEANING_FALSE = "leaning_false"   # Probably disbelieves it
-    SKEPTICAL = "skeptical"           # Strongly disbelieves it
-    REJECTED = "rejected"             # Absolutely disbelieves it
+class BeliefState(IntEnum):
+    """
+    How strongly a character believes something.
+    Ordered strongest to weakest; the value is the int8 code stored in
+    the belief columns and the lowercase name is the wire format.
+    """
+    CONVINCED = 0       # Absolutely believes it
+    CONFIDENT = 1       # Strongly believes it
+    LEANING_TRUE = 2    # Probably believes it
+    UNCERTAIN = 3       # No strong opinion
+    LEANING_FALSE = 4   # Probably disbelieves it
+    SKEPTICAL = 5       # Strongly disbelieves it
+    REJECTED = 6        # Absolutely disbelieves it
+
+
+# Code -> member, for turning int8 column values back into BeliefState
+_BELIEF_STATES: Tuple[BeliefState, ...] = tuple(BeliefState)
+_STATE_NAMES: Tuple[str, ...] = tuple(state.name.lower() for state in BeliefState)
+
+# Weakened state after a contradiction, indexed by BeliefState value
+_ADJUST_LUT = np.array([1, 2, 3, 3, 5, 6, 6], dtype=np.int8)
+_ADJUSTED_STATES: Tuple[BeliefState, ...] = tuple(_BELIEF_STATES[code] for code in _ADJUST_LUT)
+
+# State shifts after evidence: (confidence threshold, from state, to state).
+# Reinforcing applies when confidence > threshold, challenging when
+# confidence < threshold; at most one row matches (the from states differ).
+_REINFORCE_TRANSITIONS: Tuple[Tuple[float, BeliefState, BeliefState], ...] = (
+    (0.9, BeliefState.CONFIDENT, BeliefState.CONVINCED),
+    (0.7, BeliefState.LEANING_TRUE, BeliefState.CONFIDENT),
+)
+_CHALLENGE_TRANSITIONS: Tuple[Tuple[float, BeliefState, BeliefState], ...] = (
+    (0.3, BeliefState.CONFIDENT, BeliefState.LEANING_TRUE),
+    (0.5, BeliefState.CONVINCED, BeliefState.CONFIDENT),
+)
+
+
+class _CharBeliefColumns:
+    """
+    One character's beliefs as parallel arrays, one row per artifact.
+    Scans over confidence/state touch contiguous arrays instead of
+    every Belief object. Artifacts are keyed by interned handle.
+    """
+    __slots__ = (
+        "artifact_index", "rows", "artifact_handle",
+        "confidence", "state", "times_reinforced", "times_challenged",
+        "formed_tick", "updated_tick"
+    )
+    
+    # Every numpy column (all share one row numbering)
+    COLUMNS = (
+        "artifact_handle", "confidence", "state", "times_reinforced",
+        "times_challenged", "formed_tick", "updated_tick"
+    )
+    
+    def __init__(self, capacity: int = 8):
+        self.artifact_index: Dict[int, int] = {}  # artifact handle -> row
+        self.rows: List[Optional["Belief"]] = []  # Belief view per row
+        
+        self.artifact_handle = np.zeros(capacity, dtype=np.uint32)
+        # float64 so thresholds compare exactly as they did on floats
+        self.confidence = np.zeros(capacity, dtype=np.float64)
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.times_reinforced = np.zeros(capacity, dtype=np.int32)
+        self.times_challenged = np.zeros(capacity, dtype=np.int32)
+        self.formed_tick = np.zeros(capacity, dtype=np.int32)
+        self.updated_tick = np.zeros(capacity, dtype=np.int32)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def row_for(self, artifact_handle: int) -> int:
+        """Row of an artifact, appending a zeroed one if it is new"""
+        row = self.artifact_index.get(artifact_handle)
+        if row is not None:
+            return row
+        
+        row = len(self.rows)
+        if row == len(self.confidence):
+            self._grow()
+        self.artifact_handle[row] = artifact_handle
+        self.artifact_index[artifact_handle] = row
+        self.rows.append(None)
+        return row
+    
+    def _grow(self) -> None:
+        """Double capacity of every column"""
+        capacity = len(self.confidence) * 2
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+    
+    def remove_row(self, row: int) -> None:
+        """Drop a row by moving the last row into its place"""
+        last = len(self.rows) - 1
+        del self.artifact_index[int(self.artifact_handle[row])]
+        if row != last:
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.rows[last]
+            self.rows[row] = moved
+            moved._row = row
+            self.artifact_index[int(self.artifact_handle[row])] = row
+        self.rows.pop()
+
+
+# Numeric score per ReliabilityLevel, indexed by its value
+_RELIABILITY_SCORES: Tuple[float, ...] = (1.0, 0.85, 0.7, 0.5, 0.3, 0.1)
+
+# Score band boundaries (ascending) and the state for each band
+_SCORE_THRESHOLDS: Tuple[float, ...] = (0.1, 0.3, 0.45, 0.55, 0.7, 0.9)
+_STATES_BY_BAND: Tuple[BeliefState, ...] = tuple(reversed(BeliefState))
+
+# Shared zero-row columns for characters with no beliefs yet (never written)
+_EMPTY_COLUMNS = _CharBeliefColumns(capacity=0)
+
+
+# ==================== Contradiction pairs ====================
+# An unordered pair of artifact handles packed into one int:
+# (higher << 32) | lower. Hashing/comparing it is a single word op.
+
+_PAIR_MASK = 0xFFFFFFFF
+
+
+def _pair(handle_a: int, handle_b: int) -> int:
+    if handle_a < handle_b:
+        handle_a, handle_b = handle_b, handle_a
+    return (handle_a << 32) | handle_b
+
+
+# ==================== Column update kernels ====================
+# Vectorized forms of update_belief's arithmetic. Each takes DISTINCT rows;
+# _unique_passes splits a row list with repeats into passes that replay
+# the repeats in order.
+
+def _unique_passes(rows: np.ndarray):
+    """Yield distinct-row batches; the k-th occurrence of a row is in pass k"""
+    while rows.size:
+        uniq, first = np.unique(rows, return_index=True)
+        yield uniq
+        rows = np.delete(rows, first)
+
+
+def _reinforce_rows(cols: _CharBeliefColumns, rows: np.ndarray) -> None:
+    """+0.1 confidence (capped at 1), count it, and strengthen the state"""
+    confidence = np.minimum(1.0, cols.confidence[rows] + 0.1)
+    cols.confidence[rows] = confidence
+    cols.times_reinforced[rows] += 1
+    
+    state = cols.state[rows]
+    new_state = state.copy()
+    for threshold, from_state, to_state in _REINFORCE_TRANSITIONS:
+        new_state[(confidence > threshold) & (state == from_state)] = to_state
+    cols.state[rows] = new_state
+
+
+def _challenge_rows(cols: _CharBeliefColumns, rows: np.ndarray) -> None:
+    """-0.15 confidence (floored at 0), count it, and weaken the state"""
+    confidence = np.maximum(0.0, cols.confidence[rows] - 0.15)
+    cols.confidence[rows] = confidence
+    challenged = cols.times_challenged[rows] + 1
+    cols.times_challenged[rows] = challenged
+    
+    state = cols.state[rows]
+    new_state = state.copy()
+    for threshold, from_state, to_state in _CHALLENGE_TRANSITIONS:
+        new_state[(confidence < threshold) & (state == from_state)] = to_state
+    # Challenged too many times - may flip
+    new_state[challenged >= 3] = BeliefState.UNCERTAIN
+    cols.state[rows] = new_state
 
 
-@dataclass
 class Belief:
     """
     A character's belief about a specific artifact.
     
     This is NOT the same as the artifact itself.
     Multiple characters can have different beliefs about the same artifact.
+    
+    Numeric fields live in the owning character's belief columns; this
+    object is a view onto its row.
     """
-    character_id: str
-    artifact_id: str
-    belief_state: BeliefState
-    confidence: float  # 0.0-1.0
+    __slots__ = ("character_id", "artifact_id", "justification", "based_on", "_cols", "_row")
     
-    # Why they believe this
-    justification: str
-    based_on: List[str] = field(default_factory=list)  # Other artifact IDs that support this
+    def __init__(
+        self,
+        character_id: str,
+        artifact_id: str,
+        belief_state: BeliefState,
+        confidence: float,  # 0.0-1.0
+        justification: str,  # Why they believe this
+        based_on: Optional[List[str]] = None,  # Other artifact IDs that support this
+        formed_at_tick: int = 0,
+        last_updated_tick: int = 0,
+        times_reinforced: int = 0,
+        times_challenged: int = 0
+    ):
+        # Standalone belief - backed by its own single-row columns
+        # (no graph, so no interner; the handle is unused)
+        cols = _CharBeliefColumns(capacity=1)
+        self._bind(cols, cols.row_for(0), character_id, artifact_id, justification)
+        if based_on is not None:
+            self.based_on = based_on
+        
+        self.belief_state = belief_state
+        self.confidence = confidence
+        self.formed_at_tick = formed_at_tick
+        self.last_updated_tick = last_updated_tick
+        self.times_reinforced = times_reinforced
+        self.times_challenged = times_challenged
     
-    # Lifecycle
-    formed_at_tick: int = 0
-    last_updated_tick: int = 0
-    times_reinforced: int = 0
-    times_challenged: int = 0
+    @classmethod
+    def _at_row(
+        cls,
+        cols: _CharBeliefColumns,
+        row: int,
+        character_id: str,
+        artifact_id: str,
+        justification: str
+    ) -> "Belief":
+        """
+        View onto a row the graph has already filled in.
+        Re-forming a belief reuses the row's existing view; otherwise a
+        retired view is taken from the pool.
+        """
+        belief = cols.rows[row]
+        if belief is None:
+            belief = _BeliefPool.acquire()
+        belief._bind(cols, row, character_id, artifact_id, justification)
+        return belief
+    
+    def _bind(self, cols, row, character_id, artifact_id, justification) -> None:
+        self.character_id = character_id
+        self.artifact_id = artifact_id
+        self.justification = justification
+        self.based_on = []
+        self._cols = cols
+        self._row = row
+        cols.rows[row] = self
+    
+    @property
+    def confidence(self) -> float:
+        return float(self._cols.confidence[self._row])
+    
+    @confidence.setter
+    def confidence(self, value: float) -> None:
+        self._cols.confidence[self._row] = value
+    
+    @property
+    def belief_state(self) -> BeliefState:
+        return _BELIEF_STATES[self._cols.state[self._row]]
+    
+    @belief_state.setter
+    def belief_state(self, value: BeliefState) -> None:
+        self._cols.state[self._row] = value
+    
+    @property
+    def formed_at_tick(self) -> int:
+        return int(self._cols.formed_tick[self._row])
+    
+    @formed_at_tick.setter
+    def formed_at_tick(self, value: int) -> None:
+        self._cols.formed_tick[self._row] = value
+    
+    @property
+    def last_updated_tick(self) -> int:
+        return int(self._cols.updated_tick[self._row])
+    
+    @last_updated_tick.setter
+    def last_updated_tick(self, value: int) -> None:
+        self._cols.updated_tick[self._row] = value
+    
+    @property
+    def times_reinforced(self) -> int:
+        return int(self._cols.times_reinforced[self._row])
+    
+    @times_reinforced.setter
+    def times_reinforced(self, value: int) -> None:
+        self._cols.times_reinforced[self._row] = value
+    
+    @property
+    def times_challenged(self) -> int:
+        return int(self._cols.times_challenged[self._row])
+    
+    @times_challenged.setter
+    def times_challenged(self, value: int) -> None:
+        self._cols.times_challenged[self._row] = value
+    
+    def __repr__(self) -> str:
+        return (
+            f"Belief(character_id={self.character_id!r}, artifact_id={self.artifact_id!r}, "
+            f"belief_state={self.belief_state!r}, confidence={self.confidence!r})"
+        )
     
     def to_dict(self) -> dict:
         return {
             "character_id": self.character_id,
             "artifact_id": self.artifact_id,
-            "belief_state": self.belief_state.value,
+            "belief_state": _STATE_NAMES[self._cols.state[self._row]],
             "confidence": self.confidence,
             "justification": self.justification,
             "based_on": self.based_on,
@@ -62,6 +328,30 @@ class Belief:
         }
 
 
+class _BeliefPool:
+    """
+    Freelist of retired Belief views (see BeliefGraph.remove_belief),
+    reused before allocating new ones.
+    """
+    MAX_FREE = 10_000
+    _free: List[Belief] = []
+    
+    @classmethod
+    def acquire(cls) -> Belief:
+        """An unbound Belief shell; the caller must _bind it"""
+        if cls._free:
+            return cls._free.pop()
+        return Belief.__new__(Belief)
+    
+    @classmethod
+    def release(cls, belief: Belief) -> None:
+        # Drop references so a pooled view doesn't pin its old columns
+        belief._cols = None
+        belief.based_on = []
+        if len(cls._free) < cls.MAX_FREE:
+            cls._free.append(belief)
+
+
 class BeliefGraph:
     """
     Tracks all character beliefs about information artifacts.
@@ -74,11 +364,32 @@ class BeliefGraph:
     """
     
     def __init__(self):
-        # character_id -> artifact_id -> Belief
-        self.beliefs: Dict[str, Dict[str, Belief]] = {}
+        # (character_id, artifact_id) -> Belief; per-character enumeration
+        # goes through the belief columns instead
+        self.beliefs: Dict[Tuple[str, str], Belief] = {}
+        
+        # Interned character and artifact IDs (one handle space for both)
+        self._ids = IdInterner()
+        
+        # character handle -> numeric belief fields as columns (Belief objects are row views)
+        self._columns: Dict[int, _CharBeliefColumns] = {}
         
         # Track contradictory beliefs
-        self.contradictions: Dict[str, Set[Tuple[str, str]]] = {}  # character_id -> set of (artifact_id, artifact_id)
+        # character handle -> packed artifact-handle pairs (see _pair)
+        self.contradictions: Dict[int, Set[int]] = {}
+        
+        # Bumped on every mutation so callers can invalidate derived caches
+        self.version = 0
+        
+        # (character_id, subject) -> [(-confidence, seq, artifact_id)], kept sorted
+        # so the strongest belief about a subject is found without a full scan
+        self._by_confidence: Dict[Tuple[str, str], List[Tuple[float, int, str]]] = {}
+        self._confidence_entry: Dict[Tuple[str, str], Tuple[float, int, str]] = {}  # (character_id, artifact_id) -> entry
+        self._artifact_subject: Dict[str, str] = {}  # artifact_id -> subject
+        
+        # character_id -> subject -> artifact IDs believed about that subject
+        self.by_subject: Dict[str, Dict[str, Set[str]]] = {}
+        self._entry_seq = 0
         
     def form_belief(
         self,
@@ -109,6 +420,16 @@ class BeliefGraph:
         reliability_score = self._reliability_to_score(artifact.reliability)
         combined_score = (reliability_score * 0.5 + trust_in_source * 0.5) * (1 - base_skepticism)
         
+        return self._form_scored_belief(character_id, artifact, current_tick, combined_score)
+    
+    def _form_scored_belief(
+        self,
+        character_id: str,
+        artifact: InformationArtifact,
+        current_tick: int,
+        combined_score: float
+    ) -> Belief:
+        """Store a belief whose combined score is already computed"""
         belief_state, confidence = self._score_to_belief_state(combined_score)
         
         # Check for contradictions with existing beliefs
@@ -122,35 +443,123 @@ class BeliefGraph:
         else:
             justification = f"Based on {artifact.artifact_type.value} from {artifact.source}"
         
-        belief = Belief(
-            character_id=character_id,
-            artifact_id=artifact.artifact_id,
-            belief_state=belief_state,
-            confidence=confidence,
-            justification=justification,
-            formed_at_tick=current_tick,
-            last_updated_tick=current_tick
-        )
+        # Store belief - (re)forming overwrites the artifact's row
+        intern = self._ids.intern
+        char_handle = intern(character_id)
+        cols = self._columns.get(char_handle)
+        if cols is None:
+            cols = self._columns[char_handle] = _CharBeliefColumns()
+        artifact_handle = intern(artifact.artifact_id)
+        row = cols.row_for(artifact_handle)
+        cols.confidence[row] = confidence
+        cols.state[row] = belief_state
+        cols.times_reinforced[row] = 0
+        cols.times_challenged[row] = 0
+        cols.formed_tick[row] = current_tick
+        cols.updated_tick[row] = current_tick
         
-        # Store belief
-        if character_id not in self.beliefs:
-            self.beliefs[character_id] = {}
-        self.beliefs[character_id][artifact.artifact_id] = belief
+        artifact_id = artifact.artifact_id
+        belief = Belief._at_row(cols, row, character_id, artifact_id, justification)
+        
+        # Per-character containers are looked up once and reused
+        char_subjects = self.by_subject.get(character_id)
+        if char_subjects is None:
+            char_subjects = self.by_subject[character_id] = {}
+        
+        self.version += 1
+        self.beliefs[(character_id, artifact_id)] = belief
+        self._artifact_subject[artifact_id] = artifact.subject
+        subject_ids = char_subjects.get(artifact.subject)
+        if subject_ids is None:
+            subject_ids = char_subjects[artifact.subject] = set()
+        subject_ids.add(artifact_id)
+        self._index_confidence(belief)
         
         # Track contradictions
         if existing_contradictions:
-            if character_id not in self.contradictions:
-                self.contradictions[character_id] = set()
+            char_contradictions = self.contradictions.get(char_handle)
+            if char_contradictions is None:
+                char_contradictions = self.contradictions[char_handle] = set()
+            get_handle = self._ids.get
             for contra_id in existing_contradictions:
-                self.contradictions[character_id].add((artifact.artifact_id, contra_id))
+                char_contradictions.add(_pair(artifact_handle, get_handle(contra_id)))
         
         logger.debug(
-            f"💭 {character_id} formed belief: {belief_state.value} "
-            f"(confidence: {confidence:.2f}) about {artifact.claim}"
+            "💭 %s formed belief: %s (confidence: %.2f) about %s",
+            character_id, _STATE_NAMES[belief_state], confidence, artifact.claim
         )
         
         return belief
     
+    def form_beliefs_bulk(
+        self,
+        entries: List[Tuple[str, InformationArtifact, float, float]],
+        current_tick: int
+    ) -> List[Belief]:
+        """
+        Form many beliefs in one call.
+        
+        Args:
+            entries: (character_id, artifact, trust_in_source, base_skepticism)
+            current_tick: When this happens
+            
+        Returns:
+            The formed beliefs, in input order
+        """
+        if not entries:
+            return []
+        
+        # Score every entry in one vectorized pass (same arithmetic and
+        # operation order as form_belief, so results are identical)
+        to_score = self._reliability_to_score
+        reliability = np.fromiter(
+            (to_score(artifact.reliability) for _, artifact, _, _ in entries),
+            dtype=np.float64,
+            count=len(entries)
+        )
+        trust = np.fromiter((e[2] for e in entries), dtype=np.float64, count=len(entries))
+        skepticism = np.fromiter((e[3] for e in entries), dtype=np.float64, count=len(entries))
+        scores = ((reliability * 0.5 + trust * 0.5) * (1 - skepticism)).tolist()
+        
+        form = self._form_scored_belief
+        return [
+            form(character_id, artifact, current_tick, score)
+            for (character_id, artifact, _, _), score in zip(entries, scores)
+        ]
+    
+    def form_beliefs_from_artifact(
+        self,
+        character_ids: List[str],
+        artifact: InformationArtifact,
+        current_tick: int,
+        trusts: List[float],
+        base_skepticisms: Optional[List[float]] = None
+    ) -> List[Belief]:
+        """
+        Have many characters form beliefs about the same artifact
+        (e.g. a broadcast rumor). Reliability is scored once.
+        
+        Args:
+            character_ids: Who is forming beliefs
+            artifact: The shared information artifact
+            current_tick: When this happens
+            trusts: Each character's trust in the source (0-1)
+            base_skepticisms: Each character's skepticism (0-1), default 0.3
+            
+        Returns:
+            The formed beliefs, in input order
+        """
+        if base_skepticisms is None:
+            base_skepticisms = [0.3] * len(character_ids)
+        
+        reliability_half = self._reliability_to_score(artifact.reliability) * 0.5
+        form = self._form_scored_belief
+        return [
+            form(character_id, artifact, current_tick,
+                 (reliability_half + trust * 0.5) * (1 - skepticism))
+            for character_id, trust, skepticism in zip(character_ids, trusts, base_skepticisms)
+        ]
+    
     def update_belief(
         self,
         character_id: str,
@@ -172,56 +581,148 @@ class BeliefGraph:
         Returns:
             Updated belief or None if belief doesn't exist
         """
-        if character_id not in self.beliefs:
-            return None
-        
-        belief = self.beliefs[character_id].get(artifact_id)
+        belief = self.beliefs.get((character_id, artifact_id))
         if not belief:
             return None
         
+        self.version += 1
+        
         if reinforces:
             # Evidence supports the belief - increase confidence
-            belief.confidence = min(1.0, belief.confidence + 0.1)
+            self._set_confidence(belief, min(1.0, belief.confidence + 0.1))
             belief.times_reinforced += 1
             belief.based_on.append(new_evidence.artifact_id)
             
             # May shift belief state stronger
-            if belief.confidence > 0.9 and belief.belief_state == BeliefState.CONFIDENT:
-                belief.belief_state = BeliefState.CONVINCED
-            elif belief.confidence > 0.7 and belief.belief_state == BeliefState.LEANING_TRUE:
-                belief.belief_state = BeliefState.CONFIDENT
+            confidence, state = belief.confidence, belief.belief_state
+            for threshold, from_state, to_state in _REINFORCE_TRANSITIONS:
+                if state is from_state and confidence > threshold:
+                    belief.belief_state = to_state
+                    break
             
-            logger.debug(f"✅ {character_id}'s belief reinforced: {artifact_id}")
+            logger.debug("✅ %s's belief reinforced: %s", character_id, artifact_id)
         else:
             # Evidence challenges the belief - decrease confidence
-            belief.confidence = max(0.0, belief.confidence - 0.15)
+            self._set_confidence(belief, max(0.0, belief.confidence - 0.15))
             belief.times_challenged += 1
             
             # May shift belief state weaker
-            if belief.confidence < 0.3 and belief.belief_state == BeliefState.CONFIDENT:
-                belief.belief_state = BeliefState.LEANING_TRUE
-            elif belief.confidence < 0.5 and belief.belief_state == BeliefState.CONVINCED:
-                belief.belief_state = BeliefState.CONFIDENT
+            confidence, state = belief.confidence, belief.belief_state
+            for threshold, from_state, to_state in _CHALLENGE_TRANSITIONS:
+                if state is from_state and confidence < threshold:
+                    belief.belief_state = to_state
+                    break
             
             # If challenged too many times, may flip
             if belief.times_challenged >= 3:
                 belief.belief_state = BeliefState.UNCERTAIN
             
-            logger.debug(f"⚠️  {character_id}'s belief challenged: {artifact_id}")
+            logger.debug("⚠️  %s's belief challenged: %s", character_id, artifact_id)
         
         belief.last_updated_tick = current_tick
         
         return belief
     
+    def update_beliefs_bulk(
+        self,
+        character_id: str,
+        artifact_ids: List[str],
+        new_evidence: InformationArtifact,
+        current_tick: int,
+        reinforces: bool = True
+    ) -> List[Belief]:
+        """
+        Apply one piece of evidence to many of a character's beliefs.
+        Same result as calling update_belief for each ID in order, with
+        the arithmetic done as column operations.
+        
+        Args:
+            character_id: Whose beliefs to update
+            artifact_ids: Which beliefs to update (may repeat)
+            new_evidence: New information artifact
+            current_tick: Current tick
+            reinforces: Whether evidence supports (True) or challenges (False) the beliefs
+            
+        Returns:
+            Updated beliefs, in input order (IDs without a belief are skipped)
+        """
+        cols = self._columns_for(character_id)
+        if cols is None:
+            return []
+        
+        index = cols.artifact_index
+        get_handle = self._ids.get
+        rows = [
+            index[handle] for handle in map(get_handle, artifact_ids)
+            if handle is not None and handle in index
+        ]
+        if not rows:
+            return []
+        
+        self.version += len(rows)
+        kernel = _reinforce_rows if reinforces else _challenge_rows
+        for batch in _unique_passes(np.array(rows, dtype=np.intp)):
+            kernel(cols, batch)
+        cols.updated_tick[rows] = current_tick
+        
+        updated = [cols.rows[row] for row in rows]
+        for belief in updated:
+            if reinforces:
+                belief.based_on.append(new_evidence.artifact_id)
+            self._index_confidence(belief)
+        
+        logger.debug(
+            "%s %s: %d beliefs %s by %s",
+            "✅" if reinforces else "⚠️ ", character_id, len(rows),
+            "reinforced" if reinforces else "challenged", new_evidence.artifact_id
+        )
+        
+        return updated
+    
+    def remove_belief(self, character_id: str, artifact_id: str) -> bool:
+        """
+        Forget a belief (e.g. one superseded or resolved away).
+        The Belief object is recycled - callers must not keep using it.
+        
+        Returns:
+            True if the character held the belief
+        """
+        belief = self.beliefs.pop((character_id, artifact_id), None)
+        if belief is None:
+            return False
+        
+        self.version += 1
+        belief._cols.remove_row(belief._row)
+        
+        subject = self._artifact_subject.get(artifact_id)
+        subject_ids = self.by_subject.get(character_id, {}).get(subject)
+        if subject_ids:
+            subject_ids.discard(artifact_id)
+        
+        entry = self._confidence_entry.pop((character_id, artifact_id), None)
+        if entry is not None:
+            entries = self._by_confidence[(character_id, subject)]
+            del entries[bisect_left(entries, entry)]
+        
+        pairs = self.contradictions.get(self._ids.get(character_id))
+        if pairs:
+            handle = self._ids.get(artifact_id)
+            pairs.difference_update([
+                pair for pair in pairs
+                if pair >> 32 == handle or pair & _PAIR_MASK == handle
+            ])
+        
+        _BeliefPool.release(belief)
+        logger.debug("🗑️ %s forgot belief: %s", character_id, artifact_id)
+        return True
+    
     def get_belief(
         self,
         character_id: str,
         artifact_id: str
     ) -> Optional[Belief]:
         """Get a character's belief about a specific artifact"""
-        if character_id not in self.beliefs:
-            return None
-        return self.beliefs[character_id].get(artifact_id)
+        return self.beliefs.get((character_id, artifact_id))
     
     def get_all_beliefs(
         self,
@@ -235,19 +736,76 @@ class BeliefGraph:
             character_id: Whose beliefs
             min_confidence: Only return beliefs above this confidence
         """
-        if character_id not in self.beliefs:
+        cols = self._columns_for(character_id)
+        if cols is None:
             return []
         
-        beliefs = list(self.beliefs[character_id].values())
+        if min_confidence is None:
+            return list(cols.rows)
         
-        if min_confidence is not None:
-            beliefs = [b for b in beliefs if b.confidence >= min_confidence]
+        rows = cols.rows
+        return [rows[i] for i in self._rows_above(cols, min_confidence)]
+    
+    def get_belief_ids_above(self, character_id: str, threshold: float) -> List[str]:
+        """
+        Artifact IDs of a character's beliefs with confidence >= threshold.
+        Cheaper than get_all_beliefs when the caller only needs the IDs.
+        """
+        cols = self._columns_for(character_id)
+        if cols is None:
+            return []
+        
+        handles = cols.artifact_handle[self._rows_above(cols, threshold)]
+        return self._ids.strings(handles.tolist())
+    
+    def _columns_for(self, character_id: str) -> Optional[_CharBeliefColumns]:
+        """A character's belief columns, or None if they hold no beliefs"""
+        handle = self._ids.get(character_id)
+        return None if handle is None else self._columns.get(handle)
+    
+    @staticmethod
+    def _rows_above(cols: _CharBeliefColumns, threshold: float) -> np.ndarray:
+        """Row indices whose confidence is >= threshold"""
+        return np.flatnonzero(cols.confidence[:len(cols)] >= threshold)
+    
+    def get_strongest_belief(
+        self,
+        character_id: str,
+        about_subject: str,
+        predicate: Optional[Callable[[Belief], bool]] = None
+    ) -> Optional[Belief]:
+        """
+        Get the highest-confidence belief a character holds about a subject.
         
-        return beliefs
+        Args:
+            character_id: Whose beliefs
+            about_subject: Subject of the underlying artifacts
+            predicate: Optional filter; the first (strongest) belief that
+                passes is returned
+            
+        Returns:
+            The strongest matching belief with confidence > 0, or None
+        """
+        beliefs = self.beliefs
+        for neg_confidence, _, artifact_id in self._by_confidence.get(
+            (character_id, about_subject), ()
+        ):
+            if neg_confidence >= 0.0:
+                break  # Sorted: everything after has zero confidence
+            belief = beliefs[(character_id, artifact_id)]
+            if predicate is None or predicate(belief):
+                return belief
+        return None
     
     def get_contradictions(self, character_id: str) -> Set[Tuple[str, str]]:
-        """Get all contradictory belief pairs for a character"""
-        return self.contradictions.get(character_id, set())
+        """
+        Get all contradictory belief pairs for a character.
+        Pairs are unordered; each comes back as (newer, older) artifact ID.
+        """
+        handle = self._ids.get(character_id)
+        pairs = self.contradictions.get(handle, ()) if handle is not None else ()
+        string = self._ids.string
+        return {(string(pair >> 32), string(pair & _PAIR_MASK)) for pair in pairs}
     
     def resolve_contradiction(
         self,
@@ -271,65 +829,63 @@ class BeliefGraph:
         if not belief_a or not belief_b:
             return
         
+        self.version += 1
+        
         if favor == artifact_id_a:
             # Strengthen A, weaken B
-            belief_a.confidence = min(1.0, belief_a.confidence + 0.15)
-            belief_b.confidence = max(0.0, belief_b.confidence - 0.2)
+            self._set_confidence(belief_a, min(1.0, belief_a.confidence + 0.15))
+            self._set_confidence(belief_b, max(0.0, belief_b.confidence - 0.2))
             belief_b.belief_state = BeliefState.SKEPTICAL
         else:
             # Strengthen B, weaken A
-            belief_b.confidence = min(1.0, belief_b.confidence + 0.15)
-            belief_a.confidence = max(0.0, belief_a.confidence - 0.2)
+            self._set_confidence(belief_b, min(1.0, belief_b.confidence + 0.15))
+            self._set_confidence(belief_a, max(0.0, belief_a.confidence - 0.2))
             belief_a.belief_state = BeliefState.SKEPTICAL
         
-        # Remove from contradictions
-        if character_id in self.contradictions:
-            self.contradictions[character_id].discard((artifact_id_a, artifact_id_b))
-            self.contradictions[character_id].discard((artifact_id_b, artifact_id_a))
+        # Remove from contradictions (pairs are unordered - one discard)
+        get_handle = self._ids.get
+        pairs = self.contradictions.get(get_handle(character_id))
+        if pairs:
+            pairs.discard(_pair(get_handle(artifact_id_a), get_handle(artifact_id_b)))
+        
+        logger.debug("🔀 %s resolved contradiction, favoring %s", character_id, favor)
+    
+    def _set_confidence(self, belief: Belief, confidence: float):
+        """Change a belief's confidence and keep the confidence index sorted"""
+        belief.confidence = confidence
+        self._index_confidence(belief)
+    
+    def _index_confidence(self, belief: Belief):
+        """(Re)insert a belief into its (character, subject) confidence list"""
+        subject = self._artifact_subject.get(belief.artifact_id)
+        if subject is None:
+            return
+        
+        entries = self._by_confidence.setdefault((belief.character_id, subject), [])
+        key = (belief.character_id, belief.artifact_id)
+        
+        old_entry = self._confidence_entry.get(key)
+        if old_entry is not None:
+            del entries[bisect_left(entries, old_entry)]
         
-        logger.debug(f"🔀 {character_id} resolved contradiction, favoring {favor}")
+        self._entry_seq += 1
+        entry = (-belief.confidence, self._entry_seq, belief.artifact_id)
+        insort(entries, entry)
+        self._confidence_entry[key] = entry
     
     def _reliability_to_score(self, reliability: ReliabilityLevel) -> float:
         """Convert reliability level to numeric score"""
-        mapping = {
-            ReliabilityLevel.CERTAIN: 1.0,
-            ReliabilityLevel.CONFIDENT: 0.85,
-            ReliabilityLevel.PROBABLE: 0.7,
-            ReliabilityLevel.UNCERTAIN: 0.5,
-            ReliabilityLevel.DUBIOUS: 0.3,
-            ReliabilityLevel.CONTRADICTED: 0.1
-        }
-        return mapping.get(reliability, 0.5)
+        return _RELIABILITY_SCORES[reliability]
     
     def _score_to_belief_state(self, score: float) -> Tuple[BeliefState, float]:
         """Convert numeric score to belief state and confidence"""
-        if score > 0.9:
-            return BeliefState.CONVINCED, score
-        elif score > 0.7:
-            return BeliefState.CONFIDENT, score
-        elif score > 0.55:
-            return BeliefState.LEANING_TRUE, score
-        elif score > 0.45:
-            return BeliefState.UNCERTAIN, score
-        elif score > 0.3:
-            return BeliefState.LEANING_FALSE, score
-        elif score > 0.1:
-            return BeliefState.SKEPTICAL, score
-        else:
-            return BeliefState.REJECTED, score
+        # Thresholds are exclusive lower bounds, so a score equal to one
+        # falls in the band below it (bisect_left)
+        return _STATES_BY_BAND[bisect_left(_SCORE_THRESHOLDS, score)], score
     
     def _adjust_for_contradiction(self, belief_state: BeliefState) -> BeliefState:
         """Weaken belief state due to contradiction"""
-        adjustments = {
-            BeliefState.CONVINCED: BeliefState.CONFIDENT,
-            BeliefState.CONFIDENT: BeliefState.LEANING_TRUE,
-            BeliefState.LEANING_TRUE: BeliefState.UNCERTAIN,
-            BeliefState.UNCERTAIN: BeliefState.UNCERTAIN,
-            BeliefState.LEANING_FALSE: BeliefState.SKEPTICAL,
-            BeliefState.SKEPTICAL: BeliefState.REJECTED,
-            BeliefState.REJECTED: BeliefState.REJECTED
-        }
-        return adjustments.get(belief_state, belief_state)
+        return _ADJUSTED_STATES[belief_state]
     
     def _find_contradictions(
         self,
@@ -337,38 +893,65 @@ class BeliefGraph:
         new_artifact: InformationArtifact
     ) -> List[str]:
         """Find existing beliefs that contradict a new artifact"""
-        if character_id not in self.beliefs:
+        contradicts = new_artifact.contradicts
+        if not contradicts:
             return []
         
-        contradictions = []
-        
-        # Check if new artifact contradicts any existing beliefs
-        for artifact_id, belief in self.beliefs[character_id].items():
-            # Artifacts about same subject with contradicting data = contradiction
-            # (Simplified - in production, need semantic comparison)
-            if new_artifact.subject == belief.artifact_id.split('_')[1]:  # Rough heuristic
-                if artifact_id in new_artifact.contradicts:
-                    contradictions.append(artifact_id)
+        # Artifacts about same subject with contradicting data = contradiction
+        # (Simplified - in production, need semantic comparison)
+        candidates = self.by_subject.get(character_id, {}).get(new_artifact.subject)
+        if not candidates:
+            return []
         
-        return contradictions
+        return [artifact_id for artifact_id in contradicts if artifact_id in candidates]
     
     def get_stats(self, character_id: str) -> dict:
-        """Get statistics about a character's belief state"""
-        if character_id not in self.beliefs:
-            return {
-                "total_beliefs": 0,
-                "contradictions": 0,
-                "high_confidence": 0,
-                "uncertain": 0,
-                "rejected": 0
-            }
-        
-        beliefs = self.beliefs[character_id].values()
+        """
+        Get statistics about a character's belief state.
+        One pass over the confidence and state columns; no Belief objects
+        are touched.
+        """
+        handle = self._ids.get(character_id)
+        cols = self._columns.get(handle, _EMPTY_COLUMNS)
+        
+        n = len(cols)
+        confidence = cols.confidence[:n]
+        state = cols.state[:n]
         
         return {
-            "total_beliefs": len(beliefs),
-            "contradictions": len(self.contradictions.get(character_id, set())),
-            "high_confidence": len([b for b in beliefs if b.confidence > 0.8]),
-            "uncertain": len([b for b in beliefs if b.belief_state == BeliefState.UNCERTAIN]),
-            "rejected": len([b for b in beliefs if b.belief_state == BeliefState.REJECTED])
-        }
\ No newline at end of file
+            "total_beliefs": n,
+            "contradictions": len(self.contradictions.get(handle, ())),
+            "high_confidence": int(np.count_nonzero(confidence > 0.8)),
+            "uncertain": int(np.count_nonzero(state == BeliefState.UNCERTAIN)),
+            "rejected": int(np.count_nonzero(state == BeliefState.REJECTED))
+        }
+    
+    def export_beliefs_json(self, character_id: str) -> bytes:
+        """
+        Serialize a character's beliefs column-wise with orjson.
+        
+        Numeric columns are encoded straight from their numpy arrays, so
+        no per-belief dict is built. Each key holds one value per belief,
+        in the same order (field names match Belief.to_dict).
+        """
+        cols = self._columns_for(character_id)
+        if cols is None:
+            cols = _EMPTY_COLUMNS
+        
+        n = len(cols)
+        rows = cols.rows
+        return orjson.dumps(
+            {
+                "character_id": character_id,
+                "artifact_id": self._ids.strings(cols.artifact_handle[:n].tolist()),
+                "belief_state": [_STATE_NAMES[code] for code in cols.state[:n].tolist()],
+                "confidence": cols.confidence[:n],
+                "justification": [belief.justification for belief in rows],
+                "based_on": [belief.based_on for belief in rows],
+                "formed_at_tick": cols.formed_tick[:n],
+                "last_updated_tick": cols.updated_tick[:n],
+                "times_reinforced": cols.times_reinforced[:n],
+                "times_challenged": cols.times_challenged[:n]
+            },
+            option=orjson.OPT_SERIALIZE_NUMPY
+        )
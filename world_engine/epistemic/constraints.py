@@ -4,6 +4,7 @@ Epistemic Constraints - Hard rules for system integrity
 These constraints ensure the epistemic layers remain properly separated
 and that no component violates the information architecture.
 """
+import functools
 import logging
 from enum import IntEnum
 
@@ -63,7 +64,7 @@ class DirectorConstraint:
             DirectorConstraintViolation: If observation is not permitted
         """
         if target_layer in DirectorConstraint.ALLOWED_OBSERVATION_LAYERS:
-            logger.debug(f"✓ Director observing Layer {target_layer.name}")
+            logger.debug("✓ Director observing Layer %s", target_layer.name)
             return True
         
         raise DirectorConstraintViolation(
@@ -87,7 +88,7 @@ class DirectorConstraint:
             DirectorConstraintViolation: If action is not permitted
         """
         if target_layer == DirectorConstraint.ALLOWED_ACTION_LAYER:
-            logger.debug(f"✓ Director acting on Layer {target_layer.name}: {action}")
+            logger.debug("✓ Director acting on Layer %s: %s", target_layer.name, action)
             return True
         
         error_messages = {
@@ -131,7 +132,7 @@ class DirectorConstraint:
                 f"Artifacts may only represent information, not create facts."
             )
         
-        logger.debug(f"✓ Valid artifact creation: {artifact_type}")
+        logger.debug("✓ Valid artifact creation: %s", artifact_type)
         return True
 
 
@@ -169,7 +170,7 @@ class PerceptionConstraint:
                 f"without being present. Perception cannot create information from nothing."
             )
         
-        logger.debug(f"✓ Valid observation: {observer_id} observed {objective_fact_id}")
+        logger.debug("✓ Valid observation: %s observed %s", observer_id, objective_fact_id)
         return True
 
 
@@ -207,16 +208,25 @@ class BeliefConstraint:
                 f"without having access to it. Beliefs must be based on known information."
             )
         
-        logger.debug(f"✓ Valid belief formation: {character_id} based on {artifact_id}")
+        logger.debug("✓ Valid belief formation: %s based on %s", character_id, artifact_id)
         return True
 
 
 # Convenience validators for common operations
+#
+# The target layer is fixed when the decorator is applied, so the check
+# runs once at decoration time; a violation fails when the class is
+# defined rather than on first call. The wrappers only log.
 def validate_director_observation(layer: int):
     """Decorator to validate Director observations"""
+    target_layer = EpistemicLayer(layer)
+    DirectorConstraint.validate_observation(target_layer)
+    
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            DirectorConstraint.validate_observation(EpistemicLayer(layer))
+            if __debug__:
+                logger.debug("✓ Director observing Layer %s", target_layer.name)
             return func(self, *args, **kwargs)
         return wrapper
     return decorator
@@ -224,9 +234,14 @@ def validate_director_observation(layer: int):
 
 def validate_director_action(layer: int, action_name: str):
     """Decorator to validate Director actions"""
+    target_layer = EpistemicLayer(layer)
+    DirectorConstraint.validate_action(target_layer, action_name)
+    
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            DirectorConstraint.validate_action(EpistemicLayer(layer), action_name)
+            if __debug__:
+                logger.debug("✓ Director acting on Layer %s: %s", target_layer.name, action_name)
             return func(self, *args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
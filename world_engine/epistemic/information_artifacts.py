@@ -3,14 +3,28 @@ Layer 2: Information Artifacts
 Reports, observations, rumors, messages that characters actually encounter.
 These CAN be: outdated, partial, contradictory, or false.
 """
-from typing import Optional, List, Set
+from typing import Mapping, Optional, List, Set, Tuple
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+import heapq
 import logging
+import sys
+
+import numpy as np
+
+from ..utils.id_interner import IdInterner
 
 logger = logging.getLogger(__name__)
 
 
+def _set_bits(mask: int) -> np.ndarray:
+    """Positions of the set bits in an int bitset, ascending"""
+    if not mask:
+        return np.empty(0, dtype=np.intp)
+    raw = np.frombuffer(mask.to_bytes((mask.bit_length() + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little"))
+
+
 class ArtifactType(str, Enum):
     """Types of information artifacts"""
     DIRECT_OBSERVATION = "direct_observation"  # Character saw it themselves
@@ -21,17 +35,20 @@ class ArtifactType(str, Enum):
     MEMORY = "memory"                          # Recalled from past
 
 
-class ReliabilityLevel(str, Enum):
-    """How reliable is this information?"""
-    CERTAIN = "certain"           # Directly observed
-    CONFIDENT = "confident"       # Trusted source
-    PROBABLE = "probable"         # Likely true
-    UNCERTAIN = "uncertain"       # May or may not be true
-    DUBIOUS = "dubious"           # Probably false
-    CONTRADICTED = "contradicted" # Proven false
+class ReliabilityLevel(IntEnum):
+    """
+    How reliable is this information?
+    Ordered most to least reliable; serialized as the lowercase name.
+    """
+    CERTAIN = 0        # Directly observed
+    CONFIDENT = 1      # Trusted source
+    PROBABLE = 2       # Likely true
+    UNCERTAIN = 3      # May or may not be true
+    DUBIOUS = 4        # Probably false
+    CONTRADICTED = 5   # Proven false
 
 
-@dataclass
+@dataclass(slots=True)
 class InformationArtifact:
     """
     A piece of information that exists in the world.
@@ -51,7 +68,7 @@ class InformationArtifact:
     # Content
     subject: str                   # What/who it's about
     claim: str                     # Human-readable claim
-    data: dict                     # Structured data
+    data: Mapping                  # Structured data (may be shared with its fact)
     
     # Provenance
     source: str                    # Who generated this (character_id or "system")
@@ -71,9 +88,9 @@ class InformationArtifact:
             "artifact_type": self.artifact_type.value,
             "subject": self.subject,
             "claim": self.claim,
-            "data": self.data,
+            "data": dict(self.data),
             "source": self.source,
-            "reliability": self.reliability.value,
+            "reliability": self.reliability.name.lower(),
             "superseded_by": self.superseded_by,
             "contradicts": list(self.contradicts),
             "known_by": list(self.known_by)
@@ -88,7 +105,23 @@ class InformationArtifactStore:
     def __init__(self):
         self.artifacts: dict[str, InformationArtifact] = {}
         self._artifacts_by_subject: dict[str, List[str]] = {}
-        self._artifacts_known_by: dict[str, Set[str]] = {}  # character_id -> artifact_ids
+        
+        # Knowledge index as int bitsets over artifact handles (insertion order)
+        self._artifact_handles = IdInterner()
+        self._char_handles = IdInterner()
+        self._known_mask: dict[int, int] = {}  # character handle -> artifact bits
+        
+        # (character handle, subject) -> artifact IDs, in the order learned
+        self._known_by_subject: dict[Tuple[int, str], List[str]] = {}
+        
+        # subject -> most recent non-superseded artifact ID
+        self._latest_by_subject: dict[str, str] = {}
+        
+        # (created_at_tick, artifact_id) min-heap of artifacts not yet aged out
+        self._stale_heap: List[Tuple[int, str]] = []
+        
+        # Bumped on every mutation so callers can invalidate derived caches
+        self.version = 0
     
     def create_artifact(
         self,
@@ -96,7 +129,7 @@ class InformationArtifactStore:
         artifact_type: ArtifactType,
         subject: str,
         claim: str,
-        data: dict,
+        data: Mapping,
         source: str,
         reliability: ReliabilityLevel,
         known_by: Optional[Set[str]] = None
@@ -106,8 +139,10 @@ class InformationArtifactStore:
         
         This represents information entering the epistemic system.
         """
-        artifact_id = f"artifact_{subject}_{tick}_{len(self.artifacts)}"
+        artifact_id = self.next_artifact_id(subject, tick)
         
+        # Subjects and sources repeat across artifacts - share one copy
+        subject = sys.intern(subject)
         artifact = InformationArtifact(
             artifact_id=artifact_id,
             created_at_tick=tick,
@@ -115,55 +150,158 @@ class InformationArtifactStore:
             subject=subject,
             claim=claim,
             data=data,
-            source=source,
+            source=sys.intern(source),
             reliability=reliability,
             known_by=known_by or set()
         )
         
         self.artifacts[artifact_id] = artifact
+        self.version += 1
+        heapq.heappush(self._stale_heap, (tick, artifact_id))
         
         # Index by subject
         if subject not in self._artifacts_by_subject:
             self._artifacts_by_subject[subject] = []
         self._artifacts_by_subject[subject].append(artifact_id)
+        self._note_latest(artifact)
         
         # Index by knower
-        for character_id in artifact.known_by:
-            if character_id not in self._artifacts_known_by:
-                self._artifacts_known_by[character_id] = set()
-            self._artifacts_known_by[character_id].add(artifact_id)
+        self._index_bits(artifact)
         
         logger.debug(f"📰 Created artifact: {claim}")
         
         return artifact
     
+    def next_artifact_id(self, subject: str, tick: int, offset: int = 0) -> str:
+        """
+        ID the next stored artifact will get.
+        offset skips ahead for artifacts being built as a batch.
+        """
+        return f"artifact_{subject}_{tick}_{len(self.artifacts) + offset}"
+
+    def create_artifacts(self, records: List[dict]) -> List[InformationArtifact]:
+        """
+        Create several artifacts at once (e.g. when seeding a world).
+
+        Args:
+            records: Dicts with the same keys as create_artifact's arguments
+                (tick, artifact_type, subject, claim, data, source,
+                reliability, known_by)
+
+        Returns:
+            The created artifacts, in input order
+        """
+        artifacts = [
+            InformationArtifact(
+                artifact_id=self.next_artifact_id(r["subject"], r["tick"], offset=i),
+                created_at_tick=r["tick"],
+                artifact_type=r["artifact_type"],
+                subject=r["subject"],
+                claim=r["claim"],
+                data=r["data"],
+                source=r["source"],
+                reliability=r["reliability"],
+                known_by=r.get("known_by") or set()
+            )
+            for i, r in enumerate(records)
+        ]
+        self.add_artifacts(artifacts)
+        return artifacts
+
+    def add_artifacts(self, artifacts: List[InformationArtifact]):
+        """
+        Bulk insert of artifacts built with next_artifact_id.
+        Indexes by subject once per subject and bumps the version once.
+        """
+        if not artifacts:
+            return
+        
+        by_subject: dict[str, List[str]] = {}
+        for artifact in artifacts:
+            artifact.subject = sys.intern(artifact.subject)
+            artifact.source = sys.intern(artifact.source)
+            self.artifacts[artifact.artifact_id] = artifact
+            heapq.heappush(self._stale_heap, (artifact.created_at_tick, artifact.artifact_id))
+            by_subject.setdefault(artifact.subject, []).append(artifact.artifact_id)
+            self._note_latest(artifact)
+            self._index_bits(artifact)
+        
+        for subject, artifact_ids in by_subject.items():
+            if subject not in self._artifacts_by_subject:
+                self._artifacts_by_subject[subject] = []
+            self._artifacts_by_subject[subject].extend(artifact_ids)
+        
+        self.version += 1
+        logger.debug(f"📰 Created {len(artifacts)} artifacts")
+    
+    def _index_bits(self, artifact: InformationArtifact):
+        """Add a newly stored artifact to its knowers' indices"""
+        bit = 1 << self._artifact_handles.intern(artifact.artifact_id)
+        
+        known_mask = self._known_mask
+        known_by_subject = self._known_by_subject
+        subject = artifact.subject
+        for character_id in artifact.known_by:
+            handle = self._char_handles.intern(character_id)
+            known_mask[handle] = known_mask.get(handle, 0) | bit
+            known_by_subject.setdefault((handle, subject), []).append(artifact.artifact_id)
+    
+    def pop_aged(self, before_tick: int) -> List[str]:
+        """
+        Remove and return IDs of artifacts created before before_tick,
+        oldest first. Each artifact is returned once over the store's life.
+        """
+        heap = self._stale_heap
+        aged = []
+        while heap and heap[0][0] < before_tick:
+            aged.append(heapq.heappop(heap)[1])
+        return aged
+    
     def share_artifact(self, artifact_id: str, character_id: str):
         """Make a character aware of an artifact"""
         artifact = self.artifacts.get(artifact_id)
-        if not artifact:
+        if not artifact or character_id in artifact.known_by:
             return
         
         artifact.known_by.add(character_id)
+        self.version += 1
         
-        if character_id not in self._artifacts_known_by:
-            self._artifacts_known_by[character_id] = set()
-        self._artifacts_known_by[character_id].add(artifact_id)
+        handle = self._char_handles.intern(character_id)
+        bit = 1 << self._artifact_handles.get(artifact_id)
+        self._known_mask[handle] = self._known_mask.get(handle, 0) | bit
+        self._known_by_subject.setdefault((handle, artifact.subject), []).append(artifact_id)
     
     def supersede_artifact(self, old_id: str, new_id: str):
         """Mark an artifact as superseded by newer information"""
         old_artifact = self.artifacts.get(old_id)
         if old_artifact:
             old_artifact.superseded_by = new_id
+            self.version += 1
+            
+            subject = old_artifact.subject
+            if self._latest_by_subject.get(subject) == old_id:
+                latest = self._scan_latest(subject)
+                if latest is None:
+                    del self._latest_by_subject[subject]
+                else:
+                    self._latest_by_subject[subject] = latest.artifact_id
             logger.debug(f"🔄 Artifact {old_id} superseded by {new_id}")
     
     def mark_contradiction(self, artifact_id: str, contradicts_id: str):
         """Mark two artifacts as contradicting each other"""
         artifact = self.artifacts.get(artifact_id)
+        other = self.artifacts.get(contradicts_id)
+        
+        # Unknown IDs (callers probing) are a plain miss - don't invalidate
+        # caches keyed on version for them
+        if artifact is None and other is None:
+            return
+        self.version += 1
+        
         if artifact:
             artifact.contradicts.add(contradicts_id)
         
         # Reciprocal
-        other = self.artifacts.get(contradicts_id)
         if other:
             other.contradicts.add(artifact_id)
     
@@ -178,12 +316,17 @@ class InformationArtifactStore:
         
         This is what a character's reasoning would work with.
         """
-        artifact_ids = self._artifacts_known_by.get(character_id, set())
-        artifacts = [self.artifacts[aid] for aid in artifact_ids if aid in self.artifacts]
+        handle = self._char_handles.get(character_id)
+        if handle is None:
+            return []
         
-        # Filter by subject if specified
+        # About one subject: straight from the (knower, subject) index
         if about_subject:
-            artifacts = [a for a in artifacts if a.subject == about_subject]
+            artifact_ids = self._known_by_subject.get((handle, about_subject), [])
+        else:
+            mask = self._known_mask.get(handle, 0)
+            artifact_ids = self._artifact_handles.strings(_set_bits(mask).tolist())
+        artifacts = [self.artifacts[aid] for aid in artifact_ids]
         
         # Filter out superseded unless requested
         if not include_superseded:
@@ -197,12 +340,36 @@ class InformationArtifactStore:
         known_by: Optional[str] = None
     ) -> Optional[InformationArtifact]:
         """Get the most recent artifact about a subject"""
-        artifact_ids = self._artifacts_by_subject.get(subject, [])
-        artifacts = [self.artifacts[aid] for aid in artifact_ids]
+        latest_id = self._latest_by_subject.get(subject)
+        if latest_id is None:
+            return None
+        
+        latest = self.artifacts[latest_id]
+        if not known_by or known_by in latest.known_by:
+            return latest
         
-        # Filter by knower if specified
+        # The overall latest isn't known to them - fall back to a scan
+        return self._scan_latest(subject, known_by)
+    
+    def _note_latest(self, artifact: InformationArtifact):
+        """Update the latest-per-subject cache for a newly stored artifact"""
+        current_id = self._latest_by_subject.get(artifact.subject)
+        if current_id is None or artifact.created_at_tick > self.artifacts[current_id].created_at_tick:
+            self._latest_by_subject[artifact.subject] = artifact.artifact_id
+    
+    def _scan_latest(
+        self,
+        subject: str,
+        known_by: Optional[str] = None
+    ) -> Optional[InformationArtifact]:
+        """Most recent non-superseded artifact about a subject, by full scan"""
+        # Restrict to the knower's artifacts if specified
         if known_by:
-            artifacts = [a for a in artifacts if known_by in a.known_by]
+            handle = self._char_handles.get(known_by)
+            artifact_ids = self._known_by_subject.get((handle, subject), [])
+        else:
+            artifact_ids = self._artifacts_by_subject.get(subject, [])
+        artifacts = [self.artifacts[aid] for aid in artifact_ids]
         
         # Filter out superseded
         artifacts = [a for a in artifacts if a.superseded_by is None]
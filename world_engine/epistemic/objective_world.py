@@ -3,28 +3,46 @@ Layer 1: Objective World State
 This is ENGINE TRUTH - what actually happened, with perfect fidelity.
 Characters do NOT have direct access to this.
 """
-from typing import Dict, List, Optional, Set
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
+import sys
 from pathlib import Path
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Buffer for fact log appends, so a burst of facts is a few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Observer set of every fact nobody witnessed
+_EMPTY: FrozenSet[str] = frozenset()
 
-@dataclass
+
+@dataclass(slots=True)
 class ObjectiveFact:
     """
     A single indisputable fact about the world.
     This is what ACTUALLY happened, not what anyone believes.
     """
-    fact_id: str
+    seq: int                       # Position in the fact log (unique, increasing)
     tick: int                      # When it happened
     fact_type: str                 # "character_moved", "event_occurred", etc.
     subject: str                   # Who/what it's about
-    data: dict                     # The actual facts
-    observers: Set[str] = field(default_factory=set)  # Who was present
+    data: Mapping                  # The actual facts (read-only view, shared)
+    observers: FrozenSet[str] = field(default_factory=frozenset)  # Who was present
+    claim: Optional[str] = None    # Human-readable claim, filled in on first perception
+    
+    @property
+    def fact_id(self) -> str:
+        """String ID, only built when asked for (e.g. when serializing)"""
+        return f"{self.fact_type}_{self.subject}_{self.tick}_{self.seq}"
     
     def to_dict(self) -> dict:
         return {
@@ -32,7 +50,7 @@ class ObjectiveFact:
             "tick": self.tick,
             "fact_type": self.fact_type,
             "subject": self.subject,
-            "data": self.data,
+            "data": dict(self.data),
             "observers": list(self.observers)
         }
 
@@ -59,11 +77,28 @@ class ObjectiveWorld:
         # Immutable fact log (append-only)
         self.fact_log: List[ObjectiveFact] = []
         
+        # Sequence number for the next recorded fact
+        self._next_fact_seq = 0
+        
+        # fact_log[:_last_written_index] is already in fact_log.jsonl
+        self._last_written_index = 0
+        
         # Indices for fast queries
         self._facts_by_tick: Dict[int, List[ObjectiveFact]] = {}
         self._facts_by_subject: Dict[str, List[ObjectiveFact]] = {}
         self._facts_by_type: Dict[str, List[ObjectiveFact]] = {}
         
+        # Parallel tick lists for the subject/type indices (kept sorted,
+        # so tick-range queries are a bisect + slice)
+        self._subject_ticks: Dict[str, List[int]] = {}
+        self._type_ticks: Dict[str, List[int]] = {}
+        
+        # Recorded facts not yet in the indices (indexed on the next query)
+        self._pending_index: List[ObjectiveFact] = []
+        
+        # One shared frozenset per distinct observer group
+        self._observer_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        
         # Current state (derived from fact log)
         self.current_character_states: Dict[str, dict] = {}
         self.current_location_states: Dict[str, dict] = {}
@@ -76,7 +111,7 @@ class ObjectiveWorld:
         fact_type: str,
         subject: str,
         data: dict,
-        observers: Optional[Set[str]] = None
+        observers: Optional[Iterable[str]] = None
     ) -> ObjectiveFact:
         """
         Record an objective fact about the world.
@@ -92,32 +127,23 @@ class ObjectiveWorld:
         Returns:
             The recorded fact
         """
-        fact_id = f"{fact_type}_{subject}_{tick}_{len(self.fact_log)}"
-        
+        # Types and subjects repeat across the whole log - share one copy.
+        # Data is frozen so artifacts derived from the fact can share it.
         fact = ObjectiveFact(
-            fact_id=fact_id,
+            seq=self._next_fact_seq,
             tick=tick,
-            fact_type=fact_type,
-            subject=subject,
-            data=data,
-            observers=observers or set()
+            fact_type=sys.intern(fact_type),
+            subject=sys.intern(subject),
+            data=MappingProxyType(data),
+            observers=self._shared_observers(observers)
         )
         
         # Append to log (immutable)
         self.fact_log.append(fact)
+        self._next_fact_seq += 1
         
-        # Update indices
-        if tick not in self._facts_by_tick:
-            self._facts_by_tick[tick] = []
-        self._facts_by_tick[tick].append(fact)
-        
-        if subject not in self._facts_by_subject:
-            self._facts_by_subject[subject] = []
-        self._facts_by_subject[subject].append(fact)
-        
-        if fact_type not in self._facts_by_type:
-            self._facts_by_type[fact_type] = []
-        self._facts_by_type[fact_type].append(fact)
+        # Indices are built lazily, on the next query
+        self._pending_index.append(fact)
         
         # Update current state projection
         self._update_current_state(fact)
@@ -126,6 +152,117 @@ class ObjectiveWorld:
         
         return fact
     
+    def record_facts_bulk(self, facts: List[dict]) -> List[ObjectiveFact]:
+        """
+        Record several facts at once (e.g. every move in a tick).
+        
+        Args:
+            facts: Dicts with the same keys as record_fact's arguments
+                (tick, fact_type, subject, data, observers)
+            
+        Returns:
+            The recorded facts, in input order
+        """
+        start = self._next_fact_seq
+        recorded = [
+            ObjectiveFact(
+                seq=start + i,
+                tick=f["tick"],
+                fact_type=sys.intern(f["fact_type"]),
+                subject=sys.intern(f["subject"]),
+                data=MappingProxyType(f["data"]),
+                observers=self._shared_observers(f.get("observers"))
+            )
+            for i, f in enumerate(facts)
+        ]
+        
+        self.fact_log.extend(recorded)
+        self._next_fact_seq += len(recorded)
+        self._pending_index.extend(recorded)
+        for fact in recorded:
+            self._update_current_state(fact)
+        
+        logger.debug(f"📝 Recorded {len(recorded)} facts")
+        
+        return recorded
+    
+    def _shared_observers(self, observers: Optional[Iterable[str]]) -> FrozenSet[str]:
+        """Frozen observer set, shared with earlier facts seen by the same group"""
+        if not observers:
+            return _EMPTY
+        group = frozenset(observers)
+        return self._observer_sets.setdefault(group, group)
+    
+    def _flush_indices(self):
+        """Index every fact recorded since the last query"""
+        pending = self._pending_index
+        if not pending:
+            return
+        for fact in pending:
+            self._index_fact(fact)
+        pending.clear()
+    
+    def _index_fact(self, fact: ObjectiveFact):
+        """Add a fact to the tick/subject/type indices"""
+        if fact.tick not in self._facts_by_tick:
+            self._facts_by_tick[fact.tick] = []
+        self._facts_by_tick[fact.tick].append(fact)
+        
+        if fact.subject not in self._facts_by_subject:
+            self._facts_by_subject[fact.subject] = []
+            self._subject_ticks[fact.subject] = []
+        self._insert_by_tick(
+            self._facts_by_subject[fact.subject], self._subject_ticks[fact.subject], fact
+        )
+        
+        if fact.fact_type not in self._facts_by_type:
+            self._facts_by_type[fact.fact_type] = []
+            self._type_ticks[fact.fact_type] = []
+        self._insert_by_tick(
+            self._facts_by_type[fact.fact_type], self._type_ticks[fact.fact_type], fact
+        )
+    
+    @staticmethod
+    def _insert_by_tick(facts: List[ObjectiveFact], ticks: List[int], fact: ObjectiveFact):
+        """Append in tick order (facts normally arrive in order; late ones are slotted in)"""
+        if not ticks or fact.tick >= ticks[-1]:
+            facts.append(fact)
+            ticks.append(fact.tick)
+        else:
+            i = bisect_right(ticks, fact.tick)
+            facts.insert(i, fact)
+            ticks.insert(i, fact.tick)
+    
+    @staticmethod
+    def _tick_sorted(
+        groups: Dict[str, List[ObjectiveFact]]
+    ) -> Tuple[Dict[str, List[ObjectiveFact]], Dict[str, List[int]]]:
+        """
+        Sort each group by tick (stable, so same-tick facts keep log order,
+        as _insert_by_tick would) and build its parallel tick list.
+        """
+        facts_by_key: Dict[str, List[ObjectiveFact]] = {}
+        ticks_by_key: Dict[str, List[int]] = {}
+        for key, facts in groups.items():
+            facts.sort(key=attrgetter("tick"))
+            facts_by_key[key] = facts
+            ticks_by_key[key] = [fact.tick for fact in facts]
+        return facts_by_key, ticks_by_key
+    
+    @staticmethod
+    def _tick_slice(
+        facts: List[ObjectiveFact],
+        ticks: List[int],
+        since_tick: Optional[int],
+        until_tick: Optional[int]
+    ) -> List[ObjectiveFact]:
+        """Facts with since_tick <= tick <= until_tick (either bound optional)"""
+        if since_tick is None and until_tick is None:
+            return facts
+        lo = bisect_left(ticks, since_tick) if since_tick is not None else 0
+        hi = bisect_right(ticks, until_tick) if until_tick is not None else len(ticks)
+        return facts[lo:hi]
+    
     def _update_current_state(self, fact: ObjectiveFact):
         """Update the current state projection from a new fact"""
         if fact.fact_type == "character_moved":
@@ -140,6 +277,7 @@ class ObjectiveWorld:
     
     def query_facts_at_tick(self, tick: int) -> List[ObjectiveFact]:
         """Get all facts that occurred at a specific tick"""
+        self._flush_indices()
         return self._facts_by_tick.get(tick, [])
     
     def query_facts_about_subject(
@@ -156,14 +294,28 @@ class ObjectiveWorld:
             since_tick: Only facts after this tick
             until_tick: Only facts before this tick
         """
-        facts = self._facts_by_subject.get(subject, [])
-        
-        if since_tick is not None:
-            facts = [f for f in facts if f.tick >= since_tick]
-        if until_tick is not None:
-            facts = [f for f in facts if f.tick <= until_tick]
-        
-        return facts
+        self._flush_indices()
+        facts = self._facts_by_subject.get(subject)
+        if facts is None:
+            return []
+        return self._tick_slice(facts, self._subject_ticks[subject], since_tick, until_tick)
+    
+    def latest_fact_about(
+        self,
+        subject: str,
+        since_tick: Optional[int] = None
+    ) -> Optional[ObjectiveFact]:
+        """
+        Last fact about a subject in tick order, or None if there is none
+        (or none at/after since_tick). O(1) - no slice is built.
+        """
+        self._flush_indices()
+        facts = self._facts_by_subject.get(subject)
+        if not facts:
+            return None
+        if since_tick is not None and self._subject_ticks[subject][-1] < since_tick:
+            return None
+        return facts[-1]
     
     def query_facts_by_type(
         self,
@@ -171,12 +323,11 @@ class ObjectiveWorld:
         since_tick: Optional[int] = None
     ) -> List[ObjectiveFact]:
         """Get all facts of a specific type"""
-        facts = self._facts_by_type.get(fact_type, [])
-        
-        if since_tick is not None:
-            facts = [f for f in facts if f.tick >= since_tick]
-        
-        return facts
+        self._flush_indices()
+        facts = self._facts_by_type.get(fact_type)
+        if facts is None:
+            return []
+        return self._tick_slice(facts, self._type_ticks[fact_type], since_tick, None)
     
     def get_character_location_at_tick(
         self,
@@ -187,17 +338,23 @@ class ObjectiveWorld:
         Get where a character objectively was at a specific tick.
         This is ENGINE TRUTH, not belief.
         """
-        # Get all movement facts for this character up to this tick
-        movement_facts = [
-            f for f in self.query_facts_about_subject(character_id, until_tick=tick)
-            if f.fact_type == "character_moved"
-        ]
-        
-        if not movement_facts:
+        self._flush_indices()
+        facts = self._facts_by_subject.get(character_id)
+        if facts is None:
             return None
         
-        # Most recent movement
-        latest = max(movement_facts, key=lambda f: f.tick)
+        # Walk back in place from the last fact at or before this tick
+        # (no slice copy), stopping once we pass the most recent move's tick
+        latest = None
+        for i in range(bisect_right(self._subject_ticks[character_id], tick) - 1, -1, -1):
+            fact = facts[i]
+            if latest is not None and fact.tick < latest.tick:
+                break
+            if fact.fact_type == "character_moved":
+                latest = fact  # Earliest-recorded move of the most recent tick
+        
+        if latest is None:
+            return None
         return latest.data["destination"]
     
     def get_current_state(self) -> dict:
@@ -209,17 +366,25 @@ class ObjectiveWorld:
         }
     
     def save_to_disk(self):
-        """Persist the fact log"""
+        """Persist the fact log (appends only facts not yet written)"""
         fact_log_file = self.data_dir / "fact_log.jsonl"
         
-        # Append-only write
-        with open(fact_log_file, 'a') as f:
-            # Only write facts not yet written
-            # (In production, track last_written_index)
-            for fact in self.fact_log:
-                f.write(json.dumps(fact.to_dict()) + "\n")
+        # Bound the batch up front: facts recorded while this runs (when
+        # saving off the event loop) are left for the next save
+        end = len(self.fact_log)
+        new_facts = self.fact_log[self._last_written_index:end]
+        if new_facts:
+            # Encode the batch up front, then one buffered append-only write
+            # (non-str keys in fact data are stringified, as json.dumps did)
+            lines = [
+                orjson.dumps(fact.to_dict(), option=orjson.OPT_NON_STR_KEYS) + b"\n"
+                for fact in new_facts
+            ]
+            with open(fact_log_file, 'ab', buffering=WRITE_BUFFER_SIZE) as f:
+                f.writelines(lines)
+            self._last_written_index = end
         
-        logger.info(f"💾 Saved {len(self.fact_log)} facts to disk")
+        logger.info(f"💾 Saved {len(new_facts)} new facts to disk ({len(self.fact_log)} total)")
     
     def _load_from_disk(self):
         """Load existing fact log"""
@@ -228,40 +393,47 @@ class ObjectiveWorld:
         if not fact_log_file.exists():
             return
         
-        with open(fact_log_file, 'r') as f:
-            for line in f:
-                if not line.strip():
-                    continue
-                
-                data = json.loads(line)
-                fact = ObjectiveFact(
-                    fact_id=data["fact_id"],
-                    tick=data["tick"],
-                    fact_type=data["fact_type"],
-                    subject=data["subject"],
-                    data=data["data"],
-                    observers=set(data.get("observers", []))
-                )
-                
-                self.fact_log.append(fact)
-                
-                # Rebuild indices
-                if fact.tick not in self._facts_by_tick:
-                    self._facts_by_tick[fact.tick] = []
-                self._facts_by_tick[fact.tick].append(fact)
-                
-                if fact.subject not in self._facts_by_subject:
-                    self._facts_by_subject[fact.subject] = []
-                self._facts_by_subject[fact.subject].append(fact)
-                
-                if fact.fact_type not in self._facts_by_type:
-                    self._facts_by_type[fact.fact_type] = []
-                self._facts_by_type[fact.fact_type].append(fact)
+        with open(fact_log_file, 'rb') as f:
+            lines = f.read().splitlines()
+        
+        loads = orjson.loads
+        intern = sys.intern
+        facts = self.fact_log
+        for line in lines:
+            if not line:
+                continue
+            
+            data = loads(line)
+            facts.append(ObjectiveFact(
+                seq=int(data["fact_id"].rsplit("_", 1)[1]),
+                tick=data["tick"],
+                fact_type=intern(data["fact_type"]),
+                subject=intern(data["subject"]),
+                data=MappingProxyType(data["data"]),
+                observers=self._shared_observers(data.get("observers"))
+            ))
+        
+        # Rebuild indices in one pass
+        by_tick = defaultdict(list)
+        by_subject = defaultdict(list)
+        by_type = defaultdict(list)
+        for fact in facts:
+            by_tick[fact.tick].append(fact)
+            by_subject[fact.subject].append(fact)
+            by_type[fact.fact_type].append(fact)
+        
+        self._facts_by_tick = dict(by_tick)
+        self._facts_by_subject, self._subject_ticks = self._tick_sorted(by_subject)
+        self._facts_by_type, self._type_ticks = self._tick_sorted(by_type)
         
+        self._last_written_index = len(self.fact_log)
+        if self.fact_log:
+            self._next_fact_seq = max(fact.seq for fact in self.fact_log) + 1
         logger.info(f"📂 Loaded {len(self.fact_log)} facts from disk")
     
     def get_stats(self) -> dict:
         """Get statistics about the objective world"""
+        self._flush_indices()
         return {
             "total_facts": len(self.fact_log),
             "fact_types": {
@@ -4,7 +4,7 @@ Determines what characters observe and how reliably.
 """
 import logging
 import random
-from typing import Set, Optional
+from typing import Callable, Dict, Iterable, List, Mapping, Set, Optional
 
 from .objective_world import ObjectiveWorld, ObjectiveFact
 from .information_artifacts import (
@@ -16,6 +16,22 @@ from .information_artifacts import (
 
 logger = logging.getLogger(__name__)
 
+# Rumors get one of these at random (indexed by a single random bit)
+_RUMOR_RELIABILITIES = (ReliabilityLevel.UNCERTAIN, ReliabilityLevel.DUBIOUS)
+
+
+# ==================== CLAIM TEMPLATES ====================
+
+def _default_claim(fact: ObjectiveFact) -> str:
+    return f"{fact.fact_type} involving {fact.subject}"
+
+
+# fact_type -> claim formatter; anything unlisted uses _default_claim
+_CLAIM_GENERATORS: Dict[str, Callable[[ObjectiveFact], str]] = {
+    "character_moved": lambda fact: f"{fact.subject} moved to {fact.data.get('destination')}",
+    "event_occurred": lambda fact: f"Event: {fact.data.get('title', 'Something happened')}",
+}
+
 
 class PerceptionSystem:
     """
@@ -35,6 +51,9 @@ class PerceptionSystem:
     ):
         self.objective_world = objective_world
         self.artifact_store = artifact_store
+        
+        # subject -> stale artifacts with no newer facts yet, oldest first
+        self._stale_watch: Dict[str, List[InformationArtifact]] = {}
     
     def process_direct_observation(
         self,
@@ -50,7 +69,7 @@ class PerceptionSystem:
             artifact_type=ArtifactType.DIRECT_OBSERVATION,
             subject=fact.subject,
             claim=self._generate_claim(fact),
-            data=fact.data.copy(),
+            data=fact.data,
             source=observer,
             reliability=ReliabilityLevel.CERTAIN,
             known_by={observer}
@@ -60,6 +79,34 @@ class PerceptionSystem:
         
         return artifact
     
+    def process_direct_observations_bulk(
+        self,
+        fact: ObjectiveFact,
+        observers: Iterable[str]
+    ) -> InformationArtifact:
+        """
+        Several characters directly observe the same fact.
+        What they saw is identical, so they share one CERTAIN artifact
+        (known by all of them) instead of one copy each.
+        
+        Returns:
+            The shared artifact
+        """
+        artifact = self.artifact_store.create_artifact(
+            tick=fact.tick,
+            artifact_type=ArtifactType.DIRECT_OBSERVATION,
+            subject=fact.subject,
+            claim=self._generate_claim(fact),
+            data=fact.data,
+            source="witnesses",
+            reliability=ReliabilityLevel.CERTAIN,
+            known_by=set(observers)
+        )
+        
+        logger.debug(f"👁️  {len(artifact.known_by)} observers saw: {artifact.claim}")
+        
+        return artifact
+    
     def process_report(
         self,
         fact: ObjectiveFact,
@@ -84,7 +131,7 @@ class PerceptionSystem:
             artifact_type=ArtifactType.REPORT,
             subject=fact.subject,
             claim=f"{reporter} says: {self._generate_claim(fact)}",
-            data=fact.data.copy(),
+            data=fact.data,
             source=reporter,
             reliability=reliability,
             known_by={recipient}
@@ -105,10 +152,7 @@ class PerceptionSystem:
         Information spreads as rumor (degraded reliability).
         """
         # Rumors are less reliable
-        reliability = random.choice([
-            ReliabilityLevel.UNCERTAIN,
-            ReliabilityLevel.DUBIOUS
-        ])
+        reliability = _RUMOR_RELIABILITIES[random.getrandbits(1)]
         
         # Information may be distorted
         distorted_data = self._distort_data(fact.data)
@@ -129,23 +173,27 @@ class PerceptionSystem:
         return artifact
     
     def _generate_claim(self, fact: ObjectiveFact) -> str:
-        """Generate human-readable claim from fact"""
-        if fact.fact_type == "character_moved":
-            return f"{fact.subject} moved to {fact.data.get('destination')}"
-        elif fact.fact_type == "event_occurred":
-            return f"Event: {fact.data.get('title', 'Something happened')}"
-        else:
-            return f"{fact.fact_type} involving {fact.subject}"
+        """Generate human-readable claim from fact (built once per fact)"""
+        claim = fact.claim
+        if claim is None:
+            claim = fact.claim = _CLAIM_GENERATORS.get(fact.fact_type, _default_claim)(fact)
+        return claim
     
-    def _distort_data(self, data: dict, distortion_rate: float = 0.2) -> dict:
+    def _distort_data(self, data: Mapping, distortion_rate: float = 0.2) -> dict:
         """Simulate information distortion in rumors"""
-        distorted = data.copy()
+        # Fact data is read-only; the rumor gets its own copy to mutate
+        distorted = dict(data)
         
-        # Randomly distort some fields
-        for key in distorted:
-            if random.random() < distortion_rate:
-                if isinstance(distorted[key], str):
-                    distorted[key] = distorted[key] + " (unverified)"
+        # Randomly distort some fields (one draw per key, same order as
+        # the keys, taken in a single pass before touching the dict)
+        rnd = random.random
+        keys = list(distorted)
+        hits = [rnd() < distortion_rate for _ in keys]
+        for key, hit in zip(keys, hits):
+            if hit:
+                value = distorted[key]
+                if isinstance(value, str):
+                    distorted[key] = value + " (unverified)"
         
         return distorted
     
@@ -154,31 +202,53 @@ class PerceptionSystem:
         Check for information that might be outdated.
         Generate new artifacts to update stale ones.
         """
-        # Check all artifacts
-        for artifact_id, artifact in self.artifact_store.artifacts.items():
-            age = current_tick - artifact.created_at_tick
+        store = self.artifact_store
+        watch = self._stale_watch
+        
+        # Artifacts that just aged past the threshold join the watch list
+        # (age > threshold  <=>  created before current_tick - threshold)
+        for artifact_id in store.pop_aged(current_tick - staleness_threshold):
+            artifact = store.artifacts.get(artifact_id)
+            if artifact is not None and artifact.superseded_by is None:
+                watch.setdefault(artifact.subject, []).append(artifact)
+        
+        for subject in list(watch):
+            waiting = watch[subject]
+            
+            # Subject facts are tick-ordered, so the last one decides both
+            # whether anything newer exists and what the update says
+            latest_fact = self.objective_world.latest_fact_about(subject)
+            if latest_fact is None:
+                continue
+            latest_tick = latest_fact.tick
             
-            if age > staleness_threshold and artifact.superseded_by is None:
+            still_waiting = []
+            for artifact in waiting:
+                if artifact.superseded_by is not None:
+                    continue
+                
                 # This information is getting old
                 # Check if objective world has newer facts
-                newer_facts = self.objective_world.query_facts_about_subject(
-                    artifact.subject,
-                    since_tick=artifact.created_at_tick
+                if latest_tick < artifact.created_at_tick:
+                    still_waiting.append(artifact)
+                    continue
+                
+                # Create updated artifact
+                new_artifact = store.create_artifact(
+                    tick=current_tick,
+                    artifact_type=ArtifactType.REPORT,
+                    subject=latest_fact.subject,
+                    claim=f"Updated: {self._generate_claim(latest_fact)}",
+                    data=latest_fact.data,
+                    source="system",
+                    reliability=ReliabilityLevel.CONFIDENT,
+                    known_by=artifact.known_by.copy()
                 )
                 
-                if newer_facts:
-                    # Create updated artifact
-                    latest_fact = newer_facts[-1]
-                    new_artifact = self.artifact_store.create_artifact(
-                        tick=current_tick,
-                        artifact_type=ArtifactType.REPORT,
-                        subject=latest_fact.subject,
-                        claim=f"Updated: {self._generate_claim(latest_fact)}",
-                        data=latest_fact.data.copy(),
-                        source="system",
-                        reliability=ReliabilityLevel.CONFIDENT,
-                        known_by=artifact.known_by.copy()
-                    )
-                    
-                    # Supersede old artifact
-                    self.artifact_store.supersede_artifact(artifact_id, new_artifact.artifact_id)
\ No newline at end of file
+                # Supersede old artifact
+                store.supersede_artifact(artifact.artifact_id, new_artifact.artifact_id)
+            
+            if still_waiting:
+                watch[subject] = still_waiting
+            else:
+                del watch[subject]
\ No newline at end of file
@@ -3,8 +3,12 @@ World Engine - Main Entry Point
 Autonomous world simulation that runs continuously
 """
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from functools import cached_property
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -25,14 +29,26 @@ from world_engine.ai.autonomous_pipeline import AutonomousPipeline
 log_dir = Path("world_engine/logs")
 log_dir.mkdir(parents=True, exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(log_dir / 'simulation.log', encoding='utf-8')
-    ]
-)
+# Log calls only enqueue the record; a listener thread does the console
+# and file writes, so logging never blocks the event loop
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler(log_dir / 'simulation.log', encoding='utf-8')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+# The queue handler only merges args into the message; the listener's
+# handlers apply the real format
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drains queued records on exit
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,22 +62,38 @@ class WorldSimulation:
         self,
         tick_interval: float = 5.0,
         data_dir: str = "world_data",
-        load_existing: bool = True
+        load_existing: bool = True,
+        max_concurrent_ai: int = 8
     ):
+        """
+        Args:
+            tick_interval: Real-world seconds between ticks
+            data_dir: Where world state is persisted
+            load_existing: Load the saved world instead of creating the demo one
+            max_concurrent_ai: Cap on in-flight character AI (LLM) requests
+        """
         logger.info("🌍 Initializing World Simulation...")
         
         # Core components
         self.world_state = WorldState(data_dir=data_dir)
-        self.event_queue = EventQueue()
+        self.event_queue = EventQueue(world_state=self.world_state)
         self.ticker = WorldTicker(
             tick_interval=tick_interval,
             start_tick=0
         )
         
-        # AI components
-        self.action_generator = ActionGenerator()
-        self.director = NarrativeDirector()
-        self.autonomous_pipeline = AutonomousPipeline()
+        # AI components are built on first use (see the properties below)
+        self.max_concurrent_ai = max_concurrent_ai
+        
+        # EventType -> effect handler used by _execute_event
+        self._event_handlers = {
+            EventType.CHARACTER_TRAVEL: self._handle_travel,
+            EventType.CHARACTER_ACTION: self._handle_action,
+            EventType.CHARACTER_INTERACTION: self._handle_interaction,
+        }
+        
+        # Held while an autosave runs in the executor, so saves never overlap
+        self._save_lock = asyncio.Lock()
         
         # Load existing world or create new
         if load_existing:
@@ -80,26 +112,47 @@ class WorldSimulation:
         
         logger.info("✅ World Simulation initialized")
     
+    @cached_property
+    def action_generator(self) -> ActionGenerator:
+        """Built on first use (at the latest when run() starts)"""
+        return ActionGenerator()
+    
+    @cached_property
+    def director(self) -> NarrativeDirector:
+        return NarrativeDirector()
+    
+    @cached_property
+    def autonomous_pipeline(self) -> AutonomousPipeline:
+        return AutonomousPipeline()
+    
     def _register_callbacks(self) -> None:
         """Register tick callbacks"""
+        # _on_tick sets current_tick, which the others read - runs first
         self.ticker.register_callback(self._on_tick)
-        self.ticker.register_callback(self._process_events)
-        self.ticker.register_callback(self._update_characters)
-        self.ticker.register_callback(self._director_events)
-        self.ticker.register_callback(self._autosave)
+        
+        # Independent and mostly waiting on LLM/disk - run together
+        self.ticker.register_callback(self._process_events, concurrent=True)
+        self.ticker.register_callback(self._update_characters, concurrent=True)
+        
+        # Periodic - only invoked on the ticks they're due
+        self.ticker.register_periodic(self._log_status, every_ticks=10)
+        self.ticker.register_periodic(self._director_events, every_ticks=20, concurrent=True)
+        self.ticker.register_periodic(self._autosave, every_ticks=500, concurrent=True)
     
     async def _on_tick(self, tick: int) -> None:
         """Called every tick - update world state"""
         self.world_state.current_tick = tick
-        
-        # Log world status every 10 ticks
-        if tick % 10 == 0:
-            stats = self.world_state.get_stats()
-            logger.info(
-                f"📊 World Status: "
-                f"{stats['characters']['active']} active characters, "
-                f"{stats['events']['active']} active events"
-            )
+    
+    async def _log_status(self, tick: int) -> None:
+        """Log world status (every 10 ticks)"""
+        # Skip gathering stats entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        stats = self.world_state.get_stats()
+        logger.info(
+            "📊 World Status: %d active characters, %d active events",
+            stats['characters']['active'], stats['events']['active']
+        )
     
     async def _process_events(self, tick: int) -> None:
         """Process scheduled events"""
@@ -117,59 +170,64 @@ class WorldSimulation:
         Execute an event - apply its effects to the world.
         This is where event logic lives.
         """
-        logger.info(f"⚡ Executing: {event.title}")
-        
-        if event.type == EventType.CHARACTER_TRAVEL:
-            # Character arrives at destination
-            char_id = event.participants[0]
-            destination = event.impact.get("destination")
-            if destination:
-                # ✅ NEW: Pass current tick to move_character
-                success = self.world_state.move_character(
-                    char_id,
-                    destination,
-                    self.world_state.current_tick  # Add this parameter
-                )
-                if success:
-                    event.impact["success"] = True
-        
-        elif event.type == EventType.CHARACTER_ACTION:
-            # Generic character action
-            action_type = event.impact.get("action_type")
-            logger.info(f"  Character action: {action_type}")
-            # TODO: Record to objective world
+        logger.info("⚡ Executing: %s", event.title)
         
-        elif event.type == EventType.CHARACTER_INTERACTION:
-            # Characters meet/interact
-            logger.info(f"  {len(event.participants)} characters interacting")
-            # TODO: Record to objective world
+        handler = self._event_handlers.get(event.type)
+        if handler:
+            handler(event)
         
         # Add event to world state
         self.world_state.add_event(event)
     
+    def _handle_travel(self, event: Event) -> None:
+        """Character arrives at destination"""
+        char_id = event.participants[0]
+        destination = event.impact.get("destination")
+        if destination:
+            # ✅ NEW: Pass current tick to move_character
+            success = self.world_state.move_character(
+                char_id,
+                destination,
+                self.world_state.current_tick  # Add this parameter
+            )
+            if success:
+                event.impact["success"] = True
+    
+    def _handle_action(self, event: Event) -> None:
+        """Generic character action"""
+        action_type = event.impact.get("action_type")
+        logger.info("  Character action: %s", action_type)
+        # TODO: Record to objective world
+    
+    def _handle_interaction(self, event: Event) -> None:
+        """Characters meet/interact"""
+        logger.info("  %d characters interacting", len(event.participants))
+        # TODO: Record to objective world
+    
     async def _update_characters(self, tick: int) -> None:
         """
         Update character states using AI.
         """
-        active_chars = self.world_state.get_active_characters()
+        # Skips characters busy with an active event (traveling/talking)
+        # ✅ CHANGED: Increase minimum wait time from 5 to 10 ticks
+        ready_chars = self.world_state.get_characters_ready_to_act(
+            tick,
+            min_wait_ticks=10  # Wait longer between actions
+        )
         
-        for character in active_chars:
-            # Skip if character is busy with an active event
-            if character.state in [CharacterState.TRAVELING, CharacterState.IN_CONVERSATION]:
-                continue
-            
-            # ✅ CHANGED: Increase minimum wait time from 5 to 10 ticks
-            ticks_since_last = tick - character.last_action_tick
-            if ticks_since_last < 10:  # Wait longer between actions
-                continue
-            
-            # Let AI decide what to do
-            action = await self.autonomous_pipeline.process_character(
-                character,
-                self.world_state,
-                tick
-            )
-            
+        if not ready_chars:
+            return
+        
+        # Let AI decide what to do - one batched LLM call for everyone
+        actions = await self.autonomous_pipeline.process_batch(
+            ready_chars,
+            self.world_state,
+            tick,
+            max_concurrency=self.max_concurrent_ai
+        )
+        
+        # Apply the decisions one at a time, in character order
+        for character, action in zip(ready_chars, actions):
             if action:
                 # Create event from action
                 event = self.action_generator.create_event_from_action(
@@ -182,17 +240,21 @@ class WorldSimulation:
                 self.event_queue.schedule(event)
                 
                 # Update character state
-                character.last_action_tick = tick
                 if action['action_type'] == 'TRAVEL':
-                    character.state = CharacterState.TRAVELING
-                    character.destination = action.get('target')
+                    self.world_state.update_character_status(
+                        character.id,
+                        state=CharacterState.TRAVELING,
+                        last_action_tick=tick,
+                        destination=action.get('target')
+                    )
+                else:
+                    self.world_state.update_character_status(
+                        character.id,
+                        last_action_tick=tick
+                    )
 
     async def _director_events(self, tick: int) -> None:
-        """Let narrative director create world events"""
-        # Check every 20 ticks
-        if tick % 20 != 0:
-            return
-        
+        """Let narrative director create world events (every 20 ticks)"""
         should_generate = await self.director.should_generate_event(
             self.world_state,
             tick
@@ -208,9 +270,22 @@ class WorldSimulation:
                 self.event_queue.schedule(event)
     
     async def _autosave(self, tick: int) -> None:
-        """Autosave world state periodically"""
-        if tick % 50 == 0:  # Every 50 ticks
-            self.world_state.save_to_disk()
+        """
+        Compact world state (every 500 ticks).
+        Changes in between are persisted by the background WAL flush.
+        """
+        if self._save_lock.locked():
+            logger.warning("⚠️  Previous autosave still running, skipping this one")
+            return
+        
+        # Capture at the tick boundary (only changed entities are
+        # re-serialized), then write from a worker thread while the
+        # tick loop keeps mutating the live world
+        async with self._save_lock:
+            frozen = self.world_state.freeze_snapshot()
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.world_state.write_frozen_snapshot, frozen
+            )
     
     def _create_demo_world(self) -> None:
         """Create a richer demo world"""
@@ -262,8 +337,7 @@ class WorldSimulation:
             )
         ]
         
-        for loc in locations:
-            self.world_state.add_location(loc)
+        self.world_state.add_locations(locations)
         
         # Create factions
         faction_alpha = Faction(
@@ -286,8 +360,7 @@ class WorldSimulation:
             relations={"faction_alpha": FactionRelation.FRIENDLY}
         )
         
-        self.world_state.add_faction(faction_alpha)
-        self.world_state.add_faction(faction_beta)
+        self.world_state.add_factions([faction_alpha, faction_beta])
         
         # Create characters
         char_a = WorldCharacter(
@@ -306,69 +379,43 @@ class WorldSimulation:
             active_goals=["Establish trade routes", "Gather rare goods", "Build reputation"]
         )
         
-        self.world_state.add_character(char_a)
-        self.world_state.add_character(char_b)
+        self.world_state.add_characters([char_a, char_b])
         
         # ✅ NEW: Create initial beliefs about starting positions
         current_tick = 0
         
         # Record initial positions to objective world
-        fact_a = self.world_state.objective_world.record_fact(
-            tick=current_tick,
-            fact_type="character_spawned",
-            subject="char_a",
-            data={"location": "village_alpha"},
-            observers=set()
-        )
-        
-        fact_b = self.world_state.objective_world.record_fact(
-            tick=current_tick,
-            fact_type="character_spawned",
-            subject="char_b",
-            data={"location": "village_beta"},
-            observers=set()
-        )
+        self.world_state.objective_world.record_facts_bulk([
+            {
+                "tick": current_tick,
+                "fact_type": "character_spawned",
+                "subject": char.id,
+                "data": {"location": char.location_id}
+            }
+            for char in (char_a, char_b)
+        ])
         
         # Each character knows their own location with certainty
         from world_engine.epistemic.information_artifacts import ArtifactType, ReliabilityLevel
         
-        artifact_a_self = self.world_state.artifact_store.create_artifact(
-            tick=current_tick,
-            artifact_type=ArtifactType.DIRECT_OBSERVATION,
-            subject="char_a",
-            claim=f"char_a is at village_alpha",
-            data={"location": "village_alpha"},
-            source="char_a",
-            reliability=ReliabilityLevel.CERTAIN,
-            known_by={"char_a"}
-        )
-        
-        artifact_b_self = self.world_state.artifact_store.create_artifact(
-            tick=current_tick,
-            artifact_type=ArtifactType.DIRECT_OBSERVATION,
-            subject="char_b",
-            claim=f"char_b is at village_beta",
-            data={"location": "village_beta"},
-            source="char_b",
-            reliability=ReliabilityLevel.CERTAIN,
-            known_by={"char_b"}
-        )
+        self_artifacts = self.world_state.artifact_store.create_artifacts([
+            {
+                "tick": current_tick,
+                "artifact_type": ArtifactType.DIRECT_OBSERVATION,
+                "subject": char.id,
+                "claim": f"{char.id} is at {char.location_id}",
+                "data": {"location": char.location_id},
+                "source": char.id,
+                "reliability": ReliabilityLevel.CERTAIN,
+                "known_by": {char.id}
+            }
+            for char in (char_a, char_b)
+        ])
         
         # Form beliefs
-        self.world_state.belief_graph.form_belief(
-            "char_a",
-            artifact_a_self,
-            current_tick,
-            trust_in_source=1.0,
-            base_skepticism=0.0
-        )
-        
-        self.world_state.belief_graph.form_belief(
-            "char_b",
-            artifact_b_self,
-            current_tick,
-            trust_in_source=1.0,
-            base_skepticism=0.0
+        self.world_state.belief_graph.form_beliefs_bulk(
+            [(artifact.source, artifact, 1.0, 0.0) for artifact in self_artifacts],
+            current_tick
         )
         
         # Save initial state
@@ -378,19 +425,29 @@ class WorldSimulation:
     
     async def run(self) -> None:
         """Start the simulation"""
+        # The AI components are built lazily, but a missing or invalid LLM
+        # config should stop the run here rather than fail on every tick
+        self.action_generator
+        self.director
+        self.autonomous_pipeline
+        
+        self.world_state.start_background_flush()
         try:
             await self.ticker.start()
         except KeyboardInterrupt:
             logger.info("🛑 Simulation interrupted by user")
-            self._shutdown()
         except Exception as e:
             logger.error(f"❌ Simulation error: {e}", exc_info=True)
-            self._shutdown()
             raise
+        finally:
+            # A normal ticker.stop() lands here too, so the flush thread
+            # is stopped and the world saved however the loop ended
+            self._shutdown()
     
     def _shutdown(self) -> None:
         """Clean shutdown"""
         logger.info("💾 Saving world state before shutdown...")
+        self.world_state.stop_background_flush()
         self.world_state.save_to_disk()
         
         # Print final stats
@@ -410,6 +467,13 @@ class WorldSimulation:
 
 async def main():
     """Entry point"""
+    # Tasks that finish without suspending (cache hits, director/pipeline
+    # short-circuits) complete on creation instead of going through the
+    # scheduler. Set before any task is made; eager tasks need Python 3.12+.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    
     # Create logs directory
     Path("world_engine/logs").mkdir(parents=True, exist_ok=True)
     
@@ -0,0 +1,85 @@
+"""
+Per-entity edge tables (faction relations, location travel times).
+
+Neighbor IDs are kept sorted for bisect lookups and the edge values sit
+in one numpy column, so whole-table queries ("every faction we are at
+war with") are a single mask instead of a walk over a dict.
+"""
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from typing import Callable, Iterator, List, Mapping, Optional
+
+import numpy as np
+
+
+class AdjacencyTable(MutableMapping):
+    """
+    Dict-like neighbor_id -> small int map.
+
+    Args:
+        items: Initial neighbor_id -> value mapping
+        dtype: Numpy dtype of the value column
+        value_type: Applied to values on read (e.g. an IntEnum class)
+    """
+    __slots__ = ("_keys", "_values", "_value_type")
+
+    def __init__(
+        self,
+        items: Optional[Mapping[str, int]] = None,
+        dtype=np.int32,
+        value_type: Callable[[int], object] = int
+    ):
+        items = dict(items or {})
+        self._keys: List[str] = sorted(items)
+        self._values = np.array([items[k] for k in self._keys], dtype=dtype)
+        self._value_type = value_type
+
+    def _find(self, key: str) -> int:
+        """Position of key, or -1"""
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return i
+        return -1
+
+    def __getitem__(self, key: str):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._value_type(int(self._values[i]))
+
+    def __setitem__(self, key: str, value: int) -> None:
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            self._values[i] = value
+        else:
+            self._keys.insert(i, key)
+            self._values = np.insert(self._values, i, value)
+
+    def __delitem__(self, key: str) -> None:
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        del self._keys[i]
+        self._values = np.delete(self._values, i)
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"AdjacencyTable({dict(self.items())!r})"
+
+    def keys_with_value(self, value: int) -> List[str]:
+        """Neighbor IDs whose edge equals value, in sorted order"""
+        keys = self._keys
+        return [keys[i] for i in np.flatnonzero(self._values == value)]
+
+    def keys_below(self, value: int) -> List[str]:
+        """Neighbor IDs whose edge is < value (e.g. reachable within N ticks)"""
+        keys = self._keys
+        return [keys[i] for i in np.flatnonzero(self._values < value)]
@@ -1,22 +1,58 @@
 # SSE / WebSocket helpers to broadcast world updates
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Set
 
 class ChangeStream:
-    _subscribers = []
+    # Per-subscriber backlog; a slow consumer loses its oldest messages
+    # instead of growing without bound
+    max_queue_size = 1024
+
+    _subscribers: Set[asyncio.Queue] = set()
+
+    # Loop that owns the subscriber queues (set on first subscribe)
+    _loop: Optional[asyncio.AbstractEventLoop] = None
 
     @classmethod
-    async def subscribe(cls) -> AsyncGenerator[str, None]:
-        queue = asyncio.Queue()
-        cls._subscribers.append(queue)
+    async def subscribe(cls) -> AsyncGenerator[bytes, None]:
+        if cls._loop is None:
+            cls._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=cls.max_queue_size)
+        cls._subscribers.add(queue)
         try:
             while True:
-                data = await queue.get()
-                yield f"data: {data}\n\n"
-        except asyncio.CancelledError:
-            cls._subscribers.remove(queue)
+                yield await queue.get()
+        finally:
+            # Also runs when the generator is closed normally, not just cancelled
+            cls._subscribers.discard(queue)
+
+    @staticmethod
+    def _frame(message: str) -> bytes:
+        return f"data: {message}\n\n".encode()
 
     @classmethod
-    def broadcast(cls, message: str):
+    def _dispatch(cls, frame: bytes):
+        """Push a ready frame to every subscriber (loop thread only)"""
         for q in cls._subscribers:
-            q.put_nowait(message)
+            try:
+                q.put_nowait(frame)
+            except asyncio.QueueFull:
+                q.get_nowait()  # Drop oldest
+                q.put_nowait(frame)
+
+    @classmethod
+    def broadcast(cls, message: str):
+        """Broadcast from the event loop thread"""
+        # Frame and encode once, not once per subscriber
+        cls._dispatch(cls._frame(message))
+
+    @classmethod
+    def broadcast_threadsafe(cls, message: str):
+        """
+        Broadcast from any other thread (executor jobs, background workers).
+        asyncio.Queue is not thread-safe, so the queues are only touched
+        from the loop that owns them.
+        """
+        loop = cls._loop
+        if loop is None or loop.is_closed():
+            return  # Nobody has subscribed yet
+        loop.call_soon_threadsafe(cls._dispatch, cls._frame(message))
@@ -0,0 +1,47 @@
+"""
+String ID interning.
+
+Entity and artifact IDs form a closed, slowly growing set over a run.
+Mapping each to a small integer handle lets hot structures key on ints
+(identity-cheap hashes, word-sized compares) and store IDs in numpy
+columns; strings are only resolved at API boundaries.
+"""
+from typing import Dict, Iterable, List, Optional
+
+
+class IdInterner:
+    """
+    Two-way map between string IDs and dense integer handles.
+    Handles are assigned in first-seen order from 0 and never reused.
+    """
+    __slots__ = ("_fwd", "_rev")
+
+    def __init__(self):
+        self._fwd: Dict[str, int] = {}
+        self._rev: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._rev)
+
+    def __contains__(self, s: str) -> bool:
+        return s in self._fwd
+
+    def intern(self, s: str) -> int:
+        """Handle for s, assigning a new one if unseen"""
+        handle = self._fwd.get(s)
+        if handle is None:
+            handle = self._fwd[s] = len(self._rev)
+            self._rev.append(s)
+        return handle
+
+    def get(self, s: str) -> Optional[int]:
+        """Handle for s, or None if it was never interned"""
+        return self._fwd.get(s)
+
+    def string(self, handle: int) -> str:
+        return self._rev[handle]
+
+    def strings(self, handles: Iterable[int]) -> List[str]:
+        """Resolve many handles at once"""
+        rev = self._rev
+        return [rev[h] for h in handles]
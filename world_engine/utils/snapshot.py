@@ -0,0 +1,172 @@
+"""
+Binary world snapshot - memory-mapped, deserialized lazily per entity.
+
+Layout:
+    [20-byte header][record payloads ...][index]
+
+    header: magic (4s) | version (I) | index offset (Q) | index length (I)
+    index:  orjson {section: [[entity_id, offset, length, hot_fields], ...]}
+
+Each record is one entity's orjson-encoded JSON dict. `hot_fields` holds
+the few fields WorldState needs to build its indices, so startup never
+has to parse a full record.
+"""
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+MAGIC = b"WSNP"
+VERSION = 1
+_HEADER = struct.Struct("<4sIQI")
+_MISSING = object()
+
+
+def write_snapshot(
+    path: Path,
+    sections: Dict[str, List[Tuple[str, dict, dict]]]
+) -> None:
+    """
+    Write a snapshot file.
+
+    Args:
+        path: Destination file
+        sections: section name -> [(entity_id, record, hot_fields), ...]
+    """
+    payload = bytearray()
+    index: Dict[str, list] = {}
+    offset = _HEADER.size
+
+    for section, records in sections.items():
+        entries = index[section] = []
+        for entity_id, record, hot in records:
+            blob = orjson.dumps(record)
+            entries.append([entity_id, offset, len(blob), hot])
+            payload += blob
+            offset += len(blob)
+
+    index_blob = orjson.dumps(index)
+
+    # Write to a temp file and swap it in, so a live mapping of the old
+    # snapshot is never truncated underneath its reader
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, offset, len(index_blob)))
+        f.write(payload)
+        f.write(index_blob)
+    os.replace(tmp_path, path)
+
+
+class SnapshotReader:
+    """Read-only mapping of a snapshot file"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, index_offset, index_length = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a world snapshot (v{VERSION}): {path}")
+
+        self.index: Dict[str, list] = orjson.loads(
+            self._mm[index_offset:index_offset + index_length]
+        )
+
+    def read(self, offset: int, length: int) -> dict:
+        """Parse a single record straight from the mapping"""
+        return orjson.loads(memoryview(self._mm)[offset:offset + length])
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+class LazyEntityMap(MutableMapping):
+    """
+    Dict-like entity store backed by a snapshot section.
+
+    Records are turned into entities (via `factory`, e.g. a from_dict or
+    model_validate classmethod) on first access; anything assigned
+    afterwards lives in memory like a normal dict entry.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[dict], Any],
+        reader: Optional[SnapshotReader] = None,
+        section: str = ""
+    ):
+        self._factory = factory
+        self._reader = reader
+        self._loaded: Dict[str, Any] = {}
+        # entity_id -> (offset, length, hot_fields) for records not yet parsed
+        self._pending: Dict[str, tuple] = {}
+
+        if reader is not None:
+            for entity_id, offset, length, hot in reader.index.get(section, []):
+                self._pending[entity_id] = (offset, length, hot)
+
+    def __getitem__(self, entity_id: str):
+        entity = self._loaded.get(entity_id)
+        if entity is not None:
+            return entity
+
+        entry = self._pending.pop(entity_id, None)
+        if entry is None:
+            raise KeyError(entity_id)
+
+        offset, length, _ = entry
+        entity = self._factory(self._reader.read(offset, length))
+        self._loaded[entity_id] = entity
+        return entity
+
+    def __setitem__(self, entity_id: str, entity) -> None:
+        self._pending.pop(entity_id, None)
+        self._loaded[entity_id] = entity
+
+    def __delitem__(self, entity_id: str) -> None:
+        if entity_id in self._loaded:
+            del self._loaded[entity_id]
+        elif entity_id in self._pending:
+            del self._pending[entity_id]
+        else:
+            raise KeyError(entity_id)
+
+    def __contains__(self, entity_id) -> bool:
+        return entity_id in self._loaded or entity_id in self._pending
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._loaded)
+        yield from list(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._loaded) + len(self._pending)
+
+    def peek(self, entity_id: str, field: str, default: Any = _MISSING):
+        """
+        Read an index field without parsing the record.
+        Falls back to the model attribute once the entity is loaded.
+        If the snapshot predates the field, returns default (or parses
+        the record when no default is given).
+        """
+        entity = self._loaded.get(entity_id)
+        if entity is not None:
+            return getattr(entity, field)
+        hot = self._pending[entity_id][2]
+        if field in hot:
+            return hot[field]
+        if default is not _MISSING:
+            return default
+        return getattr(self[entity_id], field)
+
+    def load_all(self) -> None:
+        """Parse every pending record (e.g. before the file is replaced)"""
+        for entity_id in list(self._pending):
+            self[entity_id]